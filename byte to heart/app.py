@@ -3,16 +3,32 @@ app.py — Cardio-Lens: Democratizing Heart Health
 Multi-page Streamlit Application | Two-Tier AI System
 """
 
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 import altair as alt
 
 from backend import (
-    train_tier1_model, predict_tier1, simulate_bp_reduction,
-    train_tier2_model, predict_tier2,
+    serving_model, predict_tier1, simulate_bp_reduction, simulate_scenarios,
+    predict_tier2, model_version,
     TIER2_FEATURES
 )
+from cohort import load_cohort_index
+from compression import load_compressed
+from i18n import (LANGUAGE_NAMES, N_, SOURCE_LANGUAGE, available_languages,
+                  get_language, set_language, t)
+from instrumentation import observe, stage
+from resource_cache import StreamlitCache, cache_backend, set_cache_backend
+
+# Once per process: every rerun executes this module again
+if not isinstance(cache_backend(), StreamlitCache):
+    set_cache_backend(StreamlitCache())
+_run_started = time.perf_counter()
 
 # ─────────────────────────────────────────────
 # PAGE CONFIG
@@ -209,28 +225,280 @@ div[data-testid="stForm"] { background: transparent; }
 
 
 # ─────────────────────────────────────────────
-# LOAD MODELS (cached)
+# LOAD MODELS (background, cached)
 # ─────────────────────────────────────────────
-@st.cache_resource
-def get_models():
-    m1, acc1 = train_tier1_model()
-    m2, acc2 = train_tier2_model()
-    return m1, acc1, m2, acc2
+def load_tier1():
+    # Packed node arrays, memory-mapped read-only: far less per-call overhead
+    # than sklearn, and every replica shares the same pages. Tier 1 uses the
+    # compressed forest, packed the same way, if one was built for this
+    # exact model version (python compression.py), or the fitted estimator
+    # when a non-forest backend is configured (CARDIO_LENS_TIER1_BACKEND).
+    model1, acc1 = serving_model(1)
+    model1, acc1 = load_compressed(model1) or (model1, acc1)
+    # Score the cohort for a new model version here, off the request path;
+    # results pages then only map the finished index
+    load_cohort_index(model1)
+    return model1, acc1
+
+
+MODEL_LOADERS = {1: load_tier1, 2: lambda: serving_model(2)}
+
+# Seconds a failed load is shown before it is attempted again
+LOAD_RETRY_S = 15
+
+
+class ModelLoaders:
+    """
+    Background model loads, one per tier, on a small thread pool. Pages
+    render while the models load: Tier 2 (918 rows) is ready almost at once,
+    while a cold Tier 1 start trains on 70k rows. A failed load (disk,
+    artifact, memory) is submitted again once LOAD_RETRY_S has passed.
+    """
+
+    def __init__(self):
+        self._pool = ThreadPoolExecutor(max_workers=len(MODEL_LOADERS),
+                                        thread_name_prefix="model-load")
+        self._lock = threading.Lock()
+        self._retry_at = {}
+        self._futures = {tier: self._pool.submit(load) for tier, load in MODEL_LOADERS.items()}
+
+    def future(self, tier: int):
+        """The tier's current load, resubmitted if it failed long enough ago."""
+        with self._lock:
+            future = self._futures[tier]
+            if future.done() and future.exception() is not None:
+                now = time.monotonic()
+                retry_at = self._retry_at.setdefault(tier, now + LOAD_RETRY_S)
+                if now >= retry_at:
+                    del self._retry_at[tier]
+                    future = self._futures[tier] = self._pool.submit(MODEL_LOADERS[tier])
+            return future
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# One per process; shut down if Streamlit ever releases it (cache clear)
+@st.cache_resource(on_release=ModelLoaders.shutdown)
+def model_loaders() -> ModelLoaders:
+    return ModelLoaders()
+
+
+def model_state(tier: int) -> str:
+    future = model_loaders().future(tier)
+    if not future.done():
+        return "loading"
+    return "failed" if future.exception() is not None else "ready"
+
+
+def loaded_model(tier: int):
+    """(model, accuracy) if the tier has finished loading, else (None, None)."""
+    future = model_loaders().future(tier)
+    if not future.done() or future.exception() is not None:
+        return None, None
+    return future.result()
 
-model1, acc1, model2, acc2 = get_models()
+
+model1, acc1 = loaded_model(1)
+model2, acc2 = loaded_model(2)
+# What this run rendered; the sidebar status fragment reruns the app when it changes
+st.session_state["model_states"] = (model_state(1), model_state(2))
+
+
+def fmt_acc(acc, spec: str) -> str:
+    return format(acc, spec) if acc is not None else "…"
+
+
+@st.cache_resource(show_spinner="🫀 Indexing the screening cohort…")
+def get_cohort(_model, version):
+    # Built by load_tier1, so this just memory-maps it (it only rebuilds if
+    # the index went missing); the leading underscore keeps Streamlit from
+    # hashing the model itself.
+    return load_cohort_index(_model)
+
+
+# ─────────────────────────────────────────────
+# INTERACTIVE FRAGMENTS
+# ─────────────────────────────────────────────
+def rerun_fragment(name: str, run_every=None):
+    """
+    st.fragment whose every run is timed as stage "rerun.<name>". A
+    fragment rerun skips the sidebar, so it re-selects the session's
+    language itself. `run_every` is passed on to st.fragment.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def run(*args, **kwargs):
+            set_language(st.session_state.get("language", SOURCE_LANGUAGE))
+            with stage(f"rerun.{name}"):
+                return fn(*args, **kwargs)
+        return st.fragment(run, run_every=run_every)
+    return decorator
+
+
+# Trajectories shared across sessions, keyed by model version and inputs;
+# a fragment rerun with inputs seen before does not touch the model.
+@st.cache_data(max_entries=512, show_spinner=False)
+def twin_trajectory(_model, version, base: dict, scenarios: dict, years: int) -> pd.DataFrame:
+    return simulate_scenarios(_model, base, scenarios, years=years)
+
+
+# Building an Altair chart and serialising it (schema validation included)
+# costs ~80 ms, nearly all of a fragment rerun. The BP chart changes with
+# every slider value, so its Vega-Lite spec is written out directly; the
+# trajectory chart only changes with a new result, so its spec is cached.
+AXIS_STYLE = dict(labelColor="#94a3b8", titleColor="#94a3b8",
+                  gridColor="rgba(255,255,255,0.05)")
+CHART_CONFIG = {
+    "view": {"fill": "transparent", "strokeWidth": 0},
+    "axis": {"domainColor": "rgba(255,255,255,0.1)", "tickColor": "rgba(255,255,255,0.1)"},
+}
+
+
+def chart_title(text: str) -> dict:
+    return {"text": text, "color": "#e2e8f0", "fontSize": 14, "fontWeight": "bold"}
+
+
+def bp_chart_spec(sim_df: pd.DataFrame, target_bp: int, current_ap_hi: int,
+                  target_r: float, current_r: float) -> dict:
+    """Vega-Lite spec of the BP simulator chart: area + line + target/current points."""
+    x = {"field": "Systolic BP", "type": "quantitative"}
+    y = {"field": "Risk (%)", "type": "quantitative"}
+    risk = sim_df["Risk (%)"]
+
+    def point(bp, r, color):
+        return {"data": {"values": [{"Systolic BP": bp, "Risk (%)": r}]},
+                "mark": {"type": "point", "color": color, "size": 120, "filled": True},
+                "encoding": {"x": x, "y": y}}
+
+    return {
+        "data": {"values": sim_df.to_dict(orient="records")},
+        "layer": [
+            {"mark": {"type": "area", "interpolate": "monotone", "color": {
+                "gradient": "linear", "x1": 1, "x2": 1, "y1": 1, "y2": 0,
+                "stops": [{"color": "rgba(129,140,248,0.4)", "offset": 0},
+                          {"color": "rgba(129,140,248,0.0)", "offset": 1}]}},
+             "encoding": {"x": x, "y": y}},
+            {"mark": {"type": "line", "color": "#818cf8", "strokeWidth": 3,
+                      "interpolate": "monotone"},
+             "encoding": {
+                 "x": {**x, "scale": {"domain": [target_bp, current_ap_hi]},
+                       "axis": {"title": t("Systolic Blood Pressure (mmHg)"), **AXIS_STYLE}},
+                 "y": {**y, "scale": {"domain": [max(0, risk.min() - 5), min(100, risk.max() + 5)]},
+                       "axis": {"title": t("Cardiovascular Risk (%)"), **AXIS_STYLE}},
+                 "tooltip": [x, {**y, "format": ".1f"}],
+             }},
+            point(target_bp, target_r, "#34d399"),
+            point(current_ap_hi, current_r, "#f87171"),
+        ],
+        "height": 260,
+        "background": "transparent",
+        "title": chart_title(t("Risk Reduction Simulation")),
+        "config": CHART_CONFIG,
+    }
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def twin_chart_spec(traj_df: pd.DataFrame, scen: list, horizon: int, language: str) -> dict:
+    """
+    Vega-Lite spec of the Health Twin trajectory chart, built once per result
+    and display language (`language` keys the cache; t() reads it).
+    """
+    traj_long = traj_df.melt(
+        id_vars=["Year", "Age"],
+        value_vars=scen,
+        var_name="Scenario",
+        value_name="Risk (%)"
+    )
+    traj_long["Scenario"] = traj_long["Scenario"].map(t)
+
+    color_scale = alt.Scale(
+        domain=[t(name) for name in scen],
+        range=["#f87171", "#34d399", "#818cf8", "#fbbf24", "#38bdf8", "#c084fc", "#f472b6"][:len(scen)]
+    )
+
+    traj_line = alt.Chart(traj_long).mark_line(
+        strokeWidth=3, interpolate="monotone"
+    ).encode(
+        x=alt.X("Age:Q",
+                axis=alt.Axis(title=t("Age (years)"), **AXIS_STYLE,
+                              tickCount=min(horizon + 1, 16))),
+        y=alt.Y("Risk (%):Q",
+                scale=alt.Scale(domain=[max(0, traj_long["Risk (%)"].min() - 5),
+                                        min(100, traj_long["Risk (%)"].max() + 5)]),
+                axis=alt.Axis(title=t("Cardiovascular Risk (%)"), **AXIS_STYLE)),
+        color=alt.Color("Scenario:N", scale=color_scale, title=t("Scenario"),
+                        legend=alt.Legend(orient="top-right", labelColor="#e2e8f0",
+                                          titleColor="#94a3b8", labelFontSize=12)),
+        tooltip=["Year:N", "Scenario:N", alt.Tooltip("Risk (%):Q", format=".1f")]
+    )
+
+    traj_area = alt.Chart(traj_long).mark_area(
+        opacity=0.15, interpolate="monotone"
+    ).encode(
+        x="Age:Q",
+        y="Risk (%):Q",
+        color=alt.Color("Scenario:N", scale=color_scale, legend=None)
+    )
+
+    traj_points = alt.Chart(traj_long).mark_point(
+        filled=True, size=60
+    ).encode(
+        x="Age:Q",
+        y="Risk (%):Q",
+        color=alt.Color("Scenario:N", scale=color_scale, legend=None),
+        tooltip=["Year:N", "Scenario:N", alt.Tooltip("Risk (%):Q", format=".1f")]
+    )
+
+    traj_chart = (traj_area + traj_line + traj_points).properties(
+        height=300,
+        background="transparent",
+        title=alt.TitleParams(
+            t("{years}-Year Cardiovascular Risk Projection").format(years=horizon),
+            color="#e2e8f0", fontSize=14, fontWeight="bold"
+        )
+    ).configure_view(
+        strokeWidth=0, fill="transparent"
+    ).configure_axis(
+        domainColor="rgba(255,255,255,0.1)",
+        tickColor="rgba(255,255,255,0.1)"
+    )
+    return traj_chart.to_dict()
 
 
 # ─────────────────────────────────────────────
 # SIDEBAR NAVIGATION
 # ─────────────────────────────────────────────
+# Widgets whose options are shown through t(). Streamlit remembers them by
+# their displayed label, so a language switch re-pins each selection to its
+# underlying value before the labels change.
+TRANSLATED_OPTION_KEYS = [
+    "page", "t1_gender", "t1_chol", "t1_gluc",
+    "t2_sex", "t2_fbs", "t2_cpt", "t2_ecg", "t2_ea", "t2_slope",
+    "ht_gender", "ht_chol", "ht_gluc", "goal_chol",
+]
+
+
+def keep_selections():
+    for key in TRANSLATED_OPTION_KEYS:
+        if key in st.session_state:
+            st.session_state[key] = st.session_state[key]
+
+
 with st.sidebar:
-    st.markdown("""
+    # Only the chosen language's prebuilt bundle is read (python build_locales.py)
+    language = st.selectbox("🌐 Language", available_languages(),
+                            format_func=lambda code: LANGUAGE_NAMES.get(code, code),
+                            key="language", on_change=keep_selections)
+    set_language(language)
+
+    st.markdown(f"""
     <div style='text-align:center; padding: 20px 0 10px;'>
         <div style='font-size:3rem;'>🫀</div>
         <div style='font-size:1.3rem; font-weight:800; background:linear-gradient(135deg,#818cf8,#c084fc);
                     -webkit-background-clip:text; -webkit-text-fill-color:transparent;
                     background-clip:text;'>Cardio-Lens</div>
-        <div style='font-size:0.75rem; color:#64748b; margin-top:4px;'>Two-Tier AI Heart Health</div>
+        <div style='font-size:0.75rem; color:#64748b; margin-top:4px;'>{t("Two-Tier AI Heart Health")}</div>
     </div>
     <hr style='border-color:rgba(99,102,241,0.2); margin:16px 0;'>
     """, unsafe_allow_html=True)
@@ -238,22 +506,59 @@ with st.sidebar:
     page = st.radio(
         "Navigate",
         ["🏠  The Pitch", "📡  Tier 1: Screening", "🔬  Tier 2: Diagnosis", "🧬  Health Twin"],
+        format_func=t,
+        key="page",
         label_visibility="collapsed"
     )
 
     st.markdown("<hr style='border-color:rgba(99,102,241,0.2); margin:16px 0;'>", unsafe_allow_html=True)
-    st.markdown(f"""
-    <div style='font-size:0.78rem; color:#475569; padding:0 4px;'>
-        <div style='margin-bottom:8px;'>
-            <span style='color:#38bdf8; font-weight:600;'>Tier 1 Accuracy</span><br>
-            <span style='font-size:1.1rem; font-weight:700; color:#e2e8f0;'>{acc1:.1%}</span>
-        </div>
-        <div>
-            <span style='color:#a78bfa; font-weight:600;'>Tier 2 Accuracy</span><br>
-            <span style='font-size:1.1rem; font-weight:700; color:#e2e8f0;'>{acc2:.1%}</span>
+
+    # Polls once a second while a model is loading or waiting to retry, and
+    # reruns the whole app as soon as a state changes so pages follow it.
+    pending = any(state != "ready" for state in st.session_state["model_states"])
+
+    @rerun_fragment("model_status", run_every=1.0 if pending else None)
+    def model_status():
+        states = (model_state(1), model_state(2))
+        if states != st.session_state["model_states"]:
+            st.rerun()
+        accuracies = [loaded_model(1)[1], loaded_model(2)[1]]
+        labels = {"loading": "⏳ " + t("Loading…"), "failed": "⚠️ " + t("Failed to load")}
+        shown = [labels.get(state) or fmt_acc(acc, ".1%")
+                 for state, acc in zip(states, accuracies)]
+        st.markdown(f"""
+        <div style='font-size:0.78rem; color:#475569; padding:0 4px;'>
+            <div style='margin-bottom:8px;'>
+                <span style='color:#38bdf8; font-weight:600;'>{t("Tier 1 Accuracy")}</span><br>
+                <span style='font-size:1.1rem; font-weight:700; color:#e2e8f0;'>{shown[0]}</span>
+            </div>
+            <div>
+                <span style='color:#a78bfa; font-weight:600;'>{t("Tier 2 Accuracy")}</span><br>
+                <span style='font-size:1.1rem; font-weight:700; color:#e2e8f0;'>{shown[1]}</span>
+            </div>
         </div>
-    </div>
-    """, unsafe_allow_html=True)
+        """, unsafe_allow_html=True)
+
+    model_status()
+
+
+MODEL_NAMES = {1: N_("Tier 1 screening model"), 2: N_("Tier 2 clinical model")}
+
+
+def model_failure_notice(tier: int):
+    """Error notice for a tier whose load failed; says a retry is on its way."""
+    st.error("⚠️ " + t("The {model} failed to load: {error}. Retrying automatically…").format(
+        model=t(MODEL_NAMES[tier]), error=model_loaders().future(tier).exception()))
+
+
+def tier1_notice():
+    """Loading / failure notice for pages that need the Tier 1 model."""
+    state = model_state(1)
+    if state == "loading":
+        st.info("⏳ " + t("The Tier 1 screening model is still loading. "
+                         "You can fill in the form now; scoring unlocks automatically when it is ready."))
+    elif state == "failed":
+        model_failure_notice(1)
 
 
 # ═══════════════════════════════════════════════════════════
@@ -261,11 +566,11 @@ with st.sidebar:
 # ═══════════════════════════════════════════════════════════
 if page == "🏠  The Pitch":
 
-    st.markdown("""
+    st.markdown(f"""
     <div style='text-align:center; padding: 48px 0 32px;'>
         <div style='font-size:1rem; color:#6366f1; font-weight:600; letter-spacing:0.15em;
                     text-transform:uppercase; margin-bottom:16px;'>
-            🏆 Hackathon Project 2026
+            🏆 {t("Hackathon Project 2026")}
         </div>
         <h1 style='font-size:3.5rem; font-weight:900; line-height:1.1; margin:0;
                    background:linear-gradient(135deg,#818cf8 0%,#c084fc 50%,#f472b6 100%);
@@ -274,7 +579,7 @@ if page == "🏠  The Pitch":
             Cardio-Lens
         </h1>
         <p style='font-size:1.4rem; color:#94a3b8; margin-top:12px; font-weight:400;'>
-            Democratizing Heart Health with a Two-Tier AI System
+            {t("Democratizing Heart Health with a Two-Tier AI System")}
         </p>
     </div>
     """, unsafe_allow_html=True)
@@ -282,28 +587,28 @@ if page == "🏠  The Pitch":
     # Stats row
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.markdown("""
+        st.markdown(f"""
         <div class='metric-card'>
             <div class='value'>70K</div>
-            <div class='label'>Training Records</div>
+            <div class='label'>{t("Training Records")}</div>
         </div>""", unsafe_allow_html=True)
     with col2:
         st.markdown(f"""
         <div class='metric-card'>
-            <div class='value'>{acc1:.0%}</div>
-            <div class='label'>Tier 1 Accuracy</div>
+            <div class='value'>{fmt_acc(acc1, ".0%")}</div>
+            <div class='label'>{t("Tier 1 Accuracy")}</div>
         </div>""", unsafe_allow_html=True)
     with col3:
         st.markdown(f"""
         <div class='metric-card'>
-            <div class='value'>{acc2:.0%}</div>
-            <div class='label'>Tier 2 Accuracy</div>
+            <div class='value'>{fmt_acc(acc2, ".0%")}</div>
+            <div class='label'>{t("Tier 2 Accuracy")}</div>
         </div>""", unsafe_allow_html=True)
     with col4:
-        st.markdown("""
+        st.markdown(f"""
         <div class='metric-card'>
             <div class='value'>2</div>
-            <div class='label'>AI Models</div>
+            <div class='label'>{t("AI Models")}</div>
         </div>""", unsafe_allow_html=True)
 
     st.markdown("<br>", unsafe_allow_html=True)
@@ -311,53 +616,52 @@ if page == "🏠  The Pitch":
     # Two-tier explanation
     col_l, col_r = st.columns(2, gap="large")
     with col_l:
-        st.markdown("""
+        st.markdown(f"""
         <div class='tier-card tier-card-1'>
-            <div class='tier-badge badge-1'>📡 Tier 1 · Mass Screening</div>
-            <h3 style='color:#38bdf8;'>The "Watch" Model</h3>
-            <p>Designed for <strong style='color:#e2e8f0;'>wearables & home devices</strong>.
-            Uses 12 basic biometric signals — no lab tests required. Screens 70,000+ population
-            records to flag at-risk individuals <em>before</em> symptoms appear.</p>
+            <div class='tier-badge badge-1'>📡 {t("Tier 1 · Mass Screening")}</div>
+            <h3 style='color:#38bdf8;'>{t('The "Watch" Model')}</h3>
+            <p>{t("Designed for wearables & home devices. Uses 12 basic biometric signals — "
+                  "no lab tests required. Screens 70,000+ population records to flag at-risk "
+                  "individuals before symptoms appear.")}</p>
             <br>
             <div style='display:flex; gap:12px; flex-wrap:wrap;'>
                 <span style='background:rgba(56,189,248,0.1); border:1px solid rgba(56,189,248,0.3);
                              border-radius:8px; padding:6px 12px; font-size:0.8rem; color:#7dd3fc;'>
-                    ⚡ Instant Results
+                    ⚡ {t("Instant Results")}
                 </span>
                 <span style='background:rgba(56,189,248,0.1); border:1px solid rgba(56,189,248,0.3);
                              border-radius:8px; padding:6px 12px; font-size:0.8rem; color:#7dd3fc;'>
-                    🏠 Home-Ready
+                    🏠 {t("Home-Ready")}
                 </span>
                 <span style='background:rgba(56,189,248,0.1); border:1px solid rgba(56,189,248,0.3);
                              border-radius:8px; padding:6px 12px; font-size:0.8rem; color:#7dd3fc;'>
-                    📊 BP Simulator
+                    📊 {t("BP Simulator")}
                 </span>
             </div>
         </div>
         """, unsafe_allow_html=True)
 
     with col_r:
-        st.markdown("""
+        st.markdown(f"""
         <div class='tier-card tier-card-2'>
-            <div class='tier-badge badge-2'>🔬 Tier 2 · Clinical Precision</div>
-            <h3 style='color:#a78bfa;'>The "Clinical" Model</h3>
-            <p>Built for <strong style='color:#e2e8f0;'>doctors & hospitals</strong>.
-            Trained on 918 clinical records with ECG readings, ST-slope analysis, and
-            chest pain classification. Delivers high-precision diagnosis with full
-            <em>explainability</em>.</p>
+            <div class='tier-badge badge-2'>🔬 {t("Tier 2 · Clinical Precision")}</div>
+            <h3 style='color:#a78bfa;'>{t('The "Clinical" Model')}</h3>
+            <p>{t("Built for doctors & hospitals. Trained on 918 clinical records with ECG "
+                  "readings, ST-slope analysis, and chest pain classification. Delivers "
+                  "high-precision diagnosis with full explainability.")}</p>
             <br>
             <div style='display:flex; gap:12px; flex-wrap:wrap;'>
                 <span style='background:rgba(167,139,250,0.1); border:1px solid rgba(167,139,250,0.3);
                              border-radius:8px; padding:6px 12px; font-size:0.8rem; color:#c4b5fd;'>
-                    🧠 XAI Ready
+                    🧠 {t("XAI Ready")}
                 </span>
                 <span style='background:rgba(167,139,250,0.1); border:1px solid rgba(167,139,250,0.3);
                              border-radius:8px; padding:6px 12px; font-size:0.8rem; color:#c4b5fd;'>
-                    📋 Clinical Grade
+                    📋 {t("Clinical Grade")}
                 </span>
                 <span style='background:rgba(167,139,250,0.1); border:1px solid rgba(167,139,250,0.3);
                              border-radius:8px; padding:6px 12px; font-size:0.8rem; color:#c4b5fd;'>
-                    📈 Feature Importance
+                    📈 {t("Feature Importance")}
                 </span>
             </div>
         </div>
@@ -366,20 +670,20 @@ if page == "🏠  The Pitch":
     st.markdown("<br>", unsafe_allow_html=True)
 
     # Pipeline flow
-    st.markdown("""
+    st.markdown(f"""
     <div style='text-align:center; margin:32px 0 16px;'>
-        <div class='section-header'>The AI Pipeline</div>
-        <div class='section-sub'>From wearable to clinical — a seamless escalation path</div>
+        <div class='section-header'>{t("The AI Pipeline")}</div>
+        <div class='section-sub'>{t("From wearable to clinical — a seamless escalation path")}</div>
     </div>
     """, unsafe_allow_html=True)
 
     flow_cols = st.columns(5)
     steps = [
-        ("📱", "Wearable\nDevice", "#38bdf8"),
+        ("📱", t("Wearable\nDevice"), "#38bdf8"),
         ("→", "", "#475569"),
-        ("📡", "Tier 1\nScreening", "#818cf8"),
+        ("📡", t("Tier 1\nScreening"), "#818cf8"),
         ("→", "", "#475569"),
-        ("🔬", "Tier 2\nDiagnosis", "#a78bfa"),
+        ("🔬", t("Tier 2\nDiagnosis"), "#a78bfa"),
     ]
     for col, (icon, label, color) in zip(flow_cols, steps):
         with col:
@@ -397,9 +701,9 @@ if page == "🏠  The Pitch":
                 </div>""", unsafe_allow_html=True)
 
     st.markdown("<br><br>", unsafe_allow_html=True)
-    st.markdown("""
+    st.markdown(f"""
     <div style='text-align:center; color:#475569; font-size:0.85rem;'>
-        ⚠️ <em>For educational & research purposes only. Not a substitute for professional medical advice.</em>
+        ⚠️ <em>{t("For educational & research purposes only. Not a substitute for professional medical advice.")}</em>
     </div>
     """, unsafe_allow_html=True)
 
@@ -409,28 +713,101 @@ if page == "🏠  The Pitch":
 # ═══════════════════════════════════════════════════════════
 elif page == "📡  Tier 1: Screening":
 
-    st.markdown("""
+    st.markdown(f"""
     <div style='padding: 24px 0 8px;'>
-        <div class='tier-badge badge-1' style='display:inline-block;'>📡 Tier 1 · Mass Screening</div>
-        <div class='section-header'>Population Screening</div>
-        <div class='section-sub'>Enter your biometric data to get an instant cardiovascular risk score</div>
+        <div class='tier-badge badge-1' style='display:inline-block;'>📡 {t("Tier 1 · Mass Screening")}</div>
+        <div class='section-header'>{t("Population Screening")}</div>
+        <div class='section-sub'>{t("Enter your biometric data to get an instant cardiovascular risk score")}</div>
     </div>
     """, unsafe_allow_html=True)
+    tier1_notice()
+
+    @rerun_fragment("bp_simulator")
+    def bp_simulator(inp: dict):
+        # Moving the target slider reruns only this block, not the page
+        st.markdown("<br>", unsafe_allow_html=True)
+        st.markdown(f"""
+        <div style='margin-bottom:8px;'>
+            <span style='font-size:1.1rem; font-weight:700; color:#818cf8;'>
+                💡 {t("Actionable Insights Simulator")}
+            </span><br>
+            <span style='font-size:0.85rem; color:#64748b;'>
+                {t("Drag the slider to see how lowering your blood pressure reduces your risk")}
+            </span>
+        </div>
+        """, unsafe_allow_html=True)
+
+        current_ap_hi = inp["ap_hi"]
+        min_bp = max(90, current_ap_hi - 50)
+
+        target_bp = st.slider(
+            "🎯 " + t("Target Systolic BP (mmHg)"),
+            min_value=min_bp,
+            max_value=current_ap_hi,
+            value=min_bp,
+            step=1,
+            help=t("Slide left to simulate the effect of lowering your blood pressure"),
+            key="t1_target_bp",
+        )
+
+        # Slice of the patient's cached BP response curve: no model call per move
+        sim_df = simulate_bp_reduction(
+            model1,
+            inp["age"], inp["gender_val"], inp["height"], inp["weight"],
+            current_ap_hi, inp["ap_lo"],
+            inp["chol_val"], inp["gluc_val"],
+            inp["smoke"], inp["alco"], inp["active"],
+            target_bp=target_bp
+        )
+
+        # Highlight current vs target
+        current_risk_row = sim_df[sim_df["Systolic BP"] == current_ap_hi]
+        target_risk_row  = sim_df[sim_df["Systolic BP"] == target_bp]
+
+        if not current_risk_row.empty and not target_risk_row.empty:
+            current_r = current_risk_row["Risk (%)"].values[0]
+            target_r  = target_risk_row["Risk (%)"].values[0]
+            reduction  = current_r - target_r
+
+            with stage("chart.bp_simulator"):
+                st.vega_lite_chart(
+                    bp_chart_spec(sim_df, target_bp, current_ap_hi, target_r, current_r),
+                    use_container_width=True)
+
+            if reduction > 0:
+                st.markdown(f"""
+                <div class='insight-box'>
+                    <p>🎯 {t("By lowering your systolic BP from {current} to {target} mmHg, "
+                             "your estimated risk drops by {points} percentage points "
+                             "({before} → {after}).").format(
+                        current=f"<strong>{current_ap_hi}</strong>",
+                        target=f"<strong>{target_bp}</strong>",
+                        points=f"<strong>{reduction:.1f}</strong>",
+                        before=f"{current_r:.1f}%", after=f"{target_r:.1f}%")}</p>
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.markdown(f"""
+                <div class='insight-box'>
+                    <p>✅ {t("Your current blood pressure is already at the target level.")}</p>
+                </div>
+                """, unsafe_allow_html=True)
 
     col_inputs, col_results = st.columns([1, 1.2], gap="large")
 
     with col_inputs:
-        st.markdown("#### 📋 Your Biometrics")
+        st.markdown("#### 📋 " + t("Your Biometrics"))
 
-        age = st.number_input("Age (years)", min_value=18, max_value=100, value=45, step=1)
-        gender = st.radio("Gender", ["Female", "Male"], horizontal=True)
+        age = st.number_input(t("Age (years)"), min_value=18, max_value=100, value=45, step=1, key="t1_age")
+        gender = st.radio(t("Gender"), ["Female", "Male"], format_func=t, horizontal=True,
+                          key="t1_gender")
         gender_val = 2 if gender == "Male" else 1
 
         c1, c2 = st.columns(2)
         with c1:
-            height = st.number_input("Height (cm)", min_value=100, max_value=220, value=170, step=1)
+            height = st.number_input(t("Height (cm)"), min_value=100, max_value=220, value=170, step=1, key="t1_height")
         with c2:
-            weight = st.number_input("Weight (kg)", min_value=30.0, max_value=200.0, value=75.0, step=0.5)
+            weight = st.number_input(t("Weight (kg)"), min_value=30.0, max_value=200.0, value=75.0, step=0.5, key="t1_weight")
 
         bmi_display = weight / ((height / 100) ** 2)
         bmi_color = "#34d399" if bmi_display < 25 else ("#fbbf24" if bmi_display < 30 else "#f87171")
@@ -439,29 +816,35 @@ elif page == "📡  Tier 1: Screening":
 
         c3, c4 = st.columns(2)
         with c3:
-            ap_hi = st.number_input("Systolic BP (mmHg)", min_value=90, max_value=200, value=130, step=1)
+            ap_hi = st.number_input(t("Systolic BP (mmHg)"), min_value=90, max_value=200, value=130, step=1, key="t1_ap_hi")
         with c4:
-            ap_lo = st.number_input("Diastolic BP (mmHg)", min_value=50, max_value=140, value=85, step=1)
+            ap_lo = st.number_input(t("Diastolic BP (mmHg)"), min_value=50, max_value=140, value=85, step=1, key="t1_ap_lo")
 
-        cholesterol = st.selectbox("Cholesterol Level", ["Normal", "Above Normal", "Well Above Normal"])
+        cholesterol = st.selectbox(t("Cholesterol Level"), ["Normal", "Above Normal", "Well Above Normal"],
+                                   format_func=t, key="t1_chol")
         chol_val = {"Normal": 1, "Above Normal": 2, "Well Above Normal": 3}[cholesterol]
 
-        gluc = st.selectbox("Glucose Level", ["Normal", "Above Normal", "Well Above Normal"])
+        gluc = st.selectbox(t("Glucose Level"), ["Normal", "Above Normal", "Well Above Normal"],
+                            format_func=t, key="t1_gluc")
         gluc_val = {"Normal": 1, "Above Normal": 2, "Well Above Normal": 3}[gluc]
 
         c5, c6, c7 = st.columns(3)
         with c5:
-            smoke = st.checkbox("🚬 Smoker")
+            smoke = st.checkbox("🚬 " + t("Smoker"), key="t1_smoke")
         with c6:
-            alco = st.checkbox("🍺 Alcohol")
+            alco = st.checkbox("🍺 " + t("Alcohol"), key="t1_alco")
         with c7:
-            active = st.checkbox("🏃 Active", value=True)
+            active = st.checkbox("🏃 " + t("Active"), value=True, key="t1_active")
 
-        predict_btn = st.button("🫀 Calculate Risk Score", use_container_width=True)
+        predict_btn = st.button("🫀 " + t("Calculate Risk Score"), use_container_width=True,
+                                disabled=model1 is None)
 
     with col_results:
-        if predict_btn or "tier1_result" in st.session_state:
-            if predict_btn:
+        # A stored result outlives the model that scored it (cache cleared,
+        # failed reload): model-backed sections below check model1 again.
+        scored = predict_btn and model1 is not None
+        if scored or "tier1_result" in st.session_state:
+            if scored:
                 risk = predict_tier1(
                     model1, age, gender_val, height, weight,
                     ap_hi, ap_lo, chol_val, gluc_val,
@@ -479,152 +862,52 @@ elif page == "📡  Tier 1: Screening":
             risk_pct = risk * 100
 
             if risk_pct < 30:
-                risk_class, risk_label, risk_emoji = "risk-low", "LOW RISK", "✅"
+                risk_class, risk_label, risk_emoji = "risk-low", t("LOW RISK"), "✅"
             elif risk_pct < 60:
-                risk_class, risk_label, risk_emoji = "risk-medium", "MODERATE RISK", "⚠️"
+                risk_class, risk_label, risk_emoji = "risk-medium", t("MODERATE RISK"), "⚠️"
             else:
-                risk_class, risk_label, risk_emoji = "risk-high", "HIGH RISK", "🚨"
+                risk_class, risk_label, risk_emoji = "risk-high", t("HIGH RISK"), "🚨"
 
             st.markdown(f"""
             <div class='risk-container'>
-                <div class='risk-label'>Cardiovascular Risk Score</div>
+                <div class='risk-label'>{t("Cardiovascular Risk Score")}</div>
                 <div class='risk-value {risk_class}'>{risk_pct:.1f}%</div>
                 <div style='font-size:1.2rem; font-weight:700; margin-bottom:8px;'>{risk_emoji} {risk_label}</div>
-                <div style='font-size:0.85rem; color:#64748b;'>Based on your biometric profile</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-            # ── ACTIONABLE INSIGHTS SIMULATOR ──
-            st.markdown("<br>", unsafe_allow_html=True)
-            st.markdown("""
-            <div style='margin-bottom:8px;'>
-                <span style='font-size:1.1rem; font-weight:700; color:#818cf8;'>
-                    💡 Actionable Insights Simulator
-                </span><br>
-                <span style='font-size:0.85rem; color:#64748b;'>
-                    Drag the slider to see how lowering your blood pressure reduces your risk
-                </span>
+                <div style='font-size:0.85rem; color:#64748b;'>{t("Based on your biometric profile")}</div>
             </div>
             """, unsafe_allow_html=True)
 
-            current_ap_hi = inp["ap_hi"]
-            min_bp = max(90, current_ap_hi - 50)
-
-            target_bp = st.slider(
-                "🎯 Target Systolic BP (mmHg)",
-                min_value=min_bp,
-                max_value=current_ap_hi,
-                value=min_bp,
-                step=1,
-                help="Slide left to simulate the effect of lowering your blood pressure"
-            )
-
-            # Simulate risk across BP range
-            sim_df = simulate_bp_reduction(
-                model1,
-                inp["age"], inp["gender_val"], inp["height"], inp["weight"],
-                current_ap_hi, inp["ap_lo"],
-                inp["chol_val"], inp["gluc_val"],
-                inp["smoke"], inp["alco"], inp["active"],
-                target_bp=target_bp
-            )
-
-            # Highlight current vs target
-            current_risk_row = sim_df[sim_df["Systolic BP"] == current_ap_hi]
-            target_risk_row  = sim_df[sim_df["Systolic BP"] == target_bp]
-
-            if not current_risk_row.empty and not target_risk_row.empty:
-                current_r = current_risk_row["Risk (%)"].values[0]
-                target_r  = target_risk_row["Risk (%)"].values[0]
-                reduction  = current_r - target_r
-
-                # Altair chart
-                line = alt.Chart(sim_df).mark_line(
-                    color="#818cf8", strokeWidth=3, interpolate="monotone"
-                ).encode(
-                    x=alt.X("Systolic BP:Q",
-                            scale=alt.Scale(domain=[target_bp, current_ap_hi]),
-                            axis=alt.Axis(title="Systolic Blood Pressure (mmHg)",
-                                          labelColor="#94a3b8", titleColor="#94a3b8",
-                                          gridColor="rgba(255,255,255,0.05)")),
-                    y=alt.Y("Risk (%):Q",
-                            scale=alt.Scale(domain=[max(0, sim_df["Risk (%)"].min() - 5),
-                                                     min(100, sim_df["Risk (%)"].max() + 5)]),
-                            axis=alt.Axis(title="Cardiovascular Risk (%)",
-                                          labelColor="#94a3b8", titleColor="#94a3b8",
-                                          gridColor="rgba(255,255,255,0.05)")),
-                    tooltip=["Systolic BP:Q", alt.Tooltip("Risk (%):Q", format=".1f")]
-                )
-
-                area = alt.Chart(sim_df).mark_area(
-                    color=alt.Gradient(
-                        gradient="linear",
-                        stops=[
-                            alt.GradientStop(color="rgba(129,140,248,0.4)", offset=0),
-                            alt.GradientStop(color="rgba(129,140,248,0.0)", offset=1),
-                        ],
-                        x1=1, x2=1, y1=1, y2=0
-                    ),
-                    interpolate="monotone"
-                ).encode(
-                    x="Systolic BP:Q",
-                    y="Risk (%):Q"
-                )
-
-                # Target point
-                target_point_df = pd.DataFrame([{"Systolic BP": target_bp, "Risk (%)": target_r}])
-                target_point = alt.Chart(target_point_df).mark_point(
-                    color="#34d399", size=120, filled=True
-                ).encode(x="Systolic BP:Q", y="Risk (%):Q")
-
-                # Current point
-                current_point_df = pd.DataFrame([{"Systolic BP": current_ap_hi, "Risk (%)": current_r}])
-                current_point = alt.Chart(current_point_df).mark_point(
-                    color="#f87171", size=120, filled=True
-                ).encode(x="Systolic BP:Q", y="Risk (%):Q")
-
-                chart = (area + line + target_point + current_point).properties(
-                    height=260,
-                    background="transparent",
-                    title=alt.TitleParams(
-                        "Risk Reduction Simulation",
-                        color="#e2e8f0", fontSize=14, fontWeight="bold"
-                    )
-                ).configure_view(
-                    strokeWidth=0,
-                    fill="transparent"
-                ).configure_axis(
-                    domainColor="rgba(255,255,255,0.1)",
-                    tickColor="rgba(255,255,255,0.1)"
-                )
+            if model1 is None:
+                tier1_notice()
+            else:
+                # ── COHORT COMPARISON ──
+                cohort = get_cohort(model1, model_version(model1))
+                rank = cohort.percentile(risk, inp["age"], inp["gender_val"])
+                sex = t("men") if inp["gender_val"] == 2 else t("women")
+                stratum_line = ""
+                if rank["stratum"] is not None:
+                    stratum_line = "<br>" + t("and than {pct:.0f}% of {sex} aged {band}").format(
+                        pct=rank["stratum"], sex=sex, band=rank["age_band"])
+                st.markdown(f"""
+                <div style='text-align:center; font-size:0.9rem; color:#94a3b8; margin-top:8px;'>
+                    👥 {t("Your risk is higher than {pct:.0f}% of {n:,} screened people").format(
+                        pct=rank["overall"], n=rank["cohort_size"])}
+                    {stratum_line}
+                </div>
+                """, unsafe_allow_html=True)
 
-                st.altair_chart(chart, use_container_width=True)
-
-                if reduction > 0:
-                    st.markdown(f"""
-                    <div class='insight-box'>
-                        <p>🎯 By lowering your systolic BP from <strong>{current_ap_hi}</strong>
-                        to <strong>{target_bp} mmHg</strong>, your estimated risk drops by
-                        <strong>{reduction:.1f} percentage points</strong>
-                        ({current_r:.1f}% → {target_r:.1f}%).</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                else:
-                    st.markdown("""
-                    <div class='insight-box'>
-                        <p>✅ Your current blood pressure is already at the target level.</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                # ── ACTIONABLE INSIGHTS SIMULATOR ──
+                bp_simulator(inp)
 
         else:
-            st.markdown("""
+            st.markdown(f"""
             <div style='text-align:center; padding:80px 20px; color:#475569;'>
                 <div style='font-size:4rem; margin-bottom:16px;'>📡</div>
                 <div style='font-size:1.1rem; font-weight:600; color:#64748b;'>
-                    Enter your biometrics and click<br>"Calculate Risk Score"
+                    {t('Enter your biometrics and click "Calculate Risk Score"')}
                 </div>
                 <div style='font-size:0.85rem; margin-top:8px;'>
-                    The Actionable Insights Simulator will appear here
+                    {t("The Actionable Insights Simulator will appear here")}
                 </div>
             </div>
             """, unsafe_allow_html=True)
@@ -635,67 +918,84 @@ elif page == "📡  Tier 1: Screening":
 # ═══════════════════════════════════════════════════════════
 elif page == "🔬  Tier 2: Diagnosis":
 
-    st.markdown("""
+    st.markdown(f"""
     <div style='padding: 24px 0 8px;'>
-        <div class='tier-badge badge-2' style='display:inline-block;'>🔬 Tier 2 · Clinical Precision</div>
-        <div class='section-header'>Clinical Diagnosis</div>
-        <div class='section-sub'>Advanced clinical parameters for high-precision heart disease detection</div>
+        <div class='tier-badge badge-2' style='display:inline-block;'>🔬 {t("Tier 2 · Clinical Precision")}</div>
+        <div class='section-header'>{t("Clinical Diagnosis")}</div>
+        <div class='section-sub'>{t("Advanced clinical parameters for high-precision heart disease detection")}</div>
     </div>
     """, unsafe_allow_html=True)
 
     col_form, col_diag = st.columns([1, 1.2], gap="large")
 
     with col_form:
-        st.markdown("#### 🏥 Clinical Parameters")
+        st.markdown("#### 🏥 " + t("Clinical Parameters"))
 
         c1, c2 = st.columns(2)
         with c1:
-            t2_age = st.number_input("Age", min_value=20, max_value=100, value=55, step=1)
+            t2_age = st.number_input(t("Age"), min_value=20, max_value=100, value=55, step=1, key="t2_age")
         with c2:
-            t2_sex = st.radio("Sex", ["Female", "Male"], horizontal=True)
+            t2_sex = st.radio(t("Sex"), ["Female", "Male"], format_func=t, horizontal=True,
+                              key="t2_sex")
         sex_m = 1 if t2_sex == "Male" else 0
 
         c3, c4 = st.columns(2)
         with c3:
-            t2_rbp = st.number_input("Resting BP (mmHg)", min_value=80, max_value=220, value=140, step=1)
+            t2_rbp = st.number_input(t("Resting BP (mmHg)"), min_value=80, max_value=220, value=140, step=1, key="t2_rbp")
         with c4:
-            t2_chol = st.number_input("Cholesterol (mg/dL)", min_value=0, max_value=600, value=250, step=5)
+            t2_chol = st.number_input(t("Cholesterol (mg/dL)"), min_value=0, max_value=600, value=250, step=5, key="t2_chol")
 
         c5, c6 = st.columns(2)
         with c5:
-            t2_maxhr = st.number_input("Max Heart Rate", min_value=60, max_value=220, value=130, step=1)
+            t2_maxhr = st.number_input(t("Max Heart Rate"), min_value=60, max_value=220, value=130, step=1, key="t2_maxhr")
         with c6:
-            t2_oldpeak = st.number_input("Oldpeak (ST Depr.)", min_value=0.0, max_value=10.0, value=1.5, step=0.1)
+            t2_oldpeak = st.number_input(t("Oldpeak (ST Depr.)"), min_value=0.0, max_value=10.0, value=1.5, step=0.1, key="t2_oldpeak")
 
-        t2_fbs = st.radio("Fasting Blood Sugar > 120 mg/dL?", ["No", "Yes"], horizontal=True)
+        t2_fbs = st.radio(t("Fasting Blood Sugar > 120 mg/dL?"), ["No", "Yes"], format_func=t,
+                          horizontal=True, key="t2_fbs")
         fbs_val = 1 if t2_fbs == "Yes" else 0
 
         t2_cpt = st.selectbox(
-            "Chest Pain Type",
-            ["ASY — Asymptomatic", "ATA — Atypical Angina", "NAP — Non-Anginal Pain", "TA — Typical Angina"]
+            t("Chest Pain Type"),
+            ["ASY — Asymptomatic", "ATA — Atypical Angina", "NAP — Non-Anginal Pain", "TA — Typical Angina"],
+            format_func=t,
+            key="t2_cpt",
         )
         cpt_code = t2_cpt.split(" — ")[0]
         cpt_ata = int(cpt_code == "ATA")
         cpt_nap = int(cpt_code == "NAP")
         cpt_ta  = int(cpt_code == "TA")
 
-        t2_ecg = st.selectbox("Resting ECG", ["Normal", "LVH — Left Ventricular Hypertrophy", "ST — ST-T Wave Abnormality"])
+        t2_ecg = st.selectbox(t("Resting ECG"),
+                              ["Normal", "LVH — Left Ventricular Hypertrophy", "ST — ST-T Wave Abnormality"],
+                              format_func=t, key="t2_ecg")
         ecg_code = t2_ecg.split(" — ")[0]
         ecg_normal = int(ecg_code == "Normal")
         ecg_st     = int(ecg_code == "ST")
 
-        t2_ea = st.radio("Exercise-Induced Angina?", ["No", "Yes"], horizontal=True)
+        t2_ea = st.radio(t("Exercise-Induced Angina?"), ["No", "Yes"], format_func=t, horizontal=True,
+                         key="t2_ea")
         ea_val = 1 if t2_ea == "Yes" else 0
 
-        t2_slope = st.selectbox("ST Slope", ["Up — Upsloping", "Flat — Flat", "Down — Downsloping"])
+        t2_slope = st.selectbox(t("ST Slope"), ["Up — Upsloping", "Flat — Flat", "Down — Downsloping"],
+                                format_func=t, key="t2_slope")
         slope_code = t2_slope.split(" — ")[0]
         slope_flat = int(slope_code == "Flat")
         slope_up   = int(slope_code == "Up")
 
-        diag_btn = st.button("🔬 Run Clinical Diagnosis", use_container_width=True)
+        diag_btn = st.button("🔬 " + t("Run Clinical Diagnosis"), use_container_width=True)
+
+    if diag_btn and model2 is None:
+        # Tier 2 loads in about a second; on a cold start just wait for it
+        if model_state(2) == "loading":
+            with st.spinner("🔬 " + t("Loading the clinical model…")):
+                wait([model_loaders().future(2)])
+        model2, acc2 = loaded_model(2)
 
     with col_diag:
-        if diag_btn or "tier2_result" in st.session_state:
+        if diag_btn and model2 is None:
+            model_failure_notice(2)
+        elif diag_btn or "tier2_result" in st.session_state:
             if diag_btn:
                 features = {
                     "Age":               t2_age,
@@ -714,7 +1014,7 @@ elif page == "🔬  Tier 2: Diagnosis":
                     "ST_Slope_Flat":     slope_flat,
                     "ST_Slope_Up":       slope_up,
                 }
-                prob, importances = predict_tier2(model2, features)
+                prob, importances = predict_tier2(model2, features)   # per-patient contributions
                 st.session_state["tier2_result"] = (prob, importances)
 
             prob, importances = st.session_state["tier2_result"]
@@ -722,107 +1022,112 @@ elif page == "🔬  Tier 2: Diagnosis":
 
             if prob_pct >= 50:
                 diag_class = "diag-positive"
-                diag_label = "Heart Disease Likely"
+                diag_label = t("Heart Disease Likely")
                 diag_emoji = "🚨"
-                diag_advice = "High probability detected. Immediate clinical consultation recommended."
+                diag_advice = t("High probability detected. Immediate clinical consultation recommended.")
             else:
                 diag_class = "diag-negative"
-                diag_label = "Heart Disease Unlikely"
+                diag_label = t("Heart Disease Unlikely")
                 diag_emoji = "✅"
-                diag_advice = "Low probability detected. Continue regular health monitoring."
+                diag_advice = t("Low probability detected. Continue regular health monitoring.")
 
             st.markdown(f"""
             <div class='diag-box {diag_class}'>
-                <div style='font-size:0.9rem; color:#94a3b8; font-weight:500;'>Diagnosis Probability</div>
+                <div style='font-size:0.9rem; color:#94a3b8; font-weight:500;'>{t("Diagnosis Probability")}</div>
                 <div class='diag-prob'>{prob_pct:.1f}%</div>
                 <div style='font-size:1.2rem; font-weight:700; margin-bottom:8px;'>{diag_emoji} {diag_label}</div>
                 <div style='font-size:0.82rem; color:#64748b;'>{diag_advice}</div>
             </div>
             """, unsafe_allow_html=True)
 
-            # ── FEATURE IMPORTANCE CHART ──
+            # ── PER-PATIENT EXPLANATION CHART ──
             st.markdown("<br>", unsafe_allow_html=True)
-            st.markdown("""
+            st.markdown(f"""
             <div style='margin-bottom:8px;'>
                 <span style='font-size:1.1rem; font-weight:700; color:#a78bfa;'>
-                    🧠 Model Explainability — Feature Importance
+                    🧠 {t("Model Explainability — Your Risk Drivers")}
                 </span><br>
                 <span style='font-size:0.85rem; color:#64748b;'>
-                    Which clinical factors drive this model's decisions
+                    {t("How each clinical factor pushed this prediction up or down")}
                 </span>
             </div>
             """, unsafe_allow_html=True)
 
-            imp_df = importances.reset_index()
-            imp_df.columns = ["Feature", "Importance"]
-            imp_df["Importance (%)"] = (imp_df["Importance"] * 100).round(2)
-
-            # Color scale: higher importance → brighter purple
-            bars = alt.Chart(imp_df).mark_bar(
-                cornerRadiusTopRight=6,
-                cornerRadiusBottomRight=6
-            ).encode(
-                y=alt.Y("Feature:N",
-                        sort=alt.EncodingSortField(field="Importance", order="descending"),
-                        axis=alt.Axis(labelColor="#94a3b8", titleColor="#94a3b8",
-                                      labelFontSize=11, gridColor="rgba(255,255,255,0.05)")),
-                x=alt.X("Importance (%):Q",
-                        axis=alt.Axis(labelColor="#94a3b8", titleColor="#94a3b8",
-                                      gridColor="rgba(255,255,255,0.05)",
-                                      title="Importance (%)")),
-                color=alt.Color("Importance (%):Q",
-                                scale=alt.Scale(range=["#4f46e5", "#c084fc"]),
-                                legend=None),
-                tooltip=["Feature:N", alt.Tooltip("Importance (%):Q", format=".2f")]
-            ).properties(
-                height=340,
-                background="transparent",
-                title=alt.TitleParams(
-                    "Feature Importance (Random Forest)",
-                    color="#e2e8f0", fontSize=13, fontWeight="bold"
+            with stage("chart.tier2_explain"):
+                imp_df = importances.reset_index()
+                imp_df.columns = ["Feature", "Contribution"]
+                imp_df["Feature"] = imp_df["Feature"].map(t)
+                imp_df["Contribution (pp)"] = (imp_df["Contribution"] * 100).round(2)
+                raises, lowers = t("Raises risk"), t("Lowers risk")
+                imp_df["Effect"] = np.where(imp_df["Contribution"] >= 0, raises, lowers)
+
+                # Red bars push the probability up, green bars pull it down
+                bars = alt.Chart(imp_df).mark_bar(
+                    cornerRadius=6
+                ).encode(
+                    y=alt.Y("Feature:N",
+                            sort=alt.EncodingSortField(field="Contribution", order="descending"),
+                            axis=alt.Axis(labelColor="#94a3b8", titleColor="#94a3b8",
+                                          labelFontSize=11, gridColor="rgba(255,255,255,0.05)")),
+                    x=alt.X("Contribution (pp):Q",
+                            axis=alt.Axis(labelColor="#94a3b8", titleColor="#94a3b8",
+                                          gridColor="rgba(255,255,255,0.05)",
+                                          title=t("Contribution to probability (percentage points)"))),
+                    color=alt.Color("Effect:N", title=t("Effect"),
+                                    scale=alt.Scale(domain=[raises, lowers],
+                                                    range=["#f87171", "#34d399"]),
+                                    legend=alt.Legend(orient="bottom", labelColor="#e2e8f0",
+                                                      titleColor="#94a3b8")),
+                    tooltip=["Feature:N", alt.Tooltip("Contribution (pp):Q", format="+.2f")]
+                ).properties(
+                    height=340,
+                    background="transparent",
+                    title=alt.TitleParams(
+                        t("Per-Patient Feature Contributions (Random Forest)"),
+                        color="#e2e8f0", fontSize=13, fontWeight="bold"
+                    )
+                ).configure_view(
+                    strokeWidth=0,
+                    fill="transparent"
+                ).configure_axis(
+                    domainColor="rgba(255,255,255,0.1)",
+                    tickColor="rgba(255,255,255,0.1)"
                 )
-            ).configure_view(
-                strokeWidth=0,
-                fill="transparent"
-            ).configure_axis(
-                domainColor="rgba(255,255,255,0.1)",
-                tickColor="rgba(255,255,255,0.1)"
-            )
-
-            st.altair_chart(bars, use_container_width=True)
-
-            # Top 3 insight
-            top3 = imp_df.nlargest(3, "Importance")
-            top3_names = ", ".join(f"**{r['Feature']}** ({r['Importance (%)']:.1f}%)"
+
+                st.altair_chart(bars, use_container_width=True)
+
+            # Top 3 insight — largest effects on this patient, either direction
+            top3 = imp_df.loc[imp_df["Contribution"].abs().nlargest(3).index]
+            top3_names = ", ".join(f"<strong>{r['Feature']}</strong> ({r['Contribution (pp)']:+.1f} pp)"
                                    for _, r in top3.iterrows())
             st.markdown(f"""
             <div class='insight-box'>
-                <p>🔍 Top 3 drivers of this prediction: {top3_names.replace('**', '<strong>').replace('**', '</strong>')}</p>
+                <p>🔍 {t("Top 3 drivers of this prediction:")} {top3_names}</p>
             </div>
             """, unsafe_allow_html=True)
 
         else:
-            st.markdown("""
+            st.markdown(f"""
             <div style='text-align:center; padding:80px 20px; color:#475569;'>
                 <div style='font-size:4rem; margin-bottom:16px;'>🔬</div>
                 <div style='font-size:1.1rem; font-weight:600; color:#64748b;'>
-                    Fill in the clinical parameters<br>and click "Run Clinical Diagnosis"
+                    {t('Fill in the clinical parameters and click "Run Clinical Diagnosis"')}
                 </div>
                 <div style='font-size:0.85rem; margin-top:8px;'>
-                    Feature importance chart will appear here
+                    {t("Your personal risk-driver chart will appear here")}
                 </div>
             </div>
             """, unsafe_allow_html=True)
 
     # Disclaimer
     st.markdown("<br>", unsafe_allow_html=True)
-    st.markdown("""
+    st.markdown(f"""
     <div style='text-align:center; color:#374151; font-size:0.8rem; padding:16px;
                 background:rgba(255,255,255,0.02); border-radius:12px;
                 border:1px solid rgba(255,255,255,0.05);'>
-        ⚠️ <strong style='color:#475569;'>Medical Disclaimer:</strong>
-        This tool is for research and educational purposes only.
-        Always consult a qualified healthcare professional for medical decisions.
+        ⚠️ <strong style='color:#475569;'>{t("Medical Disclaimer:")}</strong>
+        {t("This tool is for research and educational purposes only. "
+           "Always consult a qualified healthcare professional for medical decisions.")}
     </div>
     """, unsafe_allow_html=True)
 
@@ -884,308 +1189,280 @@ elif page == "🧬  Health Twin":
     </style>
     """, unsafe_allow_html=True)
 
-    st.markdown("""
+    st.markdown(f"""
     <div style='padding: 24px 0 8px;'>
         <div class='tier-badge' style='display:inline-block; background:rgba(251,191,36,0.15);
-             color:#fbbf24; border:1px solid rgba(251,191,36,0.4);'>🧬 Unique Feature</div>
-        <div class='section-header'>Health Twin Simulator</div>
+             color:#fbbf24; border:1px solid rgba(251,191,36,0.4);'>🧬 {t("Unique Feature")}</div>
+        <div class='section-header'>{t("Health Twin Simulator")}</div>
         <div class='section-sub'>
-            Meet your Future Healthy Self — AI-powered 10-year risk trajectory &amp; personalised prescription
+            {t("Meet your Future Healthy Self — AI-powered multi-year risk trajectory & personalised prescription")}
         </div>
     </div>
     """, unsafe_allow_html=True)
+    tier1_notice()
 
     # ── INPUTS ──
-    st.markdown("#### 👤 Your Current Profile")
+    st.markdown("#### 👤 " + t("Your Current Profile"))
     ci1, ci2, ci3 = st.columns(3)
     with ci1:
-        ht_age    = st.number_input("Age", min_value=18, max_value=80, value=42, step=1, key="ht_age")
-        ht_gender = st.radio("Gender", ["Female", "Male"], horizontal=True, key="ht_gender")
+        ht_age    = st.number_input(t("Age"), min_value=18, max_value=80, value=42, step=1, key="ht_age")
+        ht_gender = st.radio(t("Gender"), ["Female", "Male"], format_func=t, horizontal=True, key="ht_gender")
         ht_gval   = 2 if ht_gender == "Male" else 1
     with ci2:
-        ht_height = st.number_input("Height (cm)", min_value=140, max_value=220, value=172, step=1, key="ht_h")
-        ht_weight = st.number_input("Weight (kg)", min_value=40.0, max_value=180.0, value=88.0, step=0.5, key="ht_w")
+        ht_height = st.number_input(t("Height (cm)"), min_value=140, max_value=220, value=172, step=1, key="ht_h")
+        ht_weight = st.number_input(t("Weight (kg)"), min_value=40.0, max_value=180.0, value=88.0, step=0.5, key="ht_w")
     with ci3:
-        ht_aphi   = st.number_input("Systolic BP", min_value=90, max_value=200, value=148, step=1, key="ht_bp")
-        ht_aplo   = st.number_input("Diastolic BP", min_value=50, max_value=140, value=92, step=1, key="ht_bpd")
+        ht_aphi   = st.number_input(t("Systolic BP"), min_value=90, max_value=200, value=148, step=1, key="ht_bp")
+        ht_aplo   = st.number_input(t("Diastolic BP"), min_value=50, max_value=140, value=92, step=1, key="ht_bpd")
 
     ci4, ci5 = st.columns(2)
     with ci4:
-        ht_chol = st.selectbox("Cholesterol", ["Normal", "Above Normal", "Well Above Normal"], index=1, key="ht_chol")
+        ht_chol = st.selectbox(t("Cholesterol"), ["Normal", "Above Normal", "Well Above Normal"],
+                               index=1, format_func=t, key="ht_chol")
         ht_cval = {"Normal": 1, "Above Normal": 2, "Well Above Normal": 3}[ht_chol]
-        ht_gluc = st.selectbox("Glucose", ["Normal", "Above Normal", "Well Above Normal"], key="ht_gluc")
+        ht_gluc = st.selectbox(t("Glucose"), ["Normal", "Above Normal", "Well Above Normal"],
+                               format_func=t, key="ht_gluc")
         ht_gval2 = {"Normal": 1, "Above Normal": 2, "Well Above Normal": 3}[ht_gluc]
     with ci5:
-        ht_smoke  = st.checkbox("🚬 Currently Smoking", value=True, key="ht_smoke")
-        ht_alco   = st.checkbox("🍺 Regular Alcohol", value=True, key="ht_alco")
-        ht_active = st.checkbox("🏃 Physically Active", value=False, key="ht_active")
-
-    st.markdown("<br>", unsafe_allow_html=True)
-    st.markdown("#### 🎯 Design Your Future Self")
-    st.markdown("<div style='font-size:0.85rem; color:#64748b; margin-bottom:16px;'>Adjust the sliders to set your health goals — the AI will instantly project your new risk trajectory</div>",
-                unsafe_allow_html=True)
-
-    fi1, fi2 = st.columns(2)
-    with fi1:
-        goal_bp     = st.slider("🩺 Target Systolic BP", 90, ht_aphi, min(120, ht_aphi), key="goal_bp")
-        goal_weight = st.slider("⚖️ Target Weight (kg)", max(40, int(ht_weight) - 30),
-                                int(ht_weight), int(ht_weight), key="goal_w")
-    with fi2:
-        goal_chol   = st.selectbox("🧪 Target Cholesterol", ["Normal", "Above Normal", "Well Above Normal"],
-                                   index=max(0, ht_cval - 2), key="goal_chol")
-        goal_cval   = {"Normal": 1, "Above Normal": 2, "Well Above Normal": 3}[goal_chol]
-        goal_smoke  = st.checkbox("🚭 Quit Smoking",    value=ht_smoke,  key="goal_smoke")
-        goal_active = st.checkbox("🏋️ Become Active",  value=not ht_active, key="goal_active")
-
-    simulate_btn = st.button("🧬 Generate My Health Twin", use_container_width=True)
-
-    if simulate_btn or "twin_result" in st.session_state:
-        if simulate_btn:
-            # ── Compute current risk ──
-            current_risk = predict_tier1(
-                model1, ht_age, ht_gval, ht_height, ht_weight,
-                ht_aphi, ht_aplo, ht_cval, ht_gval2,
-                int(ht_smoke), int(ht_alco), int(ht_active)
-            )
-            # ── Compute future risk ──
-            future_bmi_weight = goal_weight
-            future_risk = predict_tier1(
-                model1, ht_age, ht_gval, ht_height, future_bmi_weight,
-                goal_bp, ht_aplo, goal_cval, 1,
-                int(not goal_smoke), 0, int(goal_active)
-            )
-            # ── 10-year trajectory ──
-            # Simulate risk aging from current age to current age + 10
-            trajectory_rows = []
-            for yr in range(11):
-                age_now  = ht_age + yr
-                r_curr = predict_tier1(
-                    model1, age_now, ht_gval, ht_height, ht_weight,
-                    ht_aphi, ht_aplo, ht_cval, ht_gval2,
-                    int(ht_smoke), int(ht_alco), int(ht_active)
-                )
-                r_fut = predict_tier1(
-                    model1, age_now, ht_gval, ht_height, future_bmi_weight,
-                    goal_bp, ht_aplo, goal_cval, 1,
-                    int(not goal_smoke), 0, int(goal_active)
+        ht_smoke  = st.checkbox("🚬 " + t("Currently Smoking"), value=True, key="ht_smoke")
+        ht_alco   = st.checkbox("🍺 " + t("Regular Alcohol"), value=True, key="ht_alco")
+        ht_active = st.checkbox("🏃 " + t("Physically Active"), value=False, key="ht_active")
+
+    @rerun_fragment("health_twin")
+    def health_twin(ht_age, ht_gval, ht_height, ht_weight, ht_aphi, ht_aplo, ht_chol,
+                    ht_cval, ht_gval2, ht_smoke, ht_alco, ht_active):
+        # Goal sliders and the results below rerun on their own; the profile
+        # inputs above still trigger a full rerun.
+        st.markdown("<br>", unsafe_allow_html=True)
+        st.markdown("#### 🎯 " + t("Design Your Future Self"))
+        st.markdown("<div style='font-size:0.85rem; color:#64748b; margin-bottom:16px;'>"
+                    + t("Adjust the sliders to set your health goals — the AI will instantly project your new risk trajectory")
+                    + "</div>", unsafe_allow_html=True)
+
+        fi1, fi2 = st.columns(2)
+        with fi1:
+            goal_bp     = st.slider("🩺 " + t("Target Systolic BP"), 90, ht_aphi, min(120, ht_aphi), key="goal_bp")
+            goal_weight = st.slider("⚖️ " + t("Target Weight (kg)"), max(40, int(ht_weight) - 30),
+                                    int(ht_weight), int(ht_weight), key="goal_w")
+        with fi2:
+            goal_chol   = st.selectbox("🧪 " + t("Target Cholesterol"), ["Normal", "Above Normal", "Well Above Normal"],
+                                       index=max(0, ht_cval - 2), format_func=t, key="goal_chol")
+            goal_cval   = {"Normal": 1, "Above Normal": 2, "Well Above Normal": 3}[goal_chol]
+            goal_smoke  = st.checkbox("🚭 " + t("Quit Smoking"),  value=ht_smoke,  key="goal_smoke")
+            goal_active = st.checkbox("🏋️ " + t("Become Active"), value=not ht_active, key="goal_active")
+
+        fh1, fh2 = st.columns(2)
+        with fh1:
+            horizon = st.slider("📅 " + t("Projection Horizon (years)"), 5, 30, 10, key="twin_horizon")
+        with fh2:
+            st.markdown("<div style='height:28px;'></div>", unsafe_allow_html=True)
+            show_each = st.checkbox("🔍 " + t("Also project each goal on its own"), value=False, key="twin_each")
+
+        simulate_btn = st.button("🧬 " + t("Generate My Health Twin"), use_container_width=True,
+                                 disabled=model1 is None)
+
+        simulated = simulate_btn and model1 is not None
+        if simulated or "twin_result" in st.session_state:
+            if simulated:
+                base_profile = dict(
+                    age=ht_age, gender=ht_gval, height=ht_height, weight=ht_weight,
+                    ap_hi=ht_aphi, ap_lo=ht_aplo, cholesterol=ht_cval, gluc=ht_gval2,
+                    smoke=int(ht_smoke), alco=int(ht_alco), active=int(ht_active),
                 )
-                trajectory_rows.append({"Year": f"Age {age_now}", "Age": age_now,
-                                         "Current Path": round(r_curr * 100, 2),
-                                         "Healthy Twin": round(r_fut * 100, 2)})
-            traj_df = pd.DataFrame(trajectory_rows)
-
-            # ── Prescription ──
-            prescription = []
-            if goal_bp < ht_aphi:
-                prescription.append(("🩺", "Blood Pressure",
-                                      f"Reduce systolic BP from {ht_aphi} → {goal_bp} mmHg",
-                                      f"−{ht_aphi - goal_bp} mmHg"))
-            if goal_weight < ht_weight:
-                prescription.append(("⚖️", "Weight Loss",
-                                      f"Lose {ht_weight - goal_weight:.1f} kg through diet & exercise",
-                                      f"−{ht_weight - goal_weight:.1f} kg"))
-            if goal_cval < ht_cval:
-                prescription.append(("🧪", "Cholesterol",
-                                      "Improve cholesterol through diet, statins if needed",
-                                      "Improved"))
-            if ht_smoke and goal_smoke:
-                prescription.append(("🚭", "Quit Smoking",
-                                      "Cessation reduces cardiovascular risk within 1 year",
-                                      "Eliminated"))
-            if not ht_active and goal_active:
-                prescription.append(("🏋️", "Exercise",
-                                      "30 min moderate activity, 5× per week",
-                                      "Active"))
-            if not prescription:
-                prescription.append(("✅", "Already Optimal",
-                                      "Your goals match your current lifestyle — great work!",
-                                      "Maintained"))
-
-            st.session_state["twin_result"] = {
-                "current": current_risk,
-                "future":  future_risk,
-                "traj":    traj_df,
-                "rx":      prescription,
-            }
-
-        res = st.session_state["twin_result"]
-        curr_pct  = res["current"] * 100
-        fut_pct   = res["future"]  * 100
-        reduction = curr_pct - fut_pct
-        traj_df   = res["traj"]
-        rx        = res["rx"]
+                scenarios = {
+                    N_("Current Path"): {},
+                    N_("Healthy Twin"): dict(
+                        weight=goal_weight, ap_hi=goal_bp, cholesterol=goal_cval, gluc=1,
+                        smoke=int(not goal_smoke), alco=0, active=int(goal_active),
+                    ),
+                }
 
-        st.markdown("<br>", unsafe_allow_html=True)
+                # ── Prescription (and one single-goal scenario per item) ──
+                # Text is kept as untranslated templates + values so a language
+                # switch re-renders the stored result in the new language.
+                prescription = []
+                single_goals = {}
+                if goal_bp < ht_aphi:
+                    prescription.append(("🩺", N_("Blood Pressure"),
+                                          N_("Reduce systolic BP from {current} → {target} mmHg"),
+                                          N_("−{drop} mmHg"),
+                                          dict(current=ht_aphi, target=goal_bp, drop=ht_aphi - goal_bp)))
+                    single_goals[N_("Blood Pressure only")] = dict(ap_hi=goal_bp)
+                if goal_weight < ht_weight:
+                    prescription.append(("⚖️", N_("Weight Loss"),
+                                          N_("Lose {kg} kg through diet & exercise"),
+                                          N_("−{kg} kg"),
+                                          dict(kg=f"{ht_weight - goal_weight:.1f}")))
+                    single_goals[N_("Weight Loss only")] = dict(weight=goal_weight)
+                if goal_cval < ht_cval:
+                    prescription.append(("🧪", N_("Cholesterol"),
+                                          N_("Improve cholesterol through diet, statins if needed"),
+                                          N_("Improved"), {}))
+                    single_goals[N_("Cholesterol only")] = dict(cholesterol=goal_cval)
+                if ht_smoke and goal_smoke:
+                    prescription.append(("🚭", N_("Quit Smoking"),
+                                          N_("Cessation reduces cardiovascular risk within 1 year"),
+                                          N_("Eliminated"), {}))
+                    single_goals[N_("Quit Smoking only")] = dict(smoke=0)
+                if not ht_active and goal_active:
+                    prescription.append(("🏋️", N_("Exercise"),
+                                          N_("30 min moderate activity, 5× per week"),
+                                          N_("Active"), {}))
+                    single_goals[N_("Exercise only")] = dict(active=1)
+                if not prescription:
+                    prescription.append(("✅", N_("Already Optimal"),
+                                          N_("Your goals match your current lifestyle — great work!"),
+                                          N_("Maintained"), {}))
+                if show_each:
+                    scenarios.update(single_goals)
+
+                # ── Risk trajectory: every scenario × year in one model call ──
+                traj_df = twin_trajectory(model1, model_version(model1),
+                                          base_profile, scenarios, horizon)
+                traj_df.insert(0, "Year", [f"Age {a}" for a in traj_df["Age"]])
+
+                st.session_state["twin_result"] = {
+                    "current":   traj_df["Current Path"].iloc[0] / 100,
+                    "future":    traj_df["Healthy Twin"].iloc[0] / 100,
+                    "traj":      traj_df,
+                    "scenarios": list(scenarios),
+                    "horizon":   horizon,
+                    "rx":        prescription,
+                }
 
-        # ── SIDE-BY-SIDE TWIN CARDS ──
-        tc1, tc_mid, tc2 = st.columns([1, 0.15, 1])
-        with tc1:
-            st.markdown(f"""
-            <div class='twin-card twin-current'>
-                <div class='twin-label' style='color:#f87171;'>😔 Current You</div>
-                <div class='twin-risk'>{curr_pct:.1f}%</div>
-                <div style='font-size:0.85rem; color:#94a3b8; margin-top:6px;'>Cardiovascular Risk</div>
-                <hr style='border-color:rgba(248,113,113,0.2); margin:16px 0;'>
-                <div style='font-size:0.82rem; color:#94a3b8; line-height:1.8;'>
-                    BP: {ht_aphi}/{ht_aplo} mmHg<br>
-                    Weight: {ht_weight} kg<br>
-                    Cholesterol: {ht_chol}<br>
-                    Smoking: {'Yes' if ht_smoke else 'No'} &nbsp;|&nbsp; Active: {'Yes' if ht_active else 'No'}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            res = st.session_state["twin_result"]
+            curr_pct  = res["current"] * 100
+            fut_pct   = res["future"]  * 100
+            reduction = curr_pct - fut_pct
+            traj_df   = res["traj"]
+            scen      = res["scenarios"]
+            horizon   = res["horizon"]
+            rx        = res["rx"]
 
-        with tc_mid:
-            st.markdown("<div style='text-align:center; font-size:2rem; padding-top:60px; color:#6366f1;'>→</div>",
-                        unsafe_allow_html=True)
+            st.markdown("<br>", unsafe_allow_html=True)
 
-        with tc2:
-            st.markdown(f"""
-            <div class='twin-card twin-future'>
-                <div class='twin-label' style='color:#34d399;'>🌟 Future Healthy You</div>
-                <div class='twin-risk'>{fut_pct:.1f}%</div>
-                <div style='font-size:0.85rem; color:#94a3b8; margin-top:6px;'>Cardiovascular Risk</div>
-                <hr style='border-color:rgba(52,211,153,0.2); margin:16px 0;'>
-                <div style='font-size:0.82rem; color:#94a3b8; line-height:1.8;'>
-                    BP: {goal_bp}/{ht_aplo} mmHg<br>
-                    Weight: {goal_weight} kg<br>
-                    Cholesterol: {goal_chol}<br>
-                    Smoking: {'Yes' if not goal_smoke else 'No'} &nbsp;|&nbsp; Active: {'Yes' if goal_active else 'No'}
+            # ── SIDE-BY-SIDE TWIN CARDS ──
+            tc1, tc_mid, tc2 = st.columns([1, 0.15, 1])
+            with tc1:
+                st.markdown(f"""
+                <div class='twin-card twin-current'>
+                    <div class='twin-label' style='color:#f87171;'>😔 {t("Current You")}</div>
+                    <div class='twin-risk'>{curr_pct:.1f}%</div>
+                    <div style='font-size:0.85rem; color:#94a3b8; margin-top:6px;'>{t("Cardiovascular Risk")}</div>
+                    <hr style='border-color:rgba(248,113,113,0.2); margin:16px 0;'>
+                    <div style='font-size:0.82rem; color:#94a3b8; line-height:1.8;'>
+                        {t("BP")}: {ht_aphi}/{ht_aplo} mmHg<br>
+                        {t("Weight")}: {ht_weight} kg<br>
+                        {t("Cholesterol")}: {t(ht_chol)}<br>
+                        {t("Smoking")}: {t('Yes') if ht_smoke else t('No')} &nbsp;|&nbsp;
+                        {t("Active")}: {t('Yes') if ht_active else t('No')}
+                    </div>
                 </div>
-            </div>
-            """, unsafe_allow_html=True)
+                """, unsafe_allow_html=True)
 
-        # ── YEARS SAVED BADGE ──
-        if reduction > 0:
-            years_equiv = round(reduction / 3.5, 1)  # ~3.5% risk per year of aging
-            st.markdown(f"""
-            <div class='years-saved'>
-                <div style='font-size:0.85rem; color:#94a3b8; margin-bottom:4px;'>Estimated Risk Reduction</div>
-                <div class='big'>−{reduction:.1f}%</div>
-                <div style='font-size:0.9rem; color:#fbbf24; margin-top:4px;'>
-                    ≈ {years_equiv} years of cardiovascular aging reversed
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            with tc_mid:
+                st.markdown("<div style='text-align:center; font-size:2rem; padding-top:60px; color:#6366f1;'>→</div>",
+                            unsafe_allow_html=True)
 
-        st.markdown("<br>", unsafe_allow_html=True)
+            with tc2:
+                st.markdown(f"""
+                <div class='twin-card twin-future'>
+                    <div class='twin-label' style='color:#34d399;'>🌟 {t("Future Healthy You")}</div>
+                    <div class='twin-risk'>{fut_pct:.1f}%</div>
+                    <div style='font-size:0.85rem; color:#94a3b8; margin-top:6px;'>{t("Cardiovascular Risk")}</div>
+                    <hr style='border-color:rgba(52,211,153,0.2); margin:16px 0;'>
+                    <div style='font-size:0.82rem; color:#94a3b8; line-height:1.8;'>
+                        {t("BP")}: {goal_bp}/{ht_aplo} mmHg<br>
+                        {t("Weight")}: {goal_weight} kg<br>
+                        {t("Cholesterol")}: {t(goal_chol)}<br>
+                        {t("Smoking")}: {t('Yes') if not goal_smoke else t('No')} &nbsp;|&nbsp;
+                        {t("Active")}: {t('Yes') if goal_active else t('No')}
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
 
-        # ── 10-YEAR TRAJECTORY CHART ──
-        st.markdown("""
-        <div style='margin-bottom:8px;'>
-            <span style='font-size:1.1rem; font-weight:700; color:#fbbf24;'>📈 10-Year Risk Trajectory</span><br>
-            <span style='font-size:0.85rem; color:#64748b;'>
-                How your cardiovascular risk evolves over the next decade — two futures, one choice
-            </span>
-        </div>
-        """, unsafe_allow_html=True)
+            # ── YEARS SAVED BADGE ──
+            if reduction > 0:
+                years_equiv = round(reduction / 3.5, 1)  # ~3.5% risk per year of aging
+                st.markdown(f"""
+                <div class='years-saved'>
+                    <div style='font-size:0.85rem; color:#94a3b8; margin-bottom:4px;'>{t("Estimated Risk Reduction")}</div>
+                    <div class='big'>−{reduction:.1f}%</div>
+                    <div style='font-size:0.9rem; color:#fbbf24; margin-top:4px;'>
+                        ≈ {t("{years} years of cardiovascular aging reversed").format(years=years_equiv)}
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
 
-        traj_long = traj_df.melt(
-            id_vars=["Year", "Age"],
-            value_vars=["Current Path", "Healthy Twin"],
-            var_name="Scenario",
-            value_name="Risk (%)"
-        )
+            st.markdown("<br>", unsafe_allow_html=True)
 
-        color_scale = alt.Scale(
-            domain=["Current Path", "Healthy Twin"],
-            range=["#f87171", "#34d399"]
-        )
+            if model1 is None:
+                tier1_notice()
+            else:
+                # ── RISK TRAJECTORY CHART ──
+                st.markdown(f"""
+                <div style='margin-bottom:8px;'>
+                    <span style='font-size:1.1rem; font-weight:700; color:#fbbf24;'>📈 {t("{years}-Year Risk Trajectory").format(years=horizon)}</span><br>
+                    <span style='font-size:0.85rem; color:#64748b;'>
+                        {t("How your cardiovascular risk evolves over the next {years} years — two futures, one choice").format(years=horizon)}
+                    </span>
+                </div>
+                """, unsafe_allow_html=True)
 
-        traj_line = alt.Chart(traj_long).mark_line(
-            strokeWidth=3, interpolate="monotone"
-        ).encode(
-            x=alt.X("Age:Q",
-                    axis=alt.Axis(title="Age (years)", labelColor="#94a3b8",
-                                  titleColor="#94a3b8", gridColor="rgba(255,255,255,0.05)",
-                                  tickCount=11)),
-            y=alt.Y("Risk (%):Q",
-                    scale=alt.Scale(domain=[max(0, traj_long["Risk (%)"].min() - 5),
-                                            min(100, traj_long["Risk (%)"].max() + 5)]),
-                    axis=alt.Axis(title="Cardiovascular Risk (%)", labelColor="#94a3b8",
-                                  titleColor="#94a3b8", gridColor="rgba(255,255,255,0.05)")),
-            color=alt.Color("Scenario:N", scale=color_scale,
-                            legend=alt.Legend(orient="top-right", labelColor="#e2e8f0",
-                                              titleColor="#94a3b8", labelFontSize=12)),
-            tooltip=["Year:N", "Scenario:N", alt.Tooltip("Risk (%):Q", format=".1f")]
-        )
+                with stage("chart.health_twin"):
+                    st.vega_lite_chart(twin_chart_spec(traj_df, scen, horizon, get_language()),
+                                       use_container_width=True)
 
-        traj_area = alt.Chart(traj_long).mark_area(
-            opacity=0.15, interpolate="monotone"
-        ).encode(
-            x="Age:Q",
-            y="Risk (%):Q",
-            color=alt.Color("Scenario:N", scale=color_scale, legend=None)
-        )
+            # ── AI PRESCRIPTION CARD ──
+            st.markdown("<br>", unsafe_allow_html=True)
+            st.markdown(f"""
+            <div style='font-size:1.1rem; font-weight:700; color:#818cf8; margin-bottom:12px;'>
+                💊 {t("Your AI-Generated Health Prescription")}
+            </div>
+            """, unsafe_allow_html=True)
 
-        traj_points = alt.Chart(traj_long).mark_point(
-            filled=True, size=60
-        ).encode(
-            x="Age:Q",
-            y="Risk (%):Q",
-            color=alt.Color("Scenario:N", scale=color_scale, legend=None),
-            tooltip=["Year:N", "Scenario:N", alt.Tooltip("Risk (%):Q", format=".1f")]
-        )
+            rx_html = "<div class='rx-card'>"
+            for icon, title, desc, impact, values in rx:
+                title, desc, impact = t(title), t(desc).format(**values), t(impact).format(**values)
+                rx_html += f"""
+                <div class='rx-item'>
+                    <div class='rx-icon'>{icon}</div>
+                    <div class='rx-text'>
+                        <strong>{title}</strong> &nbsp;
+                        <span style='background:rgba(99,102,241,0.2); color:#a5b4fc;
+                                     border-radius:6px; padding:2px 8px; font-size:0.75rem;
+                                     font-weight:600;'>{impact}</span><br>
+                        {desc}
+                    </div>
+                </div>"""
+            rx_html += "</div>"
+            st.markdown(rx_html, unsafe_allow_html=True)
 
-        traj_chart = (traj_area + traj_line + traj_points).properties(
-            height=300,
-            background="transparent",
-            title=alt.TitleParams(
-                "10-Year Cardiovascular Risk Projection",
-                color="#e2e8f0", fontSize=14, fontWeight="bold"
-            )
-        ).configure_view(
-            strokeWidth=0, fill="transparent"
-        ).configure_axis(
-            domainColor="rgba(255,255,255,0.1)",
-            tickColor="rgba(255,255,255,0.1)"
-        )
+            st.markdown(f"""
+            <div style='text-align:center; color:#374151; font-size:0.8rem; padding:16px;
+                        background:rgba(255,255,255,0.02); border-radius:12px;
+                        border:1px solid rgba(255,255,255,0.05); margin-top:16px;'>
+                ⚠️ <strong style='color:#475569;'>{t("Medical Disclaimer:")}</strong>
+                {t("Projections are AI estimates based on population data. Consult a healthcare professional.")}
+            </div>
+            """, unsafe_allow_html=True)
 
-        st.altair_chart(traj_chart, use_container_width=True)
+        else:
+            st.markdown(f"""
+            <div style='text-align:center; padding:80px 20px; color:#475569;'>
+                <div style='font-size:5rem; margin-bottom:16px;'>🧬</div>
+                <div style='font-size:1.2rem; font-weight:700; color:#64748b;'>
+                    {t('Set your health goals above and click "Generate My Health Twin"')}
+                </div>
+                <div style='font-size:0.85rem; margin-top:12px; color:#374151;'>
+                    {t("You'll see your Current Self vs Future Healthy Self, "
+                       "a multi-year AI risk trajectory, and a personalised prescription")}
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
 
-        # ── AI PRESCRIPTION CARD ──
-        st.markdown("<br>", unsafe_allow_html=True)
-        st.markdown("""
-        <div style='font-size:1.1rem; font-weight:700; color:#818cf8; margin-bottom:12px;'>
-            💊 Your AI-Generated Health Prescription
-        </div>
-        """, unsafe_allow_html=True)
+    health_twin(ht_age, ht_gval, ht_height, ht_weight, ht_aphi, ht_aplo, ht_chol,
+                ht_cval, ht_gval2, ht_smoke, ht_alco, ht_active)
 
-        rx_html = "<div class='rx-card'>"
-        for icon, title, desc, impact in rx:
-            rx_html += f"""
-            <div class='rx-item'>
-                <div class='rx-icon'>{icon}</div>
-                <div class='rx-text'>
-                    <strong>{title}</strong> &nbsp;
-                    <span style='background:rgba(99,102,241,0.2); color:#a5b4fc;
-                                 border-radius:6px; padding:2px 8px; font-size:0.75rem;
-                                 font-weight:600;'>{impact}</span><br>
-                    {desc}
-                </div>
-            </div>"""
-        rx_html += "</div>"
-        st.markdown(rx_html, unsafe_allow_html=True)
-
-        st.markdown("""
-        <div style='text-align:center; color:#374151; font-size:0.8rem; padding:16px;
-                    background:rgba(255,255,255,0.02); border-radius:12px;
-                    border:1px solid rgba(255,255,255,0.05); margin-top:16px;'>
-            ⚠️ <strong style='color:#475569;'>Medical Disclaimer:</strong>
-            Projections are AI estimates based on population data. Consult a healthcare professional.
-        </div>
-        """, unsafe_allow_html=True)
 
-    else:
-        st.markdown("""
-        <div style='text-align:center; padding:80px 20px; color:#475569;'>
-            <div style='font-size:5rem; margin-bottom:16px;'>🧬</div>
-            <div style='font-size:1.2rem; font-weight:700; color:#64748b;'>
-                Set your health goals above<br>and click "Generate My Health Twin"
-            </div>
-            <div style='font-size:0.85rem; margin-top:12px; color:#374151;'>
-                You'll see your Current Self vs Future Healthy Self,<br>
-                a 10-year AI risk trajectory, and a personalised prescription
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+observe("rerun.app", (time.perf_counter() - _run_started) * 1e3)
@@ -5,11 +5,21 @@ Two-Tier AI System for Heart Disease Detection
 
 import pandas as pd
 import numpy as np
-import streamlit as st
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score
 import os
+import threading
+import weakref
+
+from fast_forest import (FlatForest, compile_forest, load_packed, pack_forest,
+                         read_packed_meta)
+from feature_store import FeatureStore
+from instrumentation import timed
+from memo import LRUCache
+from model_backends import get_backend
+from model_store import (
+    artifact_key, artifact_version, load_artifact, packed_path, prune_directory,
+    save_artifact,
+)
+from resource_cache import cached_resource
 
 # ─────────────────────────────────────────────
 # PATHS
@@ -17,6 +27,7 @@ import os
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CARDIO_PATH = os.path.join(BASE_DIR, "dataset", "cardio_base.csv")
 HEART_PATH  = os.path.join(BASE_DIR, "dataset", "heart_processed.csv")
+FEATURE_CACHE_DIR = os.path.join(BASE_DIR, "dataset", "cache")
 
 # ─────────────────────────────────────────────
 # TIER 1 — POPULATION SCREENING MODEL
@@ -28,90 +39,368 @@ TIER1_FEATURES = [
     "cholesterol", "gluc", "smoke", "alco", "active"
 ]
 
-def load_and_preprocess_tier1() -> pd.DataFrame:
-    df = pd.read_csv(CARDIO_PATH, sep=";")
+# Raw patient inputs accepted by predict_tier1 (bmi is derived)
+TIER1_INPUTS = [
+    "age", "gender", "height", "weight", "ap_hi", "ap_lo",
+    "cholesterol", "gluc", "smoke", "alco", "active"
+]
+
+TIER1_PARAMS = dict(
+    n_estimators=150,
+    max_depth=12,
+    min_samples_leaf=10,
+    random_state=42,
+)
+
+# Hyperparameters per model backend (see model_backends.py)
+TIER1_BACKEND_PARAMS = {
+    "random_forest": TIER1_PARAMS,
+    "hist_gradient_boosting": dict(
+        max_iter=300,
+        learning_rate=0.05,
+        max_leaf_nodes=31,
+        l2_regularization=1.0,
+        random_state=42,
+    ),
+    "logistic": dict(C=1.0, max_iter=1000),
+}
+
+def add_tier1_derived(df: pd.DataFrame) -> pd.DataFrame:
+    """Add the derived `age_years` and `bmi` columns to a cardio_base frame."""
     # Convert age from days → years
     df["age_years"] = (df["age"] / 365.25).round(1)
     # Compute BMI
     df["bmi"] = df["weight"] / ((df["height"] / 100) ** 2)
-    # Filter unreasonable blood pressure values
-    df = df[(df["ap_hi"] >= 90) & (df["ap_hi"] <= 200)]
-    df = df[(df["ap_lo"] >= 50) & (df["ap_lo"] <= 140)]
-    # Drop rows with NaN
-    df = df.dropna(subset=TIER1_FEATURES + ["cardio"])
     return df
 
 
-@st.cache_resource(show_spinner="🫀 Training Tier 1 Screening Model…")
-def train_tier1_model():
-    df = load_and_preprocess_tier1()
-    X = df[TIER1_FEATURES]
-    y = df["cardio"]
+# Rows read per chunk by the streaming preprocessor; bounds its peak memory
+TIER1_CHUNKSIZE = 100_000
+
+# Raw cardio_base columns the Tier 1 pipeline needs (id is never read)
+TIER1_RAW_COLUMNS = TIER1_INPUTS + ["cardio"]
+
+
+def tier1_filter_masks(df: pd.DataFrame) -> dict:
+    """
+    One boolean keep-mask per cleaning filter, in order. NaN blood pressure
+    fails its range check, as it did with the old sequential filters.
+    """
+    return {
+        "ap_hi_range": df["ap_hi"].between(90, 200).to_numpy(),
+        "ap_lo_range": df["ap_lo"].between(50, 140).to_numpy(),
+        "missing":     df[TIER1_FEATURES + ["cardio"]].notna().all(axis=1).to_numpy(),
+    }
+
+
+def clean_tier1(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop rows with implausible blood pressure or missing Tier 1 values."""
+    # All filters fused into one mask, so the frame is copied only once
+    keep = np.logical_and.reduce(list(tier1_filter_masks(df).values()))
+    return df[keep]
+
+
+@timed("preprocess.tier1")
+def load_and_preprocess_tier1(path: str = CARDIO_PATH) -> pd.DataFrame:
+    df = pd.read_csv(path, sep=";")
+    return clean_tier1(add_tier1_derived(df))
+
+
+@timed("preprocess.tier1_stream")
+def stream_preprocess_tier1(store: FeatureStore, path: str = CARDIO_PATH,
+                            chunksize: int = TIER1_CHUNKSIZE) -> dict:
+    """
+    Out-of-core counterpart of load_and_preprocess_tier1: read `path` in
+    chunks, derive the Tier 1 features, apply the fused filter mask and
+    append each surviving block to `store`. Peak memory follows
+    `chunksize`, not the file size.
+
+    Returns (and saves with the store) row counts plus, per filter, how
+    many rows it rejected; a row failing several filters counts for each.
+    """
+    stats = {"rows_in": 0, "rows_kept": 0, "chunks": 0, "rejected": {}}
+    with store.writer(TIER1_FEATURES) as w:
+        for chunk in pd.read_csv(path, sep=";", usecols=TIER1_RAW_COLUMNS,
+                                 chunksize=chunksize):
+            chunk = add_tier1_derived(chunk)
+            masks = tier1_filter_masks(chunk)
+            keep = np.logical_and.reduce(list(masks.values()))
+            for name, mask in masks.items():
+                stats["rejected"][name] = (stats["rejected"].get(name, 0)
+                                           + int(len(mask) - mask.sum()))
+            w.append(chunk.loc[keep, TIER1_FEATURES].to_numpy(dtype=np.float32),
+                     chunk.loc[keep, "cardio"].to_numpy())
+            stats["rows_in"] += len(chunk)
+            stats["chunks"] += 1
+        stats["rows_kept"] = w.rows
+        stats["dropped"] = stats["rows_in"] - w.rows
+        w.commit(stats)
+    return stats
+
+
+def tier1_store() -> FeatureStore:
+    return FeatureStore(os.path.join(FEATURE_CACHE_DIR, "tier1"), CARDIO_PATH)
+
+
+@timed("preprocess.tier1_matrix")
+def load_tier1_matrix() -> tuple[np.ndarray, np.ndarray]:
+    """
+    Cleaned Tier 1 (X, y) as read-only memory maps (float32 / int8).
+    The CSV is streamed into the cache under dataset/cache/ only when
+    cardio_base.csv has changed since the cache was written.
+    """
+    store = tier1_store()
+    if not store.is_fresh(TIER1_FEATURES):
+        stream_preprocess_tier1(store)
+    X, y, _ = store.load()
+    return X, y
+
+
+def load_or_fit(name: str, key: str, fit, features: list):
+    """
+    Uncached artifact load: the stored model for `name` if its key matches,
+    else fit() it and save. Returns (model, accuracy) with model.version_ set.
+    """
+    artifact = load_artifact(name, key)
+    if artifact is None:
+        model, acc = fit()
+        artifact = save_artifact(name, key, model, acc, features)
+    model = artifact["model"]
+    model.version_ = artifact_version(artifact)
+    return model, artifact["accuracy"]
+
+
+def fit_model(X, y, params: dict, backend: str = "random_forest"):
+    """
+    Fit the named backend's estimator on a stratified 80/20 split of (X, y).
+    Returns (model, test accuracy).
+    """
+    # sklearn is imported here, not at module load, so headless callers
+    # that only load artifacts or score compiled forests stay light.
+    from sklearn.metrics import accuracy_score
+    from sklearn.model_selection import train_test_split
+
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=0.2, random_state=42, stratify=y
     )
-    model = RandomForestClassifier(
-        n_estimators=150,
-        max_depth=12,
-        min_samples_leaf=10,
-        random_state=42,
-        n_jobs=-1
-    )
+    model = get_backend(backend).build(params)
     model.fit(X_train, y_train)
     acc = accuracy_score(y_test, model.predict(X_test))
     return model, acc
 
 
+def fit_forest(X, y, params: dict):
+    """Fit a RandomForestClassifier; see fit_model. Returns (model, test accuracy)."""
+    return fit_model(X, y, params, "random_forest")
+
+
+@timed("model_train.tier1")
+def fit_tier1_model(params: dict = None, backend: str = None):
+    """
+    Train the Tier 1 model from the cached feature matrix with `backend`
+    (default: the configured one) and its TIER1_BACKEND_PARAMS.
+    Returns (model, accuracy).
+    """
+    name = get_backend(backend).name
+    X, y = load_tier1_matrix()
+    return fit_model(pd.DataFrame(X, columns=TIER1_FEATURES, copy=False), y,
+                     params or TIER1_BACKEND_PARAMS[name], name)
+
+
+def tier1_artifact_name(backend: str = None) -> str:
+    """The forest keeps the original "tier1" artifact; other backends get their own."""
+    name = get_backend(backend).name
+    return "tier1" if name == "random_forest" else f"tier1_{name}"
+
+
+def tier1_artifact_key(backend: str = None) -> str:
+    name = get_backend(backend).name
+    params = TIER1_BACKEND_PARAMS[name]
+    if name != "random_forest":
+        # Forest keys are unchanged so existing artifacts stay valid
+        params = {"backend": name, **params}
+    return artifact_key(CARDIO_PATH, params, TIER1_FEATURES)
+
+
+def load_tier1_model(backend: str = None):
+    """Uncached load_or_fit of the Tier 1 artifact for `backend` (default: configured)."""
+    name = get_backend(backend).name
+    return load_or_fit(tier1_artifact_name(name), tier1_artifact_key(name),
+                       lambda: fit_tier1_model(backend=name), TIER1_FEATURES)
+
+
+@cached_resource(spinner="🫀 Loading Tier 1 Screening Model…")
+@timed("model_load.tier1")
+def train_tier1_model():
+    """Load the configured backend's Tier 1 artifact if its key matches, else retrain and save."""
+    return load_tier1_model()
+
+
+def positive_proba(model, X: np.ndarray, features: list) -> np.ndarray:
+    """
+    Class-1 probabilities for a raw feature matrix. A compiled FlatForest
+    scores the array directly; sklearn models get a named DataFrame.
+    """
+    if not isinstance(model, FlatForest):
+        X = pd.DataFrame(X, columns=features)
+    return model.predict_proba(X)[:, 1]
+
+
+def tier1_row(age, gender, height, weight, ap_hi, ap_lo,
+              cholesterol, gluc, smoke, alco, active) -> np.ndarray:
+    """Build one Tier 1 feature vector in TIER1_FEATURES order."""
+    bmi = weight / ((height / 100) ** 2)
+    return np.array([age, gender, height, weight, bmi, ap_hi, ap_lo,
+                     cholesterol, gluc, smoke, alco, active], dtype=np.float64)
+
+
+# Per-tier prediction memos: results by (model version, canonical feature
+# row), shared by all sessions in the process. Form defaults and repeat
+# submissions are common. Size via CARDIO_LENS_PREDICTION_CACHE_SIZE.
+PREDICTION_CACHE_SIZE = int(os.environ.get("CARDIO_LENS_PREDICTION_CACHE_SIZE", 4096))
+TIER1_PREDICTIONS = LRUCache(maxsize=PREDICTION_CACHE_SIZE)
+TIER2_PREDICTIONS = LRUCache(maxsize=PREDICTION_CACHE_SIZE)
+
+
+def model_version(model) -> str:
+    """
+    Cache identity of a model: the artifact version load_or_fit stamps on it
+    as version_ (compiled and packed forests carry it over). Raises
+    ValueError for a model without one; an id() would be reused by a later
+    model once this one is garbage collected.
+    """
+    version = getattr(model, "version_", None)
+    if not version:
+        raise ValueError(f"{type(model).__name__} has no version_; load models "
+                         "through serving_model() or load_or_fit()")
+    return version
+
+
+def prediction_key(model, row: np.ndarray) -> tuple:
+    """
+    Memo key for one feature row. Flattened forests compare features in
+    float32, so for them the row is keyed as float32 bytes and rows equal
+    after rounding share an entry; every other model (HistGB, logistic)
+    sees the float64 row, so it is keyed exactly.
+    """
+    dtype = np.float32 if isinstance(model, FlatForest) else np.float64
+    return model_version(model), np.asarray(row, dtype=dtype).tobytes()
+
+
+def prediction_cache_stats() -> dict:
+    """Hit/miss counters and sizes of the prediction memos, for tuning."""
+    return {"tier1": TIER1_PREDICTIONS.stats(), "tier2": TIER2_PREDICTIONS.stats()}
+
+
+@timed("predict.tier1")
 def predict_tier1(model, age, gender, height, weight, ap_hi, ap_lo,
                   cholesterol, gluc, smoke, alco, active) -> float:
-    """Return cardiovascular risk probability (0–1)."""
-    bmi = weight / ((height / 100) ** 2)
-    features = pd.DataFrame([{
-        "age_years":   age,
-        "gender":      gender,
-        "height":      height,
-        "weight":      weight,
-        "bmi":         bmi,
-        "ap_hi":       ap_hi,
-        "ap_lo":       ap_lo,
-        "cholesterol": cholesterol,
-        "gluc":        gluc,
-        "smoke":       smoke,
-        "alco":        alco,
-        "active":      active,
-    }])
-    prob = model.predict_proba(features)[0][1]
-    return float(prob)
+    """Return cardiovascular risk probability (0–1), memoised per model version."""
+    row = tier1_row(age, gender, height, weight, ap_hi, ap_lo,
+                    cholesterol, gluc, smoke, alco, active)
+    return TIER1_PREDICTIONS.get_or_compute(
+        prediction_key(model, row),
+        lambda: float(positive_proba(model, row[np.newaxis, :], TIER1_FEATURES)[0]))
 
 
+def bp_reduction_grid(age, gender, height, weight, ap_hi, ap_lo,
+                      cholesterol, gluc, smoke, alco, active,
+                      target_bp: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return (bp_range, X): systolic values target_bp..ap_hi and their feature matrix."""
+    bp_range = np.arange(target_bp, ap_hi + 1, 1)
+    row = tier1_row(age, gender, height, weight, ap_hi, ap_lo,
+                    cholesterol, gluc, smoke, alco, active)
+    X = np.tile(row, (len(bp_range), 1))
+    X[:, TIER1_FEATURES.index("ap_hi")] = bp_range
+    return bp_range, X
+
+
+def bp_reduction_frame(bp_range: np.ndarray, probs: np.ndarray) -> pd.DataFrame:
+    """Format scored BP grid as the ['Systolic BP', 'Risk (%)'] frame."""
+    if len(bp_range) == 0:
+        return pd.DataFrame(columns=["Systolic BP", "Risk (%)"])
+    return pd.DataFrame({
+        "Systolic BP": np.asarray(bp_range).tolist(),
+        "Risk (%)":    [round(p * 100, 2) for p in np.asarray(probs).tolist()],
+    })
+
+
+# Lowest systolic value on a patient's BP response curve
+BP_CURVE_MIN = 90
+
+# Full response curves by (model version, patient inputs); each is ~100 floats
+BP_CURVES = LRUCache(maxsize=2048)
+
+
+@timed("bp_response_curve")
+def bp_response_curve(model, age, gender, height, weight, ap_hi, ap_lo,
+                      cholesterol, gluc, smoke, alco, active,
+                      low: int = BP_CURVE_MIN) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return (bp_range, probs) for every systolic value low..ap_hi, scored in
+    one call and cached per model version and input set. The arrays are
+    shared between callers and read-only.
+    """
+    inputs = (age, gender, height, weight, ap_hi, ap_lo,
+              cholesterol, gluc, smoke, alco, active)
+    key = (model_version(model), low, *inputs)
+
+    def compute():
+        bp_range, X = bp_reduction_grid(*inputs, target_bp=low)
+        probs = (positive_proba(model, X, TIER1_FEATURES) if len(bp_range)
+                 else np.empty(0))
+        bp_range.setflags(write=False)
+        probs.setflags(write=False)
+        return bp_range, probs
+
+    return BP_CURVES.get_or_compute(key, compute)
+
+
+@timed("simulate_bp_reduction")
 def simulate_bp_reduction(model, age, gender, height, weight, ap_hi, ap_lo,
                            cholesterol, gluc, smoke, alco, active,
                            target_bp: int) -> pd.DataFrame:
     """
     Simulate risk across a range of systolic BP values from target_bp to ap_hi.
     Returns a DataFrame with columns ['Systolic BP', 'Risk (%)'].
+
+    The patient's whole response curve (BP_CURVE_MIN..ap_hi) is scored once
+    and cached; each target_bp just slices it, so dragging the target
+    slider costs no model evaluations.
     """
-    bmi = weight / ((height / 100) ** 2)
-    bp_range = list(range(target_bp, ap_hi + 1, 1))
-    risks = []
-    for bp in bp_range:
-        row = {
-            "age_years":   age,
-            "gender":      gender,
-            "height":      height,
-            "weight":      weight,
-            "bmi":         bmi,
-            "ap_hi":       bp,
-            "ap_lo":       ap_lo,
-            "cholesterol": cholesterol,
-            "gluc":        gluc,
-            "smoke":       smoke,
-            "alco":        alco,
-            "active":      active,
-        }
-        prob = model.predict_proba(pd.DataFrame([row]))[0][1]
-        risks.append({"Systolic BP": bp, "Risk (%)": round(prob * 100, 2)})
-    return pd.DataFrame(risks)
+    low = min(BP_CURVE_MIN, target_bp)
+    bp_range, probs = bp_response_curve(model, age, gender, height, weight, ap_hi, ap_lo,
+                                        cholesterol, gluc, smoke, alco, active, low=low)
+    start = max(0, int(target_bp - low))
+    return bp_reduction_frame(bp_range[start:], probs[start:])
+
+
+@timed("simulate_scenarios")
+def simulate_scenarios(model, base: dict, interventions: dict,
+                       years: int = 10) -> pd.DataFrame:
+    """
+    Project risk for several what-if scenarios over an age horizon.
+
+    base          — patient inputs keyed by TIER1_INPUTS
+    interventions — {scenario name: {input: new value, …}}; {} keeps the base
+    years         — horizon; ages base["age"] … base["age"] + years
+
+    Every (scenario, age) pair is scored in one model evaluation. Returns a
+    DataFrame with an 'Age' column plus one 'Risk (%)' column per scenario.
+    """
+    ages = base["age"] + np.arange(years + 1)
+    names = list(interventions)
+    rows = np.vstack([
+        tier1_row(**{**base, **interventions[name]}) for name in names
+    ])
+    # (scenario, age) grid: each scenario row repeated across the horizon
+    X = np.repeat(rows, len(ages), axis=0)
+    X[:, TIER1_FEATURES.index("age_years")] = np.tile(ages, len(names))
+    probs = positive_proba(model, X, TIER1_FEATURES).reshape(len(names), len(ages))
+    traj = pd.DataFrame({"Age": ages})
+    for name, risk in zip(names, probs):
+        traj[name] = [round(p * 100, 2) for p in risk.tolist()]
+    return traj
 
 
 # ─────────────────────────────────────────────
@@ -127,6 +416,13 @@ TIER2_FEATURES = [
     "ST_Slope_Flat", "ST_Slope_Up"
 ]
 
+TIER2_PARAMS = dict(
+    n_estimators=200,
+    max_depth=10,
+    min_samples_leaf=5,
+    random_state=42,
+)
+
 TIER2_FEATURE_LABELS = {
     "Age":               "Age",
     "RestingBP":         "Resting BP",
@@ -146,8 +442,9 @@ TIER2_FEATURE_LABELS = {
 }
 
 
-def load_and_preprocess_tier2() -> pd.DataFrame:
-    df = pd.read_csv(HEART_PATH)
+@timed("preprocess.tier2")
+def load_and_preprocess_tier2(path: str = HEART_PATH) -> pd.DataFrame:
+    df = pd.read_csv(path)
     df = df.dropna(subset=TIER2_FEATURES + ["HeartDisease"])
     # Ensure boolean columns are int (0/1) for sklearn
     bool_cols = df.select_dtypes(include="bool").columns
@@ -155,38 +452,153 @@ def load_and_preprocess_tier2() -> pd.DataFrame:
     return df
 
 
-@st.cache_resource(show_spinner="🔬 Training Tier 2 Clinical Model…")
-def train_tier2_model():
+@timed("model_train.tier2")
+def fit_tier2_model(params: dict = TIER2_PARAMS):
+    """Train the Tier 2 forest from CSV. Returns (model, accuracy)."""
     df = load_and_preprocess_tier2()
-    X = df[TIER2_FEATURES]
-    y = df["HeartDisease"]
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42, stratify=y
-    )
-    model = RandomForestClassifier(
-        n_estimators=200,
-        max_depth=10,
-        min_samples_leaf=5,
-        random_state=42,
-        n_jobs=-1
-    )
-    model.fit(X_train, y_train)
-    acc = accuracy_score(y_test, model.predict(X_test))
-    return model, acc
+    return fit_forest(df[TIER2_FEATURES], df["HeartDisease"], params)
 
 
-def predict_tier2(model, features_dict: dict) -> tuple[float, pd.Series]:
-    """
-    Returns (probability, feature_importances_series).
-    feature_importances_series is indexed by human-readable labels.
-    """
-    row = pd.DataFrame([features_dict])[TIER2_FEATURES]
-    prob = model.predict_proba(row)[0][1]
-    importances = pd.Series(
+def tier2_artifact_key() -> str:
+    return artifact_key(HEART_PATH, TIER2_PARAMS, TIER2_FEATURES)
+
+
+@cached_resource(spinner="🔬 Loading Tier 2 Clinical Model…")
+@timed("model_load.tier2")
+def train_tier2_model():
+    """Load the Tier 2 artifact if its key matches, else retrain and save."""
+    return load_or_fit("tier2", tier2_artifact_key(), fit_tier2_model, TIER2_FEATURES)
+
+
+def tier2_row(features_dict: dict) -> np.ndarray:
+    """Build one Tier 2 feature vector in TIER2_FEATURES order."""
+    return np.array([features_dict[f] for f in TIER2_FEATURES], dtype=np.float64)
+
+
+def tier2_importances(model) -> pd.Series:
+    """Global feature importances indexed by human-readable labels, ascending."""
+    return pd.Series(
         model.feature_importances_,
         index=[TIER2_FEATURE_LABELS.get(f, f) for f in TIER2_FEATURES]
     ).sort_values(ascending=True)
-    return float(prob), importances
+
+
+# Flattened forests compiled from sklearn Tier 2 models, one per model
+# object; entries go away with the model, so a recycled id() never matches
+_COMPILED = weakref.WeakKeyDictionary()
+_COMPILED_LOCK = threading.Lock()
+
+
+def flat_forest(model) -> FlatForest:
+    """`model` as a FlatForest, compiling an sklearn forest once per object."""
+    if isinstance(model, FlatForest):
+        return model
+    with _COMPILED_LOCK:
+        flat = _COMPILED.get(model)
+        if flat is None:
+            flat = _COMPILED[model] = compile_forest(model)
+    return flat
+
+
+@timed("predict.tier2")
+def predict_tier2(model, features_dict: dict) -> tuple[float, pd.Series]:
+    """
+    Returns (probability, contributions_series).
+    contributions_series holds this patient's per-feature contribution to
+    the probability (signed, 0–1 scale), indexed by human-readable labels
+    and sorted ascending. Global importances are separate: tier2_importances().
+    Memoised per model version; callers get their own copy of the series.
+    """
+    row = tier2_row(features_dict)
+
+    def compute():
+        proba, _, contrib = flat_forest(model).explain(row[np.newaxis, :])
+        contributions = pd.Series(
+            contrib[0],
+            index=[TIER2_FEATURE_LABELS.get(f, f) for f in TIER2_FEATURES]
+        ).sort_values(ascending=True)
+        return float(proba[0]), contributions
+
+    prob, contributions = TIER2_PREDICTIONS.get_or_compute(
+        prediction_key(model, row), compute)
+    return prob, contributions.copy()
+
+
+# ─────────────────────────────────────────────
+# PACKED SERVING FORESTS
+# ─────────────────────────────────────────────
+
+_TIERS = {
+    1: (tier1_artifact_name, tier1_artifact_key, fit_tier1_model, TIER1_FEATURES),
+    2: (lambda: "tier2", tier2_artifact_key, fit_tier2_model, TIER2_FEATURES),
+}
+
+
+@cached_resource(spinner="🫀 Mapping packed models…")
+@timed("model_load.packed")
+def serving_forest(tier: int):
+    """
+    Return (FlatForest, accuracy) memory-mapped from the packed export of
+    the tier's artifact, packing it first if the export is missing or was
+    built from a different artifact file. Every process maps the same
+    read-only pages, so replicas no longer each hold a full sklearn forest.
+    Raises ValueError if Tier 1 is configured with a non-forest backend.
+    """
+    if tier == 1 and not get_backend().compiles:
+        raise ValueError(f"the {get_backend().name} backend cannot be packed; "
+                         "use serving_model(1)")
+    name_fn, key_fn, fit, features = _TIERS[tier]
+    name, key = name_fn(), key_fn()
+    directory = packed_path(name, key)
+    meta = read_packed_meta(directory) if directory else None
+    if meta is None or meta.get("key") != key:
+        model, acc = load_or_fit(name, key, fit, features)
+        directory = packed_path(name, key)      # the artifact may be new
+        pack_forest(compile_forest(model), directory, key=key, accuracy=acc)
+        prune_directory(os.path.dirname(directory), keep=directory)
+        meta = read_packed_meta(directory)
+    return load_packed(directory), meta["accuracy"]
+
+
+def serving_model(tier: int):
+    """
+    (model, accuracy) to serve for a tier: the packed forest when the tier's
+    backend is a forest, otherwise the fitted estimator from its artifact.
+    Both expose predict_proba, so callers need not care which they got.
+    """
+    if tier == 1 and not get_backend().compiles:
+        return train_tier1_model()
+    return serving_forest(tier)
+
+
+# ─────────────────────────────────────────────
+# SHARED TRAIN / TEST SPLITS
+# ─────────────────────────────────────────────
+
+def split_stores(tier: int) -> dict:
+    """
+    The 80/20 split fit_forest uses, cached as memory-mappable FeatureStores
+    ({"train": …, "test": …}) so tools can reuse it without re-splitting.
+    Rebuilt only when the tier's source CSV changes.
+    """
+    from sklearn.model_selection import train_test_split
+
+    features, source = ((TIER1_FEATURES, CARDIO_PATH) if tier == 1
+                        else (TIER2_FEATURES, HEART_PATH))
+    stores = {part: FeatureStore(os.path.join(FEATURE_CACHE_DIR, f"tier{tier}_{part}"), source)
+              for part in ("train", "test")}
+    if not all(s.is_fresh(features) for s in stores.values()):
+        if tier == 1:
+            X, y = load_tier1_matrix()
+        else:
+            df = load_and_preprocess_tier2()
+            X, y = df[TIER2_FEATURES].to_numpy(), df["HeartDisease"].to_numpy()
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=0.2, random_state=42, stratify=y
+        )
+        stores["train"].write(X_train, y_train, features)
+        stores["test"].write(X_test, y_test, features)
+    return stores
 
 
 # ─────────────────────────────────────────────
@@ -194,9 +606,13 @@ def predict_tier2(model, features_dict: dict) -> tuple[float, pd.Series]:
 # ─────────────────────────────────────────────
 if __name__ == "__main__":
     print("Testing Tier 1 pipeline…")
-    df1 = load_and_preprocess_tier1()
-    print(f"  Tier 1 records after cleaning: {len(df1):,}")
-    print(f"  Cardio prevalence: {df1['cardio'].mean():.1%}")
+    stats = stream_preprocess_tier1(tier1_store())
+    X1, y1 = load_tier1_matrix()
+    print(f"  Tier 1 records after cleaning: {len(y1):,} of {stats['rows_in']:,} "
+          f"({stats['chunks']} chunks)")
+    for name, n in stats["rejected"].items():
+        print(f"    rejected by {name}: {n:,}")
+    print(f"  Cardio prevalence: {y1.mean():.1%}")
 
     print("\nTesting Tier 2 pipeline…")
     df2 = load_and_preprocess_tier2()
@@ -0,0 +1,153 @@
+"""
+batch_score.py — Cardio-Lens Offline Tier 1 Batch Scorer
+Streams a cardio_base-format file in fixed-size chunks and scores them
+across a process pool.
+
+Usage:
+    python batch_score.py patients.csv scores.csv --chunksize 50000 --workers 4
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from backend import TIER1_FEATURES, add_tier1_derived, train_tier1_model
+
+# Loaded once in the parent. Forked workers inherit it copy-on-write, so the
+# pool shares a single in-memory model instead of loading one per process.
+# This is the fitted estimator, not the packed serving forest: on 50k-row
+# chunks sklearn's compiled tree walk is ~3× faster than the NumPy one, which
+# is only the better choice for single-row latency.
+_MODEL = None
+
+
+def _load_model():
+    global _MODEL
+    if _MODEL is None:
+        model, _ = train_tier1_model()
+        if "n_jobs" in model.get_params():
+            # Each worker is already one core; nested joblib threads only contend
+            model.set_params(n_jobs=1)
+        _MODEL = model
+    return _MODEL
+
+
+def score_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Derive Tier 1 features for a raw chunk and return id + risk."""
+    chunk = add_tier1_derived(chunk)
+    X = chunk[TIER1_FEATURES]
+    valid = X.notna().all(axis=1).to_numpy()
+    risk = np.full(len(chunk), np.nan)
+    if valid.any():
+        risk[valid] = _load_model().predict_proba(X[valid])[:, 1]
+    out = pd.DataFrame({"risk": risk}, index=chunk.index)
+    if "id" in chunk.columns:
+        out.insert(0, "id", chunk["id"].to_numpy())
+    return out
+
+
+# ─────────────────────────────────────────────
+# OUTPUT WRITERS
+# ─────────────────────────────────────────────
+
+class _CsvWriter:
+    def __init__(self, path, sep):
+        self.path, self.sep, self.header = path, sep, True
+
+    def write(self, df):
+        df.to_csv(self.path, sep=self.sep, index=False,
+                  mode="w" if self.header else "a", header=self.header)
+        self.header = False
+
+    def close(self):
+        if self.header:  # no rows at all — still leave a valid header
+            pd.DataFrame(columns=["id", "risk"]).to_csv(self.path, index=False, sep=self.sep)
+
+
+class _ParquetWriter:
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            sys.exit("Parquet output needs pyarrow: pip install pyarrow")
+        self.pa, self.pq, self.path, self.writer = pa, pq, path, None
+
+    def write(self, df):
+        table = self.pa.Table.from_pandas(df, preserve_index=False)
+        if self.writer is None:
+            self.writer = self.pq.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def _open_writer(path, sep):
+    if path.endswith(".parquet"):
+        return _ParquetWriter(path)
+    return _CsvWriter(path, sep)
+
+
+# ─────────────────────────────────────────────
+# DRIVER
+# ─────────────────────────────────────────────
+
+def score_file(input_path: str, output_path: str, chunksize: int = 50_000,
+               workers: int = None, sep: str = ";", out_sep: str = ",") -> int:
+    """
+    Score `input_path` chunk by chunk and write results to `output_path`.
+    At most 2 × workers chunks are in flight, so memory is bounded by the
+    chunk size rather than the file size. Returns the number of rows scored.
+    """
+    workers = workers or os.cpu_count() or 1
+    _load_model()
+    ctx = mp.get_context("fork") if "fork" in mp.get_all_start_methods() else None
+    writer = _open_writer(output_path, out_sep)
+    rows = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                 initializer=_load_model) as pool:
+            pending = deque()
+            for chunk in pd.read_csv(input_path, sep=sep, chunksize=chunksize):
+                pending.append(pool.submit(score_chunk, chunk))
+                if len(pending) >= 2 * workers:
+                    result = pending.popleft().result()
+                    writer.write(result)
+                    rows += len(result)
+            while pending:
+                result = pending.popleft().result()
+                writer.write(result)
+                rows += len(result)
+    finally:
+        writer.close()
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch-score Tier 1 patients.")
+    parser.add_argument("input", help="semicolon-separated file in cardio_base.csv format")
+    parser.add_argument("output", help="output .csv or .parquet path")
+    parser.add_argument("--chunksize", type=int, default=50_000)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="process count (default: all cores)")
+    parser.add_argument("--sep", default=";", help="input delimiter (default ';')")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    rows = score_file(args.input, args.output, args.chunksize, args.workers, args.sep)
+    elapsed = time.perf_counter() - t0
+    print(f"Scored {rows:,} rows in {elapsed:.1f}s "
+          f"({rows / max(elapsed, 1e-9):,.0f} rows/s) → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+benchmarks.py — Cardio-Lens Backend Benchmark Suite
+Times the backend hot paths across a range of input sizes and reports
+p50 / p95 latency and throughput. Results are JSON, so two runs can be
+diffed between commits.
+
+Usage:
+    python benchmarks.py --out bench.json
+    python benchmarks.py --quick --only predict,simulate
+    python benchmarks.py --out new.json --compare old.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+import backend
+from backend import (
+    CARDIO_PATH, HEART_PATH, TIER1_FEATURES, TIER1_PARAMS, TIER2_FEATURES,
+    TIER2_PARAMS, fit_forest, load_and_preprocess_tier1,
+    load_and_preprocess_tier2, predict_tier1, predict_tier2,
+    simulate_bp_reduction, simulate_scenarios, train_tier1_model,
+    train_tier2_model,
+)
+from fast_forest import compile_forest
+from model_backends import get_backend
+
+PATIENT = dict(age=52, gender=2, height=172, weight=88.0, ap_hi=150, ap_lo=92,
+               cholesterol=2, gluc=1, smoke=1, alco=0, active=0)
+CLINICAL = dict(zip(TIER2_FEATURES, [55, 140, 250, 0, 130, 1.5, 1, 0, 0, 0, 1, 0, 1, 1, 0]))
+TWIN_GOALS = dict(weight=78.0, ap_hi=120, cholesterol=1, gluc=1, smoke=0, alco=0, active=1)
+
+
+# ─────────────────────────────────────────────
+# TIMING
+# ─────────────────────────────────────────────
+
+def measure(fn, repeats: int, warmup: int = 1) -> np.ndarray:
+    """Run fn `warmup` + `repeats` times; return the timed runs in ms."""
+    for _ in range(warmup):
+        fn()
+    times = np.empty(repeats)
+    for i in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        times[i] = (time.perf_counter() - t0) * 1e3
+    return times
+
+
+def summarise(name: str, size: int, unit: str, times: np.ndarray) -> dict:
+    p50 = float(np.percentile(times, 50))
+    return {
+        "name":       name,
+        "size":       size,
+        "unit":       unit,
+        "repeats":    len(times),
+        "p50_ms":     round(p50, 4),
+        "p95_ms":     round(float(np.percentile(times, 95)), 4),
+        "throughput": round(size / (p50 / 1e3), 1) if p50 > 0 else None,
+    }
+
+
+# ─────────────────────────────────────────────
+# CASES
+# ─────────────────────────────────────────────
+
+def _csv_subset(src: str, rows: int, sep: str, tmpdir: str) -> str:
+    path = os.path.join(tmpdir, f"{rows}_{os.path.basename(src)}")
+    pd.read_csv(src, sep=sep, nrows=rows).to_csv(path, sep=sep, index=False)
+    return path
+
+
+def bench_load(cfg):
+    out = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in cfg["load_rows"]:
+            path = _csv_subset(CARDIO_PATH, rows, ";", tmp)
+            t = measure(lambda: load_and_preprocess_tier1(path), cfg["repeats"])
+            out.append(summarise("load_and_preprocess_tier1", rows, "rows", t))
+        n2 = len(pd.read_csv(HEART_PATH))
+        for rows in sorted({min(r, n2) for r in cfg["load_rows"]}):
+            path = _csv_subset(HEART_PATH, rows, ",", tmp)
+            t = measure(lambda: load_and_preprocess_tier2(path), cfg["repeats"])
+            out.append(summarise("load_and_preprocess_tier2", rows, "rows", t))
+    return out
+
+
+def bench_train(cfg):
+    out = []
+    df1 = load_and_preprocess_tier1()
+    for rows in cfg["train_rows"]:
+        sub = df1.sample(min(rows, len(df1)), random_state=0)
+        t = measure(lambda: fit_forest(sub[TIER1_FEATURES], sub["cardio"], TIER1_PARAMS),
+                    cfg["train_repeats"], warmup=0)
+        out.append(summarise("train_tier1_model", len(sub), "rows", t))
+    df2 = load_and_preprocess_tier2()
+    t = measure(lambda: fit_forest(df2[TIER2_FEATURES], df2["HeartDisease"], TIER2_PARAMS),
+                cfg["train_repeats"], warmup=0)
+    out.append(summarise("train_tier2_model", len(df2), "rows", t))
+    return out
+
+
+def _engines(model, compiles: bool = True):
+    if not compiles:
+        return (("sklearn", model),)
+    return (("sklearn", model), ("flat", compile_forest(model)))
+
+
+def bench_predict(cfg):
+    out = []
+    m1, _ = train_tier1_model()
+    m2, _ = train_tier2_model()
+    # Cold timings clear the prediction memos on every call; warm ones hit them
+    for engine, model in _engines(m1, get_backend().compiles):
+        t = measure(lambda: (backend.TIER1_PREDICTIONS.clear(),
+                             predict_tier1(model, **PATIENT)), cfg["repeats"])
+        out.append(summarise(f"predict_tier1[{engine}]", 1, "rows", t))
+        t = measure(lambda: predict_tier1(model, **PATIENT), cfg["repeats"])
+        out.append(summarise(f"predict_tier1_cached[{engine}]", 1, "rows", t))
+    # Tier 2 always explains through the flattened forest; compiling it from
+    # the sklearn model is a one-off per model, timed on its own
+    t = measure(lambda: compile_forest(m2), max(3, cfg["repeats"] // 20), warmup=0)
+    out.append(summarise("compile_forest[tier2]", 1, "models", t))
+    flat2 = compile_forest(m2)
+    t = measure(lambda: (backend.TIER2_PREDICTIONS.clear(),
+                         predict_tier2(flat2, CLINICAL)), cfg["repeats"])
+    out.append(summarise("predict_tier2[flat]", 1, "rows", t))
+    t = measure(lambda: predict_tier2(flat2, CLINICAL), cfg["repeats"])
+    out.append(summarise("predict_tier2_cached[flat]", 1, "rows", t))
+    return out
+
+
+def bench_simulate(cfg):
+    out = []
+    m1, _ = train_tier1_model()
+    for engine, model in _engines(m1, get_backend().compiles):
+        for span in cfg["bp_spans"]:
+            patient = dict(PATIENT, ap_hi=90 + span)
+            # Cold: the response curve is rescored on every call
+            t = measure(lambda: (backend.BP_CURVES.clear(),
+                                 simulate_bp_reduction(model, **patient, target_bp=90)),
+                        cfg["repeats"])
+            out.append(summarise(f"simulate_bp_reduction[{engine}]", span + 1, "bp_values", t))
+            # Warm: a slider move only slices the cached curve
+            t = measure(lambda: simulate_bp_reduction(model, **patient, target_bp=90 + span // 2),
+                        cfg["repeats"])
+            out.append(summarise(f"simulate_bp_reduction_cached[{engine}]", span + 1,
+                                 "bp_values", t))
+    return out
+
+
+def bench_twin(cfg):
+    out = []
+    m1, _ = train_tier1_model()
+    scenarios = {"Current Path": {}, "Healthy Twin": TWIN_GOALS}
+    for engine, model in _engines(m1, get_backend().compiles):
+        for years in cfg["twin_years"]:
+            t = measure(lambda: simulate_scenarios(model, PATIENT, scenarios, years),
+                        cfg["repeats"])
+            out.append(summarise(f"health_twin_trajectory[{engine}]",
+                                 len(scenarios) * (years + 1), "predictions", t))
+    return out
+
+
+SUITES = {
+    "load":     bench_load,
+    "train":    bench_train,
+    "predict":  bench_predict,
+    "simulate": bench_simulate,
+    "twin":     bench_twin,
+}
+
+FULL = dict(repeats=50, train_repeats=3, load_rows=[1_000, 10_000, 70_000],
+            train_rows=[5_000, 20_000, 70_000], bp_spans=[10, 50, 110],
+            twin_years=[10, 20, 30])
+QUICK = dict(repeats=10, train_repeats=1, load_rows=[1_000, 10_000],
+             train_rows=[5_000], bp_spans=[10, 110], twin_years=[10, 30])
+
+
+# ─────────────────────────────────────────────
+# REPORTING
+# ─────────────────────────────────────────────
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                capture_output=True, text=True,
+                                cwd=backend.BASE_DIR).stdout.strip() or None
+    except OSError:
+        commit = None
+    import sklearn
+    return {
+        "commit":  commit,
+        "time":    time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python":  platform.python_version(),
+        "numpy":   np.__version__,
+        "pandas":  pd.__version__,
+        "sklearn": sklearn.__version__,
+        "cpus":    os.cpu_count(),
+    }
+
+
+def compare(results: list, baseline_path: str):
+    with open(baseline_path) as f:
+        baseline = {(r["name"], r["size"]): r for r in json.load(f)["results"]}
+    print(f"\nvs {baseline_path} (p50 ratio, <1 is faster):")
+    for r in results:
+        old = baseline.get((r["name"], r["size"]))
+        if old and old["p50_ms"]:
+            print(f"  {r['name']:<40} {r['size']:>7}  {r['p50_ms'] / old['p50_ms']:6.2f}×")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Cardio-Lens backend hot paths.")
+    parser.add_argument("--out", help="write results as JSON to this path")
+    parser.add_argument("--only", help=f"comma-separated subset of: {', '.join(SUITES)}")
+    parser.add_argument("--quick", action="store_true", help="fewer sizes and repeats")
+    parser.add_argument("--compare", help="baseline JSON from an earlier run")
+    args = parser.parse_args(argv)
+
+    cfg = QUICK if args.quick else FULL
+    names = args.only.split(",") if args.only else list(SUITES)
+    unknown = set(names) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(sorted(unknown))}")
+
+    np.random.seed(0)
+    results = []
+    for name in names:
+        print(f"Running {name}…", file=sys.stderr)
+        for r in SUITES[name](cfg):
+            results.append(r)
+            print(f"  {r['name']:<40} {r['size']:>7} {r['unit']:<11} "
+                  f"p50 {r['p50_ms']:9.3f} ms  p95 {r['p95_ms']:9.3f} ms  "
+                  f"{r['throughput'] or 0:>12,.0f} {r['unit']}/s")
+
+    report = {"environment": environment(), "config": cfg, "results": results}
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.out}", file=sys.stderr)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
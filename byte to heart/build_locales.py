@@ -0,0 +1,130 @@
+"""
+build_locales.py — Cardio-Lens Locale Bundle Builder
+Extracts every UI string wrapped in t("...") or N_("...") (and the options
+of widgets rendered with format_func=t) from app.py, plus the Tier 2
+feature labels, translates them in bulk through DTPS, and writes one bundle
+per language to locales/<lang>.json.
+
+Usage:
+    GEMINI_API_KEY=... python build_locales.py --languages es fr de hi
+"""
+
+import argparse
+import ast
+import json
+import os
+import string
+import sys
+import tempfile
+
+from i18n import BASE_DIR, LOCALE_DIR, SOURCE_LANGUAGE, bundle_path
+
+APP_PATH = os.path.join(BASE_DIR, "app.py")
+
+# DTPS.py lives at the repository root, one level above the app
+sys.path.insert(0, os.path.dirname(BASE_DIR))
+
+
+# ─────────────────────────────────────────────
+# EXTRACTION
+# ─────────────────────────────────────────────
+
+def _is_t(node) -> bool:
+    return isinstance(node, ast.Name) and node.id in ("t", "N_")
+
+
+def _constants(node):
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        yield node.value
+    elif isinstance(node, (ast.List, ast.Tuple)):
+        for elt in node.elts:
+            yield from _constants(elt)
+
+
+def extract_strings(path: str = APP_PATH) -> list:
+    """Sorted unique UI strings in `path`, plus the Tier 2 feature labels."""
+    from backend import TIER2_FEATURE_LABELS
+
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    found = set(TIER2_FEATURE_LABELS.values())
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        if _is_t(node.func) and node.args:
+            found.update(_constants(node.args[0]))
+        elif any(kw.arg == "format_func" and _is_t(kw.value) for kw in node.keywords):
+            options = node.args[1] if len(node.args) > 1 else next(
+                (kw.value for kw in node.keywords if kw.arg == "options"), None)
+            if options is not None:
+                found.update(_constants(options))
+    return sorted(s for s in found if s.strip())
+
+
+def _placeholders(text: str) -> set:
+    return {name for _, name, _, _ in string.Formatter().parse(text) if name is not None}
+
+
+# ─────────────────────────────────────────────
+# BUILD
+# ─────────────────────────────────────────────
+
+def _write_bundle(lang: str, strings: dict):
+    os.makedirs(LOCALE_DIR, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=LOCALE_DIR, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump({"language": lang, "strings": strings}, f,
+                  ensure_ascii=False, indent=1, sort_keys=True)
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, bundle_path(lang))
+
+
+def build(languages: list, **client_options) -> dict:
+    """
+    Translate every extracted string into each language and write the
+    bundles. Translations that drop or invent {placeholders} are left out,
+    so the app falls back to English for them. Returns per-language counts.
+    """
+    from DTPS import translate_many
+
+    texts = extract_strings()
+    languages = [lang for lang in languages if lang != SOURCE_LANGUAGE]
+    results = translate_many(texts, languages, **client_options)
+
+    report = {}
+    for lang in languages:
+        strings, rejected = {}, 0
+        for text, translated in zip(texts, results[lang]):
+            if translated is None:
+                continue
+            if _placeholders(translated) != _placeholders(text):
+                rejected += 1
+                continue
+            strings[text] = translated
+        _write_bundle(lang, strings)
+        report[lang] = {"strings": len(texts), "translated": len(strings),
+                        "rejected": rejected}
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the app's locale bundles.")
+    parser.add_argument("--languages", nargs="+", default=["es", "fr", "de", "hi"])
+    parser.add_argument("--list", action="store_true",
+                        help="print the extracted strings and exit")
+    parser.add_argument("--max-in-flight", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for text in extract_strings():
+            print(repr(text))
+        return
+
+    report = build(args.languages, max_in_flight=args.max_in_flight)
+    for lang, r in report.items():
+        print(f"{lang}: {r['translated']}/{r['strings']} strings "
+              f"({r['rejected']} rejected for placeholder mismatch) → {bundle_path(lang)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+cohort.py — Cardio-Lens Cohort Risk Index
+Scores every cleaned cardio_base record once per Tier 1 model version and
+keeps the risks sorted, overall and within age/gender strata, so a
+patient's percentile is a few binary searches instead of a 70k-row rescore.
+
+One index directory per model version, models/tier1_cohort/<version>/
+(memory-mapped on load):
+    risk.npy          float32 risks, ascending
+    stratum.npy       int16 stratum code per record, ascending
+    stratum_risk.npy  float32 risks ordered by (stratum, risk)
+    age.npy           age in years, same order as stratum_risk
+    gender.npy        gender (1 = female, 2 = male), same order
+    meta.json         model version, row count and age bands
+
+The app builds the index in its background Tier 1 loader, so no request
+waits for it; once a new version is installed, the other versions' indexes
+are removed.
+
+Usage:
+    python cohort.py            build the index for the model the app serves
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from backend import TIER1_FEATURES, load_tier1_matrix, model_version, positive_proba
+from model_store import ARTIFACT_DIR, install_directory, prune_directory
+
+COHORT_DIR = os.path.join(ARTIFACT_DIR, "tier1_cohort")
+COHORT_FORMAT = 1
+
+# Records scored per model call while building, so the build's working set
+# stays a few MB rather than scaling with the cohort
+COHORT_BLOCK_ROWS = 4096
+
+# Lower edges of the age bands after the first: <40, 40–49, 50–59, 60+
+AGE_BANDS = (40, 50, 60)
+
+_ARRAYS = ("risk", "stratum", "stratum_risk", "age", "gender")
+
+
+# ─────────────────────────────────────────────
+# STRATA
+# ─────────────────────────────────────────────
+
+def stratum_code(age, gender):
+    """Age band index × 10 + gender; works on scalars and arrays."""
+    band = np.searchsorted(AGE_BANDS, age, side="right")
+    return (band * 10 + np.asarray(gender, dtype=np.int64)).astype(np.int16)
+
+
+def age_band_label(age) -> str:
+    band = int(np.searchsorted(AGE_BANDS, age, side="right"))
+    if band == 0:
+        return f"<{AGE_BANDS[0]}"
+    if band == len(AGE_BANDS):
+        return f"{AGE_BANDS[-1]}+"
+    return f"{AGE_BANDS[band - 1]}–{AGE_BANDS[band] - 1}"
+
+
+# ─────────────────────────────────────────────
+# BUILD
+# ─────────────────────────────────────────────
+
+def cohort_dir(version: str, root: str = COHORT_DIR) -> str:
+    """Index directory for one model version."""
+    return os.path.join(root, version)
+
+
+def build_cohort_index(model, root: str = COHORT_DIR) -> str:
+    """
+    Score the cleaned Tier 1 matrix with `model` (in COHORT_BLOCK_ROWS row
+    blocks) and write the sorted index to the model version's directory.
+    It is built under a temporary name and renamed into place in one step;
+    if a concurrent builder installed the same version first, that copy is
+    kept. Indexes of other versions are then removed. Returns the directory.
+    """
+    version = model_version(model)
+    directory = cohort_dir(version, root)
+    X, _ = load_tier1_matrix()
+    risk = np.empty(len(X), dtype=np.float32)
+    for start in range(0, len(X), COHORT_BLOCK_ROWS):
+        block = np.asarray(X[start:start + COHORT_BLOCK_ROWS], dtype=np.float64)
+        risk[start:start + len(block)] = positive_proba(model, block, TIER1_FEATURES)
+
+    age = np.asarray(X[:, TIER1_FEATURES.index("age_years")], dtype=np.float32)
+    gender = np.asarray(X[:, TIER1_FEATURES.index("gender")], dtype=np.int8)
+    stratum = stratum_code(age, gender)
+    order = np.lexsort((risk, stratum))
+    arrays = {
+        "risk":         np.sort(risk),
+        "stratum":      stratum[order],
+        "stratum_risk": risk[order],
+        "age":          age[order],
+        "gender":       gender[order],
+    }
+    meta = {
+        "format":    COHORT_FORMAT,
+        "version":   version,
+        "rows":      int(len(risk)),
+        "age_bands": list(AGE_BANDS),
+    }
+
+    os.makedirs(root, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=root, prefix=".build-", suffix=".tmp")
+    try:
+        for name, arr in arrays.items():
+            np.save(os.path.join(tmp, f"{name}.npy"), arr)
+        with open(os.path.join(tmp, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        os.chmod(tmp, 0o755)
+        # Only a missing, partial or outdated target is replaced; a usable
+        # index for this version is never touched under a reader
+        install_directory(tmp, directory, lambda d: _usable(read_cohort_meta(d)))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    prune_directory(root, keep=directory)
+    return directory
+
+
+def _usable(meta) -> bool:
+    return meta is not None and meta["age_bands"] == list(AGE_BANDS)
+
+
+def read_cohort_meta(directory: str = COHORT_DIR):
+    """meta.json of a cohort index, or None if missing or another format."""
+    try:
+        with open(os.path.join(directory, "meta.json")) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get("format") == COHORT_FORMAT else None
+
+
+# ─────────────────────────────────────────────
+# LOOKUP
+# ─────────────────────────────────────────────
+
+def _percentile(sorted_risk: np.ndarray, risk: np.float32) -> float:
+    """Share of `sorted_risk` below `risk`, counting ties as half, in %."""
+    lo = np.searchsorted(sorted_risk, risk, side="left")
+    hi = np.searchsorted(sorted_risk, risk, side="right")
+    return float((lo + hi) / 2 / len(sorted_risk) * 100)
+
+
+class CohortIndex:
+    """
+    Read-only, memory-mapped cohort index for one model version. Raises
+    FileNotFoundError if the directory holds no usable index, and
+    ValueError if it was built for a different version than `version`.
+    """
+
+    def __init__(self, directory: str, version: str = None):
+        meta = read_cohort_meta(directory)
+        if meta is None:
+            raise FileNotFoundError(f"no cohort index in {directory}")
+        if tuple(meta["age_bands"]) != AGE_BANDS:
+            raise FileNotFoundError(f"cohort index in {directory} uses other age bands")
+        if version is not None and meta["version"] != version:
+            raise ValueError(f"cohort index in {directory} is for model "
+                             f"{meta['version']}, not {version}")
+        self.version = meta["version"]
+        self.rows = meta["rows"]
+        for name in _ARRAYS:
+            setattr(self, name, np.load(os.path.join(directory, f"{name}.npy"),
+                                        mmap_mode="r"))
+
+    def percentile(self, risk: float, age: float, gender: int) -> dict:
+        """
+        Percentile of `risk` in the whole cohort and in the patient's
+        age/gender stratum: O(log n) binary searches over the sorted arrays.
+        """
+        risk = np.float32(risk)
+        code = stratum_code(age, gender)
+        lo = np.searchsorted(self.stratum, code, side="left")
+        hi = np.searchsorted(self.stratum, code, side="right")
+        return {
+            "overall":      _percentile(self.risk, risk),
+            "stratum":      _percentile(self.stratum_risk[lo:hi], risk) if hi > lo else None,
+            "stratum_size": int(hi - lo),
+            "cohort_size":  self.rows,
+            "age_band":     age_band_label(age),
+        }
+
+
+def load_cohort_index(model, root: str = COHORT_DIR) -> CohortIndex:
+    """The cohort index for `model`'s version, building it first if needed."""
+    version = model_version(model)
+    directory = cohort_dir(version, root)
+    if not _usable(read_cohort_meta(directory)):
+        build_cohort_index(model, root)
+    return CohortIndex(directory, version)
+
+
+def main(argv=None):
+    from backend import serving_model
+    from compression import load_compressed
+
+    parser = argparse.ArgumentParser(description="Build the Tier 1 cohort risk index.")
+    parser.parse_args(argv)
+    # The same model the app serves: the compressed forest when one matches
+    model, _ = serving_model(1)
+    model, _ = load_compressed(model) or (model, None)
+    index = load_cohort_index(model)
+    print(f"Cohort index for model {index.version}: {index.rows:,} records → "
+          f"{cohort_dir(index.version)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+compression.py — Cardio-Lens Forest Compression
+Shrinks the Tier 1 forest for serving: keeps the smallest subset of trees
+that stays within an accuracy tolerance and a probability-drift bound. The
+result is a FlatForest saved as the "tier1_compressed" artifact, tied to the
+exact model version it came from, and only if it also holds both bounds on
+held-out rows that played no part in selecting it. It is served like the
+full forest: packed and memory-mapped read-only.
+
+Usage:
+    python compression.py --tolerance 0.002 --max-drift 0.01
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from backend import TIER1_FEATURES, load_tier1_model, split_stores
+from fast_forest import (FlatForest, compile_forest, load_packed, pack_forest,
+                         read_packed_meta)
+from model_store import load_artifact, packed_path, prune_directory, save_artifact
+
+ARTIFACT_NAME = "tier1_compressed"
+
+
+# ─────────────────────────────────────────────
+# TREE SELECTION
+# ─────────────────────────────────────────────
+
+def _per_tree_proba(flat: FlatForest, X) -> np.ndarray:
+    """Class-1 probability of every tree for every row, shape (n_trees, n_rows)."""
+    return flat.value[flat.apply(X), 1].T
+
+
+def select_trees(per_tree: np.ndarray, y: np.ndarray, target_acc: float,
+                 max_drift: float) -> list:
+    """
+    Greedy forward selection: repeatedly add the tree that brings the
+    averaged subset's probabilities closest to the full forest's, stopping
+    at the first subset that reaches `target_acc` accuracy with a mean
+    absolute probability drift ≤ `max_drift`. The app shows risk
+    percentages, so matching probabilities matters, not just the 0.5 cut.
+    Returns the chosen tree indices in forest order.
+    """
+    n_trees = per_tree.shape[0]
+    reference = per_tree.mean(axis=0)
+    chosen, running = [], np.zeros(per_tree.shape[1])
+    remaining = np.ones(n_trees, dtype=bool)
+    while remaining.any():
+        k = len(chosen) + 1
+        candidates = (running + per_tree) / k                  # (n_trees, n_rows)
+        drift = np.abs(candidates - reference).mean(axis=1)
+        drift[~remaining] = np.inf
+        best = int(np.argmin(drift))
+        chosen.append(best)
+        remaining[best] = False
+        running += per_tree[best]
+        acc = ((candidates[best] > 0.5) == y).mean()
+        if acc >= target_acc and drift[best] <= max_drift:
+            break
+    return sorted(chosen)
+
+
+def keep_trees(flat: FlatForest, trees: list) -> FlatForest:
+    """A FlatForest of just the given trees, in the given order."""
+    bounds = np.append(np.asarray(flat.roots, dtype=np.intp), flat.n_nodes)
+    trees = np.asarray(trees, dtype=np.intp)
+    starts, sizes = bounds[trees], bounds[trees + 1] - bounds[trees]
+    roots = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.intp)
+    nodes = np.concatenate([np.arange(a, a + n) for a, n in zip(starts, sizes)])
+    # Child pointers move by each tree's change of node offset
+    shift = np.repeat(roots - starts, sizes)
+    return FlatForest(
+        feature=np.asarray(flat.feature, dtype=np.intp)[nodes],
+        threshold=np.asarray(flat.threshold)[nodes],
+        left=np.asarray(flat.left, dtype=np.intp)[nodes] + shift,
+        right=np.asarray(flat.right, dtype=np.intp)[nodes] + shift,
+        value=np.asarray(flat.value)[nodes],
+        roots=roots,
+        max_depth=flat.max_depth,
+        classes=flat.classes_,
+        n_features=flat.n_features,
+        feature_names=flat.feature_names_in_,
+        feature_importances=flat.feature_importances_,
+        version=f"{flat.version_}-compressed",
+    )
+
+
+# ─────────────────────────────────────────────
+# DRIVER
+# ─────────────────────────────────────────────
+
+def _accuracy(flat: FlatForest, X, y) -> float:
+    return float(((flat.predict_proba(X)[:, 1] > 0.5) == y).mean())
+
+
+def _single_row_ms(flat: FlatForest, row, repeats: int = 300) -> float:
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        flat.predict_proba(row)
+        times.append(time.perf_counter() - t0)
+    return float(np.median(times) * 1e3)
+
+
+def _nbytes(flat: FlatForest) -> int:
+    return sum(a.nbytes for a in (flat.feature, flat.threshold, flat.left,
+                                  flat.right, flat.value, flat.roots))
+
+
+def _select(full: FlatForest, X, y, tolerance: float, max_drift: float) -> FlatForest:
+    """
+    The fewest trees that, on (X, y), lose at most `tolerance` accuracy and
+    keep mean probability drift ≤ `max_drift` against the full forest.
+    """
+    target = _accuracy(full, X, y) - tolerance
+    return keep_trees(full, select_trees(_per_tree_proba(full, X), y, target, max_drift))
+
+
+def _pack(artifact: dict) -> str:
+    """Pack a compressed artifact for serving and drop older exports."""
+    directory = packed_path(ARTIFACT_NAME, artifact["key"])
+    pack_forest(artifact["model"], directory, key=artifact["key"],
+                accuracy=artifact["accuracy"])
+    prune_directory(os.path.dirname(directory), keep=directory)
+    return directory
+
+
+def compress_tier1(tolerance: float = 0.002, max_drift: float = 0.01,
+                   max_rounds: int = 6) -> dict:
+    """
+    Compress the current Tier 1 model and save it as a servable artifact.
+
+    The held-out 20% split is halved: one half drives tree selection, the
+    other half checks the result. If the check half misses either bound,
+    selection reruns with both bounds halved, up to `max_rounds` times; a
+    model that never passes is not saved.
+    tolerance — maximum accuracy drop allowed on both halves
+    max_drift — maximum mean |probability − full forest probability|
+    Returns the report; report["saved"] says whether the artifact was written.
+    """
+    model, _ = load_tier1_model("random_forest")
+    full = compile_forest(model)
+    X_test, y_test, _ = split_stores(1)["test"].load()
+    half = len(y_test) // 2
+    X_sel, y_sel = np.asarray(X_test[:half]), np.asarray(y_test[:half])
+    X_rep, y_rep = np.asarray(X_test[half:]), np.asarray(y_test[half:])
+
+    acc_before = _accuracy(full, X_rep, y_rep)
+    p_rep = full.predict_proba(X_rep)[:, 1]
+    sel_tolerance, sel_drift = tolerance, max_drift
+    for rounds in range(1, max_rounds + 1):
+        compressed = _select(full, X_sel, y_sel, sel_tolerance, sel_drift)
+        acc_after = _accuracy(compressed, X_rep, y_rep)
+        drift = float(np.abs(compressed.predict_proba(X_rep)[:, 1] - p_rep).mean())
+        passed = acc_before - acc_after <= tolerance and drift <= max_drift
+        if passed:
+            break
+        sel_tolerance, sel_drift = sel_tolerance / 2, sel_drift / 2
+
+    row = X_rep[:1].astype(np.float64)
+    report = {
+        "trees_before":     full.n_estimators,
+        "trees_after":      compressed.n_estimators,
+        "nodes_before":     full.n_nodes,
+        "nodes_after":      compressed.n_nodes,
+        "bytes_before":     _nbytes(full),
+        "bytes_after":      _nbytes(compressed),
+        "accuracy_before":  acc_before,
+        "accuracy_after":   acc_after,
+        "prob_drift":       drift,
+        "row_ms_before":    _single_row_ms(full, row),
+        "row_ms_after":     _single_row_ms(compressed, row),
+        "tolerance":        tolerance,
+        "max_drift":        max_drift,
+        "rounds":           rounds,
+        "within_tolerance": passed,
+        "saved":            passed,
+    }
+    if passed:
+        _pack(save_artifact(ARTIFACT_NAME, full.version_, compressed,
+                            acc_after, TIER1_FEATURES, report=report))
+    return report
+
+
+def load_compressed(model):
+    """
+    Return (FlatForest, accuracy) compressed from exactly this model
+    version, memory-mapped from its packed export (packed first if only the
+    artifact exists), or None if no matching compressed artifact exists or
+    it was not verified within tolerance on held-out rows.
+    """
+    version = getattr(model, "version_", None)
+    if not version:
+        return None
+    directory = packed_path(ARTIFACT_NAME, version)
+    meta = read_packed_meta(directory) if directory else None
+    if meta is None or meta.get("key") != version:
+        artifact = load_artifact(ARTIFACT_NAME, version)
+        if artifact is None or not artifact.get("report", {}).get("within_tolerance"):
+            return None
+        directory = _pack(artifact)
+        meta = read_packed_meta(directory)
+    return load_packed(directory), meta["accuracy"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compress the Tier 1 forest for serving.")
+    parser.add_argument("--tolerance", type=float, default=0.002,
+                        help="max accuracy drop on either held-out half (default 0.002)")
+    parser.add_argument("--max-drift", type=float, default=0.01,
+                        help="max mean absolute probability drift vs the full forest")
+    parser.add_argument("--max-rounds", type=int, default=6,
+                        help="times to tighten selection if the check half fails")
+    args = parser.parse_args(argv)
+
+    r = compress_tier1(args.tolerance, args.max_drift, args.max_rounds)
+    print(f"Trees     {r['trees_before']:>9,} → {r['trees_after']:,}")
+    print(f"Nodes     {r['nodes_before']:>9,} → {r['nodes_after']:,}")
+    print(f"Size      {r['bytes_before'] / 1e6:>8.2f}M → {r['bytes_after'] / 1e6:.2f}M")
+    print(f"Accuracy  {r['accuracy_before']:>9.2%} → {r['accuracy_after']:.2%} "
+          f"(mean probability drift {r['prob_drift']:.4f})")
+    print(f"1-row     {r['row_ms_before']:>7.3f}ms → {r['row_ms_after']:.3f}ms "
+          f"({r['row_ms_before'] / r['row_ms_after']:.1f}× faster)")
+    if not r["saved"]:
+        print(f"Not saved: still outside tolerance after {r['rounds']} rounds "
+              f"(accuracy drop ≤ {r['tolerance']:.2%}, drift ≤ {r['max_drift']:g})")
+        raise SystemExit(1)
+    print(f"Selected in {r['rounds']} round(s); saved and packed '{ARTIFACT_NAME}'")
+
+
+if __name__ == "__main__":
+    main()
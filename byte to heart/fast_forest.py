@@ -0,0 +1,333 @@
+"""
+fast_forest.py — Cardio-Lens Flattened Forest Inference
+Compiles a fitted RandomForestClassifier into contiguous NumPy node arrays
+and scores every tree for a batch of rows in one vectorised walk. Forests can
+be packed to a directory of compact .npy files that every process memory-maps
+read-only, so replicas share one copy of the nodes through the page cache.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from model_store import install_directory
+
+# (row, tree) walks scored at once. Each walk holds a few index and float
+# temporaries per level, so row blocks keep scratch memory at ~10 MB for any
+# batch instead of growing with n_rows × n_trees; a small batch is one block.
+BLOCK_WALKS = 1 << 17
+
+# Leaves point back at themselves, so a walk that has already reached its
+# leaf stays put while deeper trees keep descending.
+_LEAF = -1
+
+
+class FlatForest:
+    """
+    A RandomForestClassifier flattened into one set of node arrays.
+
+    All trees share the arrays below; `roots[t]` is the index of tree t's
+    root node. Probabilities match `model.predict_proba` bit for bit; a
+    forest loaded with load_packed() takes identical paths and differs only
+    by float32 rounding of the leaf values (≤ 1e-7).
+    """
+
+    def __init__(self, feature, threshold, left, right, value, roots,
+                 max_depth, classes, n_features, feature_names=None,
+                 feature_importances=None, version=None):
+        self.feature   = feature      # split feature per node (0 at leaves)
+        self.threshold = threshold    # split threshold per node
+        self.left      = left         # left child (self at leaves)
+        self.right     = right        # right child (self at leaves)
+        self.value     = value        # normalised class probabilities per node
+        self.roots     = roots        # root node index per tree
+        self.max_depth = int(max_depth)
+        self.classes_  = classes
+        self.n_features = int(n_features)
+        self.feature_names_in_ = feature_names
+        self.feature_importances_ = feature_importances
+        self.version_ = version       # model version the arrays were built from
+
+    @property
+    def n_estimators(self) -> int:
+        return len(self.roots)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+    def _as_matrix(self, X) -> np.ndarray:
+        # Trees compare float32 features against float64 thresholds; casting
+        # the same way sklearn does keeps every split decision identical.
+        if isinstance(X, pd.DataFrame) and self.feature_names_in_ is not None:
+            X = X[list(self.feature_names_in_)]
+        return np.ascontiguousarray(X, dtype=np.float32)
+
+    def _blocks(self, n_rows: int):
+        """Row slices of at most BLOCK_WALKS (row, tree) walks each."""
+        step = max(1, BLOCK_WALKS // self.n_estimators)
+        for start in range(0, n_rows, step):
+            yield slice(start, min(start + step, n_rows))
+
+    def _walk(self, X: np.ndarray) -> np.ndarray:
+        """Leaf index reached in every tree for a block of rows, flattened row-major."""
+        n_rows, n_features = X.shape
+        # Offset of each walk's row in the flattened matrix: one flat gather
+        # per level is cheaper than a two-axis fancy index
+        offset = np.repeat(np.arange(n_rows) * n_features, self.n_estimators)
+        X = X.ravel()
+        node = np.tile(self.roots, n_rows)
+        for _ in range(self.max_depth):
+            go_left = X[offset + self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return node
+
+    def apply(self, X) -> np.ndarray:
+        """Return the leaf index reached in every tree, shape (n_rows, n_trees)."""
+        X = self._as_matrix(X)
+        leaves = np.empty((X.shape[0], self.n_estimators), dtype=np.intp)
+        for block in self._blocks(X.shape[0]):
+            leaves[block] = self._walk(X[block]).reshape(-1, self.n_estimators)
+        return leaves
+
+    def predict_proba(self, X) -> np.ndarray:
+        X = self._as_matrix(X)
+        proba = np.empty((X.shape[0], len(self.classes_)))
+        for block in self._blocks(X.shape[0]):
+            leaves = self._walk(X[block]).reshape(-1, self.n_estimators)
+            per_tree = self.value[leaves]          # (rows, n_trees, n_classes)
+            # Sum trees strictly in order, as sklearn's accumulation does, so
+            # the float result is identical rather than merely close.
+            # float64 accumulation also keeps packed float32 values within
+            # float32 rounding of the original probabilities.
+            proba[block] = np.cumsum(per_tree, axis=1, dtype=np.float64)[:, -1, :]
+        return proba / self.n_estimators
+
+    def explain(self, X, cls: int = 1):
+        """
+        Per-row path attributions for class `cls` (Saabas-style, the
+        path-dependent decomposition TreeSHAP refines). Walking each tree,
+        the change in node probability at every split is credited to the
+        split feature, so for each row:
+
+            proba == bias + contributions.sum()    (up to float rounding)
+
+        Returns (proba, bias, contributions) with shapes (n,), (n,), (n, n_features).
+        """
+        X = self._as_matrix(X)
+        n_rows, n_trees = X.shape[0], self.n_estimators
+        rows = np.repeat(np.arange(n_rows), n_trees)
+        walk = np.arange(n_rows * n_trees)
+        node = np.tile(self.roots, n_rows)
+        value = self.value[:, cls]
+        contrib = np.zeros((n_rows * n_trees, self.n_features))
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            child = np.where(go_left, self.left[node], self.right[node])
+            # One entry per (row, tree) walk, so plain fancy-index += is safe;
+            # walks already at a leaf add a zero delta.
+            contrib[walk, self.feature[node]] += value[child] - value[node]
+            node = child
+        proba = np.cumsum(value[node].reshape(n_rows, n_trees), axis=1,
+                          dtype=np.float64)[:, -1] / n_trees
+        bias = np.full(n_rows, value[self.roots].mean(dtype=np.float64))
+        contrib = contrib.reshape(n_rows, n_trees, -1).sum(axis=1) / n_trees
+        return proba, bias, contrib
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+
+def compile_forest(model) -> FlatForest:
+    """Flatten a fitted RandomForestClassifier into a FlatForest."""
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset = 0
+    max_depth = 0
+    n_classes = len(model.classes_)
+    for est in model.estimators_:
+        tree = est.tree_
+        n = tree.node_count
+        is_leaf = tree.children_left == _LEAF
+        own = np.arange(offset, offset + n)
+
+        features.append(np.where(is_leaf, 0, tree.feature))
+        thresholds.append(np.where(is_leaf, 0.0, tree.threshold))
+        lefts.append(np.where(is_leaf, own, tree.children_left + offset))
+        rights.append(np.where(is_leaf, own, tree.children_right + offset))
+
+        # Same normalisation as DecisionTreeClassifier.predict_proba
+        proba = tree.value[:, 0, :n_classes].copy()
+        normalizer = proba.sum(axis=1)[:, np.newaxis]
+        normalizer[normalizer == 0.0] = 1.0
+        proba /= normalizer
+        values.append(proba)
+
+        roots.append(offset)
+        offset += n
+        max_depth = max(max_depth, tree.max_depth)
+
+    return FlatForest(
+        feature=np.concatenate(features).astype(np.intp),
+        threshold=np.concatenate(thresholds).astype(np.float64),
+        left=np.concatenate(lefts).astype(np.intp),
+        right=np.concatenate(rights).astype(np.intp),
+        value=np.concatenate(values),
+        roots=np.asarray(roots, dtype=np.intp),
+        max_depth=max_depth,
+        classes=model.classes_,
+        n_features=model.n_features_in_,
+        feature_names=getattr(model, "feature_names_in_", None),
+        feature_importances=model.feature_importances_,
+        version=getattr(model, "version_", None),
+    )
+
+
+# ─────────────────────────────────────────────
+# PACKED STORAGE
+# ─────────────────────────────────────────────
+
+PACKED_FORMAT = 1
+_PACKED_ARRAYS = ("feature", "threshold", "left", "right", "value", "roots")
+
+
+def _float32_floor(threshold: np.ndarray) -> np.ndarray:
+    """
+    Largest float32 ≤ each float64 threshold. Features are compared as
+    float32, and no float32 lies between the two values, so for every input
+    `x <= floor32(t)` is exactly `x <= t`: no split decision changes.
+    """
+    t32 = threshold.astype(np.float32)
+    over = t32.astype(np.float64) > threshold
+    t32[over] = np.nextafter(t32[over], np.float32(-np.inf))
+    return t32
+
+
+def _index_dtype(n: int):
+    return np.int16 if n <= np.iinfo(np.int16).max else np.int32
+
+
+def pack_forest(flat: FlatForest, directory: str, **meta) -> str:
+    """
+    Write `flat` as compact arrays: uint8 feature ids, int16/int32 node
+    indices, float32 thresholds (rounded down) and float32 leaf values.
+    Extra keyword arguments are stored in meta.json.
+
+    `directory` must be named by the forest's version (see
+    model_store.packed_path): it is built under a temporary name and
+    installed with a single os.replace, and a complete copy already there is
+    kept, so readers never see a partial or missing forest. Raises OSError
+    if the install fails for any reason but a concurrent identical write.
+    """
+    if flat.n_features > np.iinfo(np.uint8).max + 1:
+        raise ValueError(f"{flat.n_features} features do not fit uint8 feature ids")
+    index = _index_dtype(flat.n_nodes)
+    arrays = {
+        "feature":   flat.feature.astype(np.uint8),
+        "threshold": _float32_floor(np.asarray(flat.threshold, dtype=np.float64)),
+        "left":      flat.left.astype(index),
+        "right":     flat.right.astype(index),
+        "value":     flat.value.astype(np.float32),
+        "roots":     flat.roots.astype(index),
+    }
+    info = {
+        "format":        PACKED_FORMAT,
+        "max_depth":     flat.max_depth,
+        "classes":       np.asarray(flat.classes_).tolist(),
+        "n_features":    flat.n_features,
+        "feature_names": (None if flat.feature_names_in_ is None
+                          else list(flat.feature_names_in_)),
+        "feature_importances": (None if flat.feature_importances_ is None
+                                else np.asarray(flat.feature_importances_).tolist()),
+        "version":       flat.version_,
+        **meta,
+    }
+
+    parent = os.path.dirname(os.path.abspath(directory))
+    os.makedirs(parent, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=parent, prefix=".build-", suffix=".tmp")
+    try:
+        for name, arr in arrays.items():
+            np.save(os.path.join(tmp, f"{name}.npy"), arr)
+        with open(os.path.join(tmp, "meta.json"), "w") as f:
+            json.dump(info, f)
+        os.chmod(tmp, 0o755)
+        install_directory(tmp, directory, lambda d: read_packed_meta(d) is not None)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return directory
+
+
+def read_packed_meta(directory: str):
+    """meta.json of a packed forest, or None if missing or another format."""
+    try:
+        with open(os.path.join(directory, "meta.json")) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get("format") == PACKED_FORMAT else None
+
+
+def load_packed(directory: str) -> FlatForest:
+    """Memory-map a packed forest read-only. Raises FileNotFoundError if absent."""
+    meta = read_packed_meta(directory)
+    if meta is None:
+        raise FileNotFoundError(f"no packed forest in {directory}")
+    arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+              for name in _PACKED_ARRAYS}
+    names = meta["feature_names"]
+    importances = meta["feature_importances"]
+    return FlatForest(
+        **arrays,
+        max_depth=meta["max_depth"],
+        classes=np.asarray(meta["classes"]),
+        n_features=meta["n_features"],
+        feature_names=None if names is None else np.asarray(names, dtype=object),
+        feature_importances=None if importances is None else np.asarray(importances),
+        version=meta["version"],
+    )
+
+
+# ─────────────────────────────────────────────
+# BENCHMARK
+# ─────────────────────────────────────────────
+if __name__ == "__main__":
+    import time
+
+    from backend import (TIER1_FEATURES, load_and_preprocess_tier1,
+                         load_tier1_model)
+
+    def best_of(fn, repeats=200):
+        times = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - t0)
+        return np.median(times) * 1e3
+
+    print("Loading Tier 1 model…")
+    model, _ = load_tier1_model("random_forest")
+    flat = compile_forest(model)
+    print(f"  {flat.n_estimators} trees, {flat.n_nodes:,} nodes, depth ≤ {flat.max_depth}")
+
+    X = load_and_preprocess_tier1()[TIER1_FEATURES].sample(2000, random_state=0)
+    model.set_params(n_jobs=1)
+    same = np.array_equal(model.predict_proba(X), flat.predict_proba(X))
+    print(f"  Bit-identical on {len(X):,} rows: {same}")
+
+    row_df = X.iloc[[0]]
+    row_np = X.to_numpy()[:1]
+    for label, n_jobs in (("n_jobs=-1", -1), ("n_jobs=1", 1)):
+        model.set_params(n_jobs=n_jobs)
+        ms = best_of(lambda: model.predict_proba(row_df), repeats=50)
+        print(f"  sklearn predict_proba ({label}), 1 row: {ms:8.3f} ms")
+    print(f"  FlatForest.predict_proba,           1 row: {best_of(lambda: flat.predict_proba(row_np)):8.3f} ms")
+
+    model.set_params(n_jobs=-1)
+    ms_sk = best_of(lambda: model.predict_proba(X), repeats=10)
+    ms_ff = best_of(lambda: flat.predict_proba(X), repeats=10)
+    print(f"  sklearn predict_proba, {len(X):,} rows: {ms_sk:8.3f} ms")
+    print(f"  FlatForest,            {len(X):,} rows: {ms_ff:8.3f} ms")
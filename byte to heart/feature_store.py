@@ -0,0 +1,166 @@
+"""
+feature_store.py — Cardio-Lens Preprocessed Feature Store
+Caches a cleaned feature matrix and labels as raw binary columns next to
+dataset/, stamped with the source CSV, and memory-maps them on later loads.
+
+Layout of a store directory:
+    X.bin      float32, row-major (rows × features)
+    y.bin      int8 labels
+    meta.json  shape, feature names, the source file stamp and build stats
+
+Large matrices can be written incrementally through FeatureStore.writer().
+"""
+
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from model_store import file_digest
+
+X_DTYPE = np.float32   # trees split on float32 anyway, so nothing is lost
+Y_DTYPE = np.int8
+
+
+def source_stamp(path: str, digest: str = None) -> dict:
+    st = os.stat(path)
+    return {
+        "path":     os.path.basename(path),
+        "mtime_ns": st.st_mtime_ns,
+        "size":     st.st_size,
+        "sha256":   digest or file_digest(path),
+    }
+
+
+class FeatureStore:
+    """A memory-mappable (X, y) pair derived from one source file."""
+
+    def __init__(self, directory: str, source_path: str):
+        self.directory = directory
+        self.source_path = source_path
+        self.meta_path = os.path.join(directory, "meta.json")
+        self.x_path = os.path.join(directory, "X.bin")
+        self.y_path = os.path.join(directory, "y.bin")
+
+    def _read_meta(self):
+        try:
+            with open(self.meta_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, features: list = None) -> bool:
+        """
+        True when the store was built from the current source file. A
+        matching mtime and size is trusted; otherwise fall back to comparing
+        content hashes, so a touched-but-identical file stays valid.
+        """
+        meta = self._read_meta()
+        if meta is None:
+            return False
+        if features is not None and meta["features"] != list(features):
+            return False
+        src = meta["source"]
+        st = os.stat(self.source_path)
+        if src["mtime_ns"] == st.st_mtime_ns and src["size"] == st.st_size:
+            return True
+        return src["sha256"] == file_digest(self.source_path)
+
+    def load(self):
+        """Return (X, y, features) as read-only memory maps."""
+        meta = self._read_meta()
+        rows, cols = meta["rows"], len(meta["features"])
+        if rows == 0:
+            return (np.empty((0, cols), X_DTYPE), np.empty(0, Y_DTYPE),
+                    meta["features"])
+        X = np.memmap(self.x_path, dtype=X_DTYPE, mode="r", shape=(rows, cols))
+        y = np.memmap(self.y_path, dtype=Y_DTYPE, mode="r", shape=(rows,))
+        return X, y, meta["features"]
+
+    def stats(self) -> dict:
+        """Extra build information saved with the store (e.g. preprocessing drops)."""
+        meta = self._read_meta()
+        return meta.get("stats", {}) if meta else {}
+
+    def writer(self, features: list) -> "StoreWriter":
+        """Open an incremental writer; see StoreWriter."""
+        return StoreWriter(self, features)
+
+    def write(self, X: np.ndarray, y: np.ndarray, features: list):
+        """
+        Persist X and y. Data files are written under temp names and renamed;
+        meta.json goes last and marks the store complete.
+        """
+        with self.writer(features) as w:
+            w.append(X, y)
+
+
+class StoreWriter:
+    """
+    Appends (X, y) blocks to a FeatureStore so a matrix larger than memory
+    can be written chunk by chunk. Blocks go to temp files private to this
+    writer that are renamed into place by commit(); meta.json is written
+    last. Replicas building the same store at once never share a temp file.
+    Leaving the `with` block commits, or discards the temp files if an
+    exception escaped.
+    """
+
+    def __init__(self, store: FeatureStore, features: list):
+        self.store = store
+        self.features = list(features)
+        self.rows = 0
+        os.makedirs(store.directory, exist_ok=True)
+        try:
+            os.remove(store.meta_path)   # readers see "stale" until rewrite finishes
+        except FileNotFoundError:
+            pass
+        self._x, self._x_tmp = self._temp_file("X.bin.")
+        self._y, self._y_tmp = self._temp_file("y.bin.")
+
+    def _temp_file(self, prefix: str):
+        fd, tmp = tempfile.mkstemp(dir=self.store.directory, prefix=prefix, suffix=".tmp")
+        return os.fdopen(fd, "wb"), tmp
+
+    def append(self, X: np.ndarray, y: np.ndarray):
+        if len(X) != len(y):
+            raise ValueError(f"X has {len(X)} rows but y has {len(y)}")
+        np.ascontiguousarray(X, dtype=X_DTYPE).tofile(self._x)
+        np.ascontiguousarray(y, dtype=Y_DTYPE).tofile(self._y)
+        self.rows += len(y)
+
+    def commit(self, stats: dict = None):
+        store = self.store
+        for f, tmp, path in ((self._x, self._x_tmp, store.x_path),
+                             (self._y, self._y_tmp, store.y_path)):
+            f.close()
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        meta = {
+            "rows":     self.rows,
+            "features": self.features,
+            "source":   source_stamp(store.source_path),
+        }
+        if stats:
+            meta["stats"] = stats
+        fd, tmp = tempfile.mkstemp(dir=store.directory, prefix="meta.json.", suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(meta, f, indent=2)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, store.meta_path)
+
+    def abort(self):
+        for f, tmp in ((self._x, self._x_tmp), (self._y, self._y_tmp)):
+            f.close()
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            if not self._x.closed:
+                self.commit()
+        else:
+            self.abort()
@@ -0,0 +1,85 @@
+"""
+i18n.py — Cardio-Lens UI Localisation
+Looks up UI strings in prebuilt per-language bundles (locales/<lang>.json,
+written by build_locales.py). Only the selected language's bundle is read,
+once per file version, so switching language never touches the network.
+"""
+
+import functools
+import json
+import os
+import threading
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LOCALE_DIR = os.environ.get("CARDIO_LENS_LOCALE_DIR",
+                            os.path.join(BASE_DIR, "locales"))
+
+SOURCE_LANGUAGE = "en"
+LANGUAGE_NAMES = {
+    "en": "English",
+    "es": "Español",
+    "fr": "Français",
+    "de": "Deutsch",
+    "pt": "Português",
+    "hi": "हिन्दी",
+    "ta": "தமிழ்",
+    "zh": "中文",
+    "ar": "العربية",
+}
+
+# Streamlit runs every session's script on its own thread, so the active
+# language is per thread rather than a process-wide global.
+_active = threading.local()
+
+
+def bundle_path(lang: str) -> str:
+    return os.path.join(LOCALE_DIR, f"{lang}.json")
+
+
+def available_languages() -> list:
+    """The source language plus every language with a bundle on disk."""
+    try:
+        built = sorted(f[:-5] for f in os.listdir(LOCALE_DIR) if f.endswith(".json"))
+    except FileNotFoundError:
+        built = []
+    return [SOURCE_LANGUAGE] + [lang for lang in built if lang != SOURCE_LANGUAGE]
+
+
+@functools.lru_cache(maxsize=32)
+def _read_bundle(path: str, mtime_ns: int) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("strings", {})
+
+
+def load_bundle(lang: str) -> dict:
+    """{source text: translation} for `lang`; empty for English or a missing bundle."""
+    if lang == SOURCE_LANGUAGE:
+        return {}
+    path = bundle_path(lang)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    # Keyed by mtime so a rebuilt bundle is picked up without a restart
+    return _read_bundle(path, mtime_ns)
+
+
+def set_language(lang: str):
+    """Select the language used by t() on this thread."""
+    _active.lang = lang
+    _active.strings = load_bundle(lang)
+
+
+def get_language() -> str:
+    return getattr(_active, "lang", SOURCE_LANGUAGE)
+
+
+def t(text: str) -> str:
+    """Translate a UI string, falling back to the English source text."""
+    strings = getattr(_active, "strings", None)
+    return strings.get(text, text) if strings else text
+
+
+def N_(text: str) -> str:
+    """Mark a string for extraction only; it is translated later with t()."""
+    return text
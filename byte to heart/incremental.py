@@ -0,0 +1,183 @@
+"""
+incremental.py — Cardio-Lens Incremental Tier 1 Training
+Folds newly screened records into the Tier 1 forest without a full retrain.
+
+New records are appended to dataset/cardio_intake.csv (cardio_base format).
+A refresh reads only the rows added since the last refresh, grows the forest
+with warm-start trees fitted on them, retires the oldest trees once the
+forest exceeds its size cap, and rewrites the Tier 1 artifact with the new
+intake offset.
+
+Usage:
+    python incremental.py append new_screenings.csv
+    python incremental.py refresh [--trees 10] [--max-trees 150]
+"""
+
+import argparse
+import math
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from backend import (
+    BASE_DIR, TIER1_FEATURES, TIER1_PARAMS, add_tier1_derived, clean_tier1,
+    fit_tier1_model, load_tier1_matrix, serving_forest, tier1_artifact_key,
+    train_tier1_model,
+)
+from model_store import artifact_version, load_artifact, save_artifact
+
+INTAKE_PATH = os.path.join(BASE_DIR, "dataset", "cardio_intake.csv")
+INTAKE_COLUMNS = ["id", "age", "gender", "height", "weight", "ap_hi", "ap_lo",
+                  "cholesterol", "gluc", "smoke", "alco", "active", "cardio"]
+
+
+# ─────────────────────────────────────────────
+# INTAKE
+# ─────────────────────────────────────────────
+
+def append_records(records: pd.DataFrame, path: str = INTAKE_PATH) -> int:
+    """Append raw cardio_base-format rows to the intake file. Returns rows written."""
+    missing = set(INTAKE_COLUMNS) - set(records.columns)
+    if missing:
+        raise ValueError(f"records are missing columns: {', '.join(sorted(missing))}")
+    new_file = not os.path.exists(path)
+    records[INTAKE_COLUMNS].to_csv(path, sep=";", index=False,
+                                   mode="a", header=new_file)
+    return len(records)
+
+
+def read_intake(offset: int, path: str = INTAKE_PATH) -> pd.DataFrame:
+    """Raw intake rows after the first `offset` data rows."""
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=INTAKE_COLUMNS)
+    return pd.read_csv(path, sep=";", skiprows=range(1, offset + 1))
+
+
+# ─────────────────────────────────────────────
+# REFRESH
+# ─────────────────────────────────────────────
+
+def _base_holdout():
+    """The held-out 20% of cardio_base used by fit_tier1_model."""
+    from sklearn.model_selection import train_test_split
+
+    X, y = load_tier1_matrix()
+    X = pd.DataFrame(X, columns=TIER1_FEATURES, copy=False)
+    _, X_test, _, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=42, stratify=y
+    )
+    return X_test, y_test
+
+
+def refresh_tier1_model(n_new_trees: int = None,
+                        max_trees: int = TIER1_PARAMS["n_estimators"],
+                        min_rows: int = 200) -> dict:
+    """
+    Grow the stored Tier 1 forest with trees fitted on unseen intake rows.
+
+    n_new_trees — trees to add; by default proportional to the new rows'
+                  share of all training rows (at least 1)
+    max_trees   — forest size cap; the oldest trees are retired beyond it
+    min_rows    — skip the refresh until this many clean new rows exist
+
+    Returns a summary dict. Accuracy is re-measured on the base holdout
+    plus 20% of the new rows, which are not used for fitting.
+    """
+    from sklearn.metrics import accuracy_score
+    from sklearn.model_selection import train_test_split
+
+    # Warm-start refreshes only apply to the forest, whichever backend serves
+    key = tier1_artifact_key("random_forest")
+    artifact = load_artifact("tier1", key)
+    if artifact is None:
+        model, acc = fit_tier1_model(backend="random_forest")
+        artifact = save_artifact("tier1", key, model, acc, TIER1_FEATURES)
+
+    offset = artifact.get("intake_offset", 0)
+    raw = read_intake(offset)
+    new = clean_tier1(add_tier1_derived(raw)) if len(raw) else raw
+    summary = {"new_rows": len(raw), "clean_rows": len(new), "trees_added": 0,
+               "trees_retired": 0, "accuracy": artifact["accuracy"]}
+    if len(new) < min_rows or new["cardio"].nunique() < 2:
+        summary["skipped"] = True
+        return summary
+
+    X_new, y_new = new[TIER1_FEATURES], new["cardio"].astype(int)
+    X_fit, X_eval, y_fit, y_eval = train_test_split(
+        X_new, y_new, test_size=0.2, random_state=42, stratify=y_new
+    )
+
+    model = artifact["model"]
+    seen_rows = artifact.get("train_rows", int(len(load_tier1_matrix()[1]) * 0.8))
+    if n_new_trees is None:
+        share = len(X_fit) / (seen_rows + len(X_fit))
+        n_new_trees = max(1, math.ceil(max_trees * share))
+
+    n_before = len(model.estimators_)
+    # Warm start seeds new trees by their position in the forest, which stops
+    # advancing once the cap retires trees; seeding from the count of trees
+    # ever grown keeps every refresh's trees new.
+    grown = artifact.get("trees_grown", n_before)
+    seed = int(np.random.SeedSequence([TIER1_PARAMS["random_state"], grown]).generate_state(1)[0])
+    model.set_params(warm_start=True, n_estimators=n_before + n_new_trees, random_state=seed)
+    model.fit(X_fit, y_fit)                    # fits only the new trees
+    retired = max(0, len(model.estimators_) - max_trees)
+    if retired:
+        model.estimators_ = model.estimators_[retired:]
+    model.set_params(warm_start=False, n_estimators=len(model.estimators_),
+                     random_state=TIER1_PARAMS["random_state"])
+
+    X_base, y_base = _base_holdout()
+    X_test = pd.concat([X_base, X_eval], ignore_index=True)
+    y_test = pd.concat([pd.Series(y_base), y_eval], ignore_index=True)
+    acc = accuracy_score(y_test, model.predict(X_test))
+
+    saved = save_artifact("tier1", key, model, acc, TIER1_FEATURES,
+                          intake_offset=offset + len(raw),
+                          train_rows=seen_rows + len(X_fit),
+                          trees_grown=grown + n_new_trees,
+                          refreshes=artifact.get("refreshes", 0) + 1,
+                          revision=uuid.uuid4().hex[:8])
+    # A new version_ keys every per-version cache (prediction memos, BP
+    # curves, compressed and cohort artifacts) apart from the old model's,
+    # in this process and in every replica that loads the new artifact.
+    model.version_ = artifact_version(saved)
+    # Let the next serving_model() in this process pick up the refreshed
+    # model; the packed export is rebuilt because the artifact file changed.
+    train_tier1_model.clear()
+    serving_forest.clear()
+
+    summary.update(trees_added=n_new_trees, trees_retired=retired,
+                   accuracy=acc, skipped=False)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Incremental Tier 1 training.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_append = sub.add_parser("append", help="append new records to the intake file")
+    p_append.add_argument("path", help="semicolon-separated file in cardio_base.csv format")
+    p_refresh = sub.add_parser("refresh", help="fold unseen intake rows into the model")
+    p_refresh.add_argument("--trees", type=int, default=None,
+                           help="trees to add (default: proportional to new data)")
+    p_refresh.add_argument("--max-trees", type=int, default=TIER1_PARAMS["n_estimators"])
+    p_refresh.add_argument("--min-rows", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    if args.command == "append":
+        n = append_records(pd.read_csv(args.path, sep=";"))
+        print(f"Appended {n:,} records to {INTAKE_PATH}")
+    else:
+        s = refresh_tier1_model(args.trees, args.max_trees, args.min_rows)
+        if s["skipped"]:
+            print(f"Skipped: {s['clean_rows']:,} clean new rows (need ≥ {args.min_rows:,} "
+                  "with both outcomes)")
+        else:
+            print(f"Folded {s['clean_rows']:,} new rows: +{s['trees_added']} trees, "
+                  f"−{s['trees_retired']} retired, accuracy {s['accuracy']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
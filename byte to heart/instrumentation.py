@@ -0,0 +1,206 @@
+"""
+instrumentation.py — Cardio-Lens Hot-Path Instrumentation
+Opt-in per-stage counters and latency histograms, exported in Prometheus
+text format on a local port and/or dumped to a file.
+
+Enable before starting the app, service or CLI:
+    CARDIO_LENS_METRICS=1                      record stage timings
+    CARDIO_LENS_METRICS_PORT=9464              serve http://127.0.0.1:9464/metrics
+    CARDIO_LENS_METRICS_FILE=metrics.prom      write the exposition at exit
+
+When disabled, @timed returns the function unchanged and stage() returns a
+shared no-op context, so instrumented code pays essentially nothing.
+"""
+
+import atexit
+import bisect
+import contextlib
+import functools
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ENABLED = os.environ.get("CARDIO_LENS_METRICS", "") not in ("", "0", "false")
+
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500,
+              1000, 2500, 10000, 60000)
+
+METRIC_NAME = "cardio_lens_stage_duration_seconds"
+
+
+# ─────────────────────────────────────────────
+# HISTOGRAMS
+# ─────────────────────────────────────────────
+
+class Histogram:
+    """Latency histogram with fixed millisecond buckets; thread-safe."""
+
+    def __init__(self, buckets_ms=BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self._lock = threading.Lock()
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+
+    def observe(self, ms: float):
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets_ms, ms)] += 1
+            self.total += 1
+            self.sum_ms += ms
+
+    def snapshot(self) -> dict:
+        """Count, sum, mean and per-bucket (non-cumulative) counts."""
+        with self._lock:
+            labels = [f"le_{b}" for b in self.buckets_ms] + ["le_inf"]
+            return {
+                "count":   self.total,
+                "sum_ms":  round(self.sum_ms, 3),
+                "mean_ms": round(self.sum_ms / self.total, 3) if self.total else None,
+                "buckets": dict(zip(labels, self.counts)),
+            }
+
+
+class Registry:
+    """Named histograms, one per instrumented stage."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms = {}
+
+    def histogram(self, name: str) -> Histogram:
+        h = self.histograms.get(name)
+        if h is None:
+            with self._lock:
+                h = self.histograms.setdefault(name, Histogram())
+        return h
+
+    def observe(self, name: str, ms: float):
+        self.histogram(name).observe(ms)
+
+    def snapshot(self) -> dict:
+        return {name: h.snapshot() for name, h in sorted(self.histograms.items())}
+
+    def prometheus(self, metric: str = METRIC_NAME, label: str = "stage") -> str:
+        """Render every histogram in Prometheus text exposition format."""
+        lines = [
+            f"# HELP {metric} Latency of instrumented Cardio-Lens stages.",
+            f"# TYPE {metric} histogram",
+        ]
+        for name, h in sorted(self.histograms.items()):
+            with h._lock:
+                counts, total, sum_ms = list(h.counts), h.total, h.sum_ms
+            cumulative = 0
+            for bound, count in zip(h.buckets_ms + (None,), counts):
+                cumulative += count
+                le = "+Inf" if bound is None else repr(bound / 1e3)
+                lines.append(f'{metric}_bucket{{{label}="{name}",le="{le}"}} {cumulative}')
+            lines.append(f'{metric}_sum{{{label}="{name}"}} {sum_ms / 1e3!r}')
+            lines.append(f'{metric}_count{{{label}="{name}"}} {total}')
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+# ─────────────────────────────────────────────
+# INSTRUMENTATION HOOKS
+# ─────────────────────────────────────────────
+
+_NULL = contextlib.nullcontext()
+
+
+@contextlib.contextmanager
+def _timing(name: str):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        REGISTRY.observe(name, (time.perf_counter() - t0) * 1e3)
+
+
+def stage(name: str):
+    """Context manager timing a block as `name` (no-op when disabled)."""
+    return _timing(name) if ENABLED else _NULL
+
+
+def observe(name: str, ms: float):
+    """Record one duration measured by the caller (no-op when disabled)."""
+    if ENABLED:
+        REGISTRY.observe(name, ms)
+
+
+def timed(name: str):
+    """Decorator timing every call as `name`; returns fn untouched when disabled."""
+    def decorator(fn):
+        if not ENABLED:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _timing(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# ─────────────────────────────────────────────
+# EXPORT
+# ─────────────────────────────────────────────
+
+def dump(path: str):
+    """Write the current Prometheus exposition to `path`."""
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        f.write(REGISTRY.prometheus())
+    os.replace(tmp, path)
+
+
+_exporter = None
+_exporter_lock = threading.Lock()
+
+
+def start_exporter(port: int, host: str = "127.0.0.1"):
+    """Serve GET /metrics on a daemon thread. Safe to call more than once."""
+    global _exporter
+    with _exporter_lock:
+        if _exporter is not None:
+            return _exporter
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/metrics":
+                    self.send_error(404)
+                    return
+                data = REGISTRY.prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        _exporter = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=_exporter.serve_forever, daemon=True).start()
+        return _exporter
+
+
+def _configure_from_env():
+    if not ENABLED:
+        return
+    port = os.environ.get("CARDIO_LENS_METRICS_PORT")
+    if port:
+        try:
+            start_exporter(int(port))
+        except OSError:
+            pass  # another process (e.g. a second replica) already owns the port
+    path = os.environ.get("CARDIO_LENS_METRICS_FILE")
+    if path:
+        atexit.register(dump, path)
+
+
+_configure_from_env()
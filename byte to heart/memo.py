@@ -0,0 +1,72 @@
+"""
+memo.py — Cardio-Lens Bounded Memoisation
+A thread-safe, size-capped LRU mapping with hit/miss counters, shared by
+every session in the process. Used to keep per-patient model outputs so
+repeated inputs skip the model entirely.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry; thread-safe."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """
+        The cached value for `key`, else compute() stored under it. compute()
+        runs outside the lock, so a slow miss never blocks other lookups; two
+        threads missing the same key at once both compute it.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits":      self.hits,
+                "misses":    self.misses,
+                "hit_rate":  self.hits / lookups if lookups else None,
+                "evictions": self.evictions,
+                "size":      len(self._data),
+                "maxsize":   self.maxsize,
+            }
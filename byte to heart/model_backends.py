@@ -0,0 +1,169 @@
+"""
+model_backends.py — Cardio-Lens Tier 1 Model Backends
+Interchangeable estimators for the Tier 1 screening model: the original
+RandomForest, histogram-based gradient boosting and a logistic-regression
+baseline. Every backend yields a fitted sklearn classifier with
+predict_proba, so predict_tier1, simulate_bp_reduction and
+simulate_scenarios work unchanged whichever one is selected.
+
+Select the backend before starting the app, service or CLI:
+    CARDIO_LENS_TIER1_BACKEND=hist_gradient_boosting streamlit run app.py
+
+Compare training time, inference latency and accuracy of all backends:
+    python model_backends.py --out tier1_backends.json
+"""
+
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_BACKEND = "random_forest"
+
+
+# ─────────────────────────────────────────────
+# BACKENDS
+# ─────────────────────────────────────────────
+
+def _random_forest(params: dict):
+    from sklearn.ensemble import RandomForestClassifier
+    return RandomForestClassifier(**params, n_jobs=-1)
+
+
+def _hist_gradient_boosting(params: dict):
+    from sklearn.ensemble import HistGradientBoostingClassifier
+    return HistGradientBoostingClassifier(**params)
+
+
+def _logistic(params: dict):
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+    # Raw features span very different ranges (age in years vs BP in mmHg)
+    return make_pipeline(StandardScaler(), LogisticRegression(**params))
+
+
+class ModelBackend:
+    """
+    A named estimator factory. `compiles` marks backends whose fitted model
+    compile_forest() can flatten, and so can be served as a packed forest.
+    """
+
+    def __init__(self, name: str, label: str, factory, compiles: bool = False):
+        self.name = name
+        self.label = label
+        self.factory = factory
+        self.compiles = compiles
+
+    def build(self, params: dict):
+        """An unfitted estimator configured with `params`."""
+        return self.factory(params)
+
+    def __repr__(self):
+        return f"ModelBackend({self.name!r})"
+
+
+BACKENDS = {b.name: b for b in (
+    ModelBackend("random_forest", "Random Forest", _random_forest, compiles=True),
+    ModelBackend("hist_gradient_boosting", "Histogram Gradient Boosting",
+                 _hist_gradient_boosting),
+    ModelBackend("logistic", "Logistic Regression (baseline)", _logistic),
+)}
+
+
+def get_backend(name: str = None) -> ModelBackend:
+    """The named backend, or the one selected by CARDIO_LENS_TIER1_BACKEND."""
+    name = name or os.environ.get("CARDIO_LENS_TIER1_BACKEND", DEFAULT_BACKEND)
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"unknown model backend {name!r}; "
+                         f"choose from {', '.join(BACKENDS)}") from None
+
+
+# ─────────────────────────────────────────────
+# COMPARISON
+# ─────────────────────────────────────────────
+
+def _median_ms(fn, repeats: int) -> float:
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return float(np.median(times) * 1e3)
+
+
+def compare_backends(names: list = None, repeats: int = 200) -> list:
+    """
+    Fit each backend on the shared Tier 1 training split and measure it on
+    the held-out split: accuracy, fit time, single-row latency, a full
+    90–200 mmHg BP sweep and batch throughput. Latency is measured on the
+    model the app would serve (the compiled forest for compilable backends).
+    Nothing is saved as an artifact.
+    """
+    from backend import (TIER1_BACKEND_PARAMS, TIER1_FEATURES, bp_reduction_grid,
+                         positive_proba, split_stores)
+    from fast_forest import compile_forest
+
+    stores = split_stores(1)
+    X_train, y_train, features = stores["train"].load()
+    X_test, y_test, _ = stores["test"].load()
+    X_train = pd.DataFrame(X_train, columns=features, copy=False)
+    y_test = np.asarray(y_test)
+
+    row = np.asarray(X_test[:1], dtype=np.float64)
+    inputs = dict(zip(TIER1_FEATURES, row[0].tolist()))
+    _, sweep = bp_reduction_grid(
+        inputs["age_years"], inputs["gender"], inputs["height"], inputs["weight"],
+        200, inputs["ap_lo"], inputs["cholesterol"], inputs["gluc"],
+        inputs["smoke"], inputs["alco"], inputs["active"], target_bp=90)
+    batch = np.asarray(X_test[:5000], dtype=np.float64)
+
+    results = []
+    for name in names or list(BACKENDS):
+        backend = get_backend(name)
+        model = backend.build(TIER1_BACKEND_PARAMS[name])
+        t0 = time.perf_counter()
+        model.fit(X_train, y_train)
+        train_s = time.perf_counter() - t0
+
+        served = compile_forest(model) if backend.compiles else model
+        score = lambda X: positive_proba(served, X, TIER1_FEATURES)
+        probs = score(np.asarray(X_test, dtype=np.float64))
+        batch_ms = _median_ms(lambda: score(batch), max(3, repeats // 50))
+        results.append({
+            "backend":       name,
+            "engine":        "flat" if backend.compiles else "sklearn",
+            "accuracy":      float(((probs > 0.5) == y_test).mean()),
+            "train_s":       train_s,
+            "single_row_ms": _median_ms(lambda: score(row), repeats),
+            "bp_sweep_ms":   _median_ms(lambda: score(sweep), repeats),
+            "batch_rows_s":  len(batch) / (batch_ms / 1e3),
+        })
+        print(f"  measured {name}", flush=True)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the Tier 1 model backends.")
+    parser.add_argument("--backends", nargs="+", choices=list(BACKENDS), default=None)
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--out", help="write all results as JSON")
+    args = parser.parse_args(argv)
+
+    results = compare_backends(args.backends, args.repeats)
+    table = pd.DataFrame(results)
+    print(table.to_string(index=False, float_format=lambda v: f"{v:,.4f}"))
+    print(f"\nServing backend: {get_backend().name} (CARDIO_LENS_TIER1_BACKEND)")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
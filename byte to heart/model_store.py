@@ -0,0 +1,189 @@
+"""
+model_store.py — Cardio-Lens Model Artifact Store
+Persists fitted models so cold starts load from disk instead of retraining.
+"""
+
+import errno
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from importlib.metadata import version as package_version
+
+import joblib
+
+# ─────────────────────────────────────────────
+# PATHS
+# ─────────────────────────────────────────────
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ARTIFACT_DIR = os.environ.get("CARDIO_LENS_ARTIFACT_DIR",
+                              os.path.join(BASE_DIR, "models"))
+
+# Bump when the artifact layout changes so stale files are never loaded
+ARTIFACT_FORMAT = 1
+
+
+# ─────────────────────────────────────────────
+# KEYS
+# ─────────────────────────────────────────────
+
+def file_digest(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def artifact_key(dataset_path: str, params: dict, features: list) -> str:
+    """
+    Key an artifact by the dataset contents, the hyperparameters, the
+    feature list and the sklearn/joblib versions that pickled it. Any change
+    to one of them produces a different key, so an upgrade retrains instead
+    of unpickling models from an incompatible release.
+    """
+    payload = json.dumps({
+        "format":   ARTIFACT_FORMAT,
+        "dataset":  file_digest(dataset_path),
+        "params":   params,
+        "features": list(features),
+        # Read from package metadata: importing sklearn costs ~1 s per process
+        "sklearn":  package_version("scikit-learn"),
+        "joblib":   joblib.__version__,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def artifact_version(artifact: dict) -> str:
+    """
+    Identify the exact model inside an artifact: its key plus the number of
+    incremental refreshes applied on top of the original fit and, for a
+    refreshed model, the refresh's random revision, so two refreshes never
+    share a version even across replicas.
+    """
+    version = f"{artifact['key']}.{artifact.get('refreshes', 0)}"
+    revision = artifact.get("revision")
+    return f"{version}-{revision}" if revision else version
+
+
+# ─────────────────────────────────────────────
+# LOAD / SAVE
+# ─────────────────────────────────────────────
+
+def artifact_path(name: str) -> str:
+    return os.path.join(ARTIFACT_DIR, f"{name}.joblib")
+
+
+def artifact_stamp(name: str):
+    """Cheap identity of the artifact file currently on disk, or None."""
+    try:
+        st = os.stat(artifact_path(name))
+    except FileNotFoundError:
+        return None
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def packed_path(name: str, key: str):
+    """
+    Directory for the memory-mappable packed export of the artifact file
+    currently on disk for `name`, or None if there is none. Exports sit side
+    by side under <name>.packed/, one per artifact key and file stamp, so a
+    new artifact is packed next to the old export rather than over it.
+    """
+    stamp = artifact_stamp(name)
+    if stamp is None:
+        return None
+    return os.path.join(ARTIFACT_DIR, f"{name}.packed",
+                        f"{key}-{stamp['mtime_ns']:x}-{stamp['size']:x}")
+
+
+# ─────────────────────────────────────────────
+# VERSIONED DIRECTORIES
+# ─────────────────────────────────────────────
+
+def install_directory(tmp: str, directory: str, usable) -> bool:
+    """
+    Move the fully written directory `tmp` to `directory` in one os.replace,
+    so readers see either no directory or the complete one. `directory` is
+    named by its contents' version; `usable(directory)` says whether a copy
+    already there is complete. A complete copy is kept and `tmp` is left for
+    the caller to remove; an incomplete one (partial or older format) is
+    replaced. Returns True if `tmp` was installed.
+    """
+    if usable(directory):
+        return False
+    shutil.rmtree(directory, ignore_errors=True)
+    try:
+        os.replace(tmp, directory)
+    except OSError as e:
+        # Only a concurrent writer installing the same version is expected
+        if e.errno not in (errno.EEXIST, errno.ENOTEMPTY) or not usable(directory):
+            raise
+        return False
+    return True
+
+
+def prune_directory(parent: str, keep: str):
+    """
+    Remove every entry of `parent` except `keep` and in-progress builds
+    (dot-prefixed). Processes that still map files from a removed version
+    keep their pages until they unmap them.
+    """
+    keep = os.path.basename(keep)
+    for entry in os.scandir(parent):
+        if entry.name == keep or entry.name.startswith("."):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path, ignore_errors=True)
+        else:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+
+def load_artifact(name: str, key: str):
+    """
+    Return the stored artifact dict for `name` if its key matches,
+    otherwise None. Unreadable or stale files are treated as a miss.
+    """
+    path = artifact_path(name)
+    if not os.path.exists(path):
+        return None
+    try:
+        artifact = joblib.load(path)
+    except Exception:
+        return None
+    if not isinstance(artifact, dict) or artifact.get("key") != key:
+        return None
+    return artifact
+
+
+def save_artifact(name: str, key: str, model, accuracy: float,
+                  features: list, **extra) -> dict:
+    """
+    Write {model, accuracy, features, key} for `name`. The file is written
+    to a temp path and renamed, so concurrent replicas never read a
+    half-written artifact.
+    """
+    os.makedirs(ARTIFACT_DIR, exist_ok=True)
+    artifact = {
+        "key":      key,
+        "model":    model,
+        "accuracy": float(accuracy),
+        "features": list(features),
+        **extra,
+    }
+    fd, tmp = tempfile.mkstemp(dir=ARTIFACT_DIR, suffix=".tmp")
+    os.close(fd)
+    try:
+        joblib.dump(artifact, tmp)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, artifact_path(name))
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return artifact
@@ -0,0 +1,155 @@
+"""
+pareto.py — Cardio-Lens Forest Hyperparameter Pareto Explorer
+Trains candidate forest configurations across a process pool, measures
+accuracy, latency, throughput and memory for each, and reports the
+latency-vs-accuracy Pareto frontier.
+
+Usage:
+    python pareto.py --tier 1 --trees 25,50,100,150 --depths 6,8,10,12 --out tier1_pareto.json
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing as mp
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from backend import TIER1_PARAMS, TIER2_PARAMS, split_stores
+from fast_forest import compile_forest
+
+TIER_PARAMS = {1: TIER1_PARAMS, 2: TIER2_PARAMS}
+
+
+# ─────────────────────────────────────────────
+# WORKERS
+# ─────────────────────────────────────────────
+
+def _train_candidate(tier: int, params: dict) -> dict:
+    from sklearn.ensemble import RandomForestClassifier
+
+    stores = split_stores(tier)
+    X_train, y_train, features = stores["train"].load()
+    X_test, y_test, _ = stores["test"].load()
+    X_train = pd.DataFrame(X_train, columns=features, copy=False)
+    X_test = pd.DataFrame(X_test, columns=features, copy=False)
+
+    t0 = time.perf_counter()
+    model = RandomForestClassifier(**params, n_jobs=1)
+    model.fit(X_train, y_train)
+    train_s = time.perf_counter() - t0
+    acc = float((model.predict(X_test) == np.asarray(y_test)).mean())
+    return {"params": params, "accuracy": acc, "train_s": train_s,
+            "model": pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)}
+
+
+def _median_ms(fn, repeats: int) -> float:
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return float(np.median(times) * 1e3)
+
+
+def measure_serving(model_bytes: bytes, X_test: np.ndarray, repeats: int = 200) -> dict:
+    """Single-row latency, batch throughput and memory of one candidate."""
+    model = pickle.loads(model_bytes)
+    flat = compile_forest(model)
+    row = np.asarray(X_test[:1], dtype=np.float64)
+    batch = np.asarray(X_test[:5000])
+    batch_ms = _median_ms(lambda: flat.predict_proba(batch), max(3, repeats // 50))
+    node_bytes = sum(a.nbytes for a in (flat.feature, flat.threshold, flat.left,
+                                         flat.right, flat.value))
+    return {
+        "single_row_ms":  _median_ms(lambda: flat.predict_proba(row), repeats),
+        "batch_rows_s":   len(batch) / (batch_ms / 1e3),
+        "pickle_mb":      len(model_bytes) / 1e6,
+        "flat_mb":        node_bytes / 1e6,
+        "nodes":          flat.n_nodes,
+    }
+
+
+# ─────────────────────────────────────────────
+# FRONTIER
+# ─────────────────────────────────────────────
+
+def pareto_front(results: list) -> list:
+    """Mark results not dominated on (lower single_row_ms, higher accuracy)."""
+    for r in results:
+        r["pareto"] = not any(
+            o["single_row_ms"] <= r["single_row_ms"] and o["accuracy"] >= r["accuracy"]
+            and (o["single_row_ms"] < r["single_row_ms"] or o["accuracy"] > r["accuracy"])
+            for o in results
+        )
+    return results
+
+
+def sweep(tier: int, grid: dict, workers: int = None) -> list:
+    base = TIER_PARAMS[tier]
+    keys = list(grid)
+    candidates = [dict(base, **dict(zip(keys, combo)))
+                  for combo in itertools.product(*(grid[k] for k in keys))]
+    stores = split_stores(tier)     # build once, before workers fan out
+    ctx = mp.get_context("fork") if "fork" in mp.get_all_start_methods() else None
+
+    trained = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        futures = [pool.submit(_train_candidate, tier, p) for p in candidates]
+        for fut in as_completed(futures):
+            trained.append(fut.result())
+            print(f"  trained {len(trained)}/{len(candidates)}", flush=True)
+
+    # Latency is measured serially, after training, so candidates don't
+    # compete for cores while being timed.
+    X_test, _, _ = stores["test"].load()
+    results = []
+    for t in trained:
+        serving = measure_serving(t.pop("model"), X_test)
+        results.append({**{k: t["params"][k] for k in keys}, "accuracy": t["accuracy"],
+                        "train_s": t["train_s"], **serving})
+    results.sort(key=lambda r: r["single_row_ms"])
+    return pareto_front(results)
+
+
+def _int_list(text: str) -> list:
+    return [None if v.lower() == "none" else int(v) for v in text.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latency-vs-accuracy sweep for the forests.")
+    parser.add_argument("--tier", type=int, choices=(1, 2), default=1)
+    parser.add_argument("--trees", type=_int_list, default=[25, 50, 100, 150, 200])
+    parser.add_argument("--depths", type=_int_list, default=[6, 8, 10, 12])
+    parser.add_argument("--leaves", type=_int_list, default=None,
+                        help="min_samples_leaf values (default: the tier's current value)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", help="write all results as JSON")
+    args = parser.parse_args(argv)
+
+    grid = {"n_estimators": args.trees, "max_depth": args.depths}
+    if args.leaves:
+        grid["min_samples_leaf"] = args.leaves
+
+    print(f"Sweeping Tier {args.tier}: "
+          f"{np.prod([len(v) for v in grid.values()])} configurations")
+    results = sweep(args.tier, grid, args.workers)
+
+    cols = list(grid) + ["accuracy", "single_row_ms", "batch_rows_s", "flat_mb", "train_s", "pareto"]
+    table = pd.DataFrame(results)[cols]
+    print(table.to_string(index=False, float_format=lambda v: f"{v:,.4f}"))
+    print("\nPareto frontier (fastest first):")
+    print(table[table["pareto"]].drop(columns="pareto").to_string(
+        index=False, float_format=lambda v: f"{v:,.4f}"))
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"tier": args.tier, "grid": grid, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
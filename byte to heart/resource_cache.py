@@ -0,0 +1,87 @@
+"""
+resource_cache.py — Cardio-Lens Pluggable Resource Cache
+Lets backend.py memoise expensive resources (trained models) without
+importing Streamlit. The app installs StreamlitCache; CLIs, workers and the
+scoring service use the default in-process MemoryCache, with model_store
+providing the on-disk layer underneath both.
+"""
+
+import functools
+import threading
+
+
+class ResourceCache:
+    """Interface: turn a zero-or-more-argument loader into a cached one."""
+
+    def wrap(self, fn, spinner: str = None):
+        raise NotImplementedError
+
+
+class MemoryCache(ResourceCache):
+    """Process-wide memoisation keyed by call arguments; thread-safe."""
+
+    def wrap(self, fn, spinner: str = None):
+        lock = threading.Lock()
+        results = {}
+
+        @functools.wraps(fn)
+        def cached(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            if key not in results:
+                with lock:
+                    if key not in results:
+                        results[key] = fn(*args, **kwargs)
+            return results[key]
+
+        cached.clear = results.clear
+        return cached
+
+
+class StreamlitCache(ResourceCache):
+    """Delegates to st.cache_resource; Streamlit is only imported here."""
+
+    def wrap(self, fn, spinner: str = None):
+        import streamlit as st
+        return st.cache_resource(show_spinner=spinner or False)(fn)
+
+
+_backend: ResourceCache = MemoryCache()
+
+
+def set_cache_backend(backend: ResourceCache):
+    """Select the cache used by every @cached_resource function from now on."""
+    global _backend
+    _backend = backend
+
+
+def cache_backend() -> ResourceCache:
+    """The cache backend currently installed."""
+    return _backend
+
+
+def cached_resource(spinner: str = None):
+    """
+    Decorator for resource loaders. Binding to the active cache backend is
+    deferred to the first call, so importing the decorated module stays cheap.
+    """
+    def decorator(fn):
+        # Keyed by the backend object itself, which the dict keeps alive: an
+        # id() could be reused by a later backend and pick up a stale wrapper.
+        bound = {}
+
+        @functools.wraps(fn)
+        def proxy(*args, **kwargs):
+            backend = _backend
+            wrapped = bound.get(backend)
+            if wrapped is None:
+                wrapped = bound[backend] = backend.wrap(fn, spinner)
+            return wrapped(*args, **kwargs)
+
+        def clear():
+            for wrapped in bound.values():
+                wrapped.clear()
+
+        proxy.clear = clear
+        return proxy
+
+    return decorator
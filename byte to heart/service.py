@@ -0,0 +1,281 @@
+"""
+service.py — Cardio-Lens Local Scoring Service
+JSON-over-HTTP access to the Tier 1 / Tier 2 models without a browser session.
+
+Endpoints:
+    POST /tier1        Tier 1 biometrics             → {"risk": 0.42}
+    POST /tier2        Tier 2 clinical features      → {"probability": 0.87, "contributions": {...}, "importances": {...}}
+    POST /simulate_bp  Tier 1 biometrics + target_bp → {"curve": [{"Systolic BP": …, "Risk (%)": …}]}
+    GET  /metrics      per-endpoint latency histograms (JSON)
+    GET  /metrics/prometheus  the same in Prometheus text format
+
+Usage:
+    python service.py --port 8765 --window-ms 5
+"""
+
+import argparse
+import json
+import math
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from backend import (
+    TIER1_FEATURES, TIER1_INPUTS, TIER2_FEATURE_LABELS, TIER2_FEATURES,
+    bp_reduction_frame, bp_reduction_grid, positive_proba,
+    serving_model, tier1_row, tier2_importances, tier2_row,
+)
+from instrumentation import Registry
+
+# ─────────────────────────────────────────────
+# VALIDATION
+# ─────────────────────────────────────────────
+
+# Accepted (min, max) per Tier 1 input: the app's form ranges, widened a
+# little for height and weight. Checked before a request reaches a batch.
+TIER1_LIMITS = {
+    "age":         (18, 120),
+    "gender":      (1, 2),
+    "height":      (50, 250),
+    "weight":      (20, 300),
+    "ap_hi":       (90, 200),
+    "ap_lo":       (50, 140),
+    "cholesterol": (1, 3),
+    "gluc":        (1, 3),
+    "smoke":       (0, 1),
+    "alco":        (0, 1),
+    "active":      (0, 1),
+}
+
+# Longest BP simulation grid served (rows scored per request)
+MAX_BP_GRID = 111
+
+
+def _number(body: dict, field: str) -> float:
+    value = body[field]
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"field {field!r} must be a number")
+    if not math.isfinite(value):
+        raise ValueError(f"field {field!r} must be finite")
+    return float(value)
+
+
+def _whole(body: dict, field: str) -> int:
+    value = _number(body, field)
+    if value != int(value):
+        raise ValueError(f"field {field!r} must be a whole number")
+    return int(value)
+
+
+def tier1_inputs(body: dict) -> list:
+    """The Tier 1 inputs of a request body, in TIER1_INPUTS order; range-checked."""
+    values = []
+    for field in TIER1_INPUTS:
+        value = _number(body, field)
+        lo, hi = TIER1_LIMITS[field]
+        if not lo <= value <= hi:
+            raise ValueError(f"field {field!r} must be between {lo} and {hi}")
+        values.append(value)
+    return values
+
+
+def tier2_inputs(body: dict) -> dict:
+    """The Tier 2 features of a request body, each a finite number."""
+    return {f: _number(body, f) for f in TIER2_FEATURES}
+
+
+# ─────────────────────────────────────────────
+# MICRO-BATCHING
+# ─────────────────────────────────────────────
+
+class MicroBatcher:
+    """
+    Collects feature matrices submitted from many request threads and scores
+    everything that arrives within `window_ms` in one model evaluation.
+    """
+
+    def __init__(self, score_fn, window_ms: float = 5.0, max_rows: int = 4096):
+        self.score_fn = score_fn   # (n, f) matrix → per-row results, first axis n
+        self.window = window_ms / 1000.0
+        self.max_rows = max_rows
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, X: np.ndarray) -> np.ndarray:
+        """Block until the rows of X are scored; returns score_fn's rows for them."""
+        fut = Future()
+        self._queue.put((X, fut))
+        return fut.result()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            rows = len(batch[0][0])
+            deadline = time.perf_counter() + self.window
+            while rows < self.max_rows:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(item)
+                rows += len(item[0])
+            self._score(batch)
+
+    def _score(self, batch):
+        try:
+            probs = self.score_fn(np.vstack([X for X, _ in batch]))
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+            else:
+                # Score each request on its own so only the failing one errors
+                for item in batch:
+                    self._score([item])
+            return
+        start = 0
+        for X, fut in batch:
+            fut.set_result(probs[start:start + len(X)])
+            start += len(X)
+
+
+# ─────────────────────────────────────────────
+# HTTP
+# ─────────────────────────────────────────────
+
+class ScoringService:
+    """Holds the loaded models, their batchers and the endpoint histograms."""
+
+    def __init__(self, window_ms: float = 5.0):
+        model1, _ = serving_model(1)
+        flat2, _ = serving_model(2)
+        self.tier1 = MicroBatcher(
+            lambda X: positive_proba(model1, X, TIER1_FEATURES), window_ms)
+        # Tier 2 rows come back as [probability, contribution per feature]
+        self.tier2 = MicroBatcher(
+            lambda X: np.column_stack(flat2.explain(X)[::2]), window_ms)
+        self.labels = [TIER2_FEATURE_LABELS.get(f, f) for f in TIER2_FEATURES]
+        # Global ranking is the same for every patient: computed once here
+        self.importances = tier2_importances(flat2).to_dict()
+        self.routes = {
+            "/tier1":       self.score_tier1,
+            "/tier2":       self.score_tier2,
+            "/simulate_bp": self.simulate_bp,
+        }
+        # Endpoint latency is always recorded, independent of CARDIO_LENS_METRICS
+        self.latency = Registry()
+        for path in self.routes:
+            self.latency.histogram(path)
+
+    def score_tier1(self, body: dict) -> dict:
+        row = tier1_row(*tier1_inputs(body))
+        return {"risk": float(self.tier1.submit(row[np.newaxis, :])[0])}
+
+    def score_tier2(self, body: dict) -> dict:
+        row = tier2_row(tier2_inputs(body))
+        result = self.tier2.submit(row[np.newaxis, :])[0]
+        return {"probability":   float(result[0]),
+                "contributions": dict(zip(self.labels, result[1:].tolist())),
+                "importances":   self.importances}
+
+    def simulate_bp(self, body: dict) -> dict:
+        inputs = tier1_inputs(body)
+        target_bp = _whole(body, "target_bp")
+        # Integer mmHg on the grid, so "Systolic BP" matches the app's curve
+        ap_hi = inputs[TIER1_INPUTS.index("ap_hi")] = _whole(body, "ap_hi")
+        if not ap_hi - MAX_BP_GRID < target_bp <= ap_hi:
+            raise ValueError(f"field 'target_bp' must be at most ap_hi and "
+                             f"within {MAX_BP_GRID - 1} mmHg of it")
+        bp_range, X = bp_reduction_grid(*inputs, target_bp=target_bp)
+        probs = self.tier1.submit(X) if len(X) else []
+        return {"curve": bp_reduction_frame(bp_range, probs).to_dict(orient="records")}
+
+    def metrics(self) -> dict:
+        return self.latency.snapshot()
+
+
+def make_handler(service: ScoringService):
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, status: int, payload: dict):
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path == "/metrics":
+                self._reply(200, service.metrics())
+            elif self.path == "/metrics/prometheus":
+                data = service.latency.prometheus(
+                    "cardio_lens_request_duration_seconds", "endpoint").encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            else:
+                self._reply(404, {"error": f"unknown path {self.path}"})
+
+        def do_POST(self):
+            route = service.routes.get(self.path)
+            if route is None:
+                self._reply(404, {"error": f"unknown path {self.path}"})
+                return
+            t0 = time.perf_counter()
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                result = route(body)
+            except KeyError as e:
+                self._reply(400, {"error": f"missing field {e}"})
+                return
+            except (ValueError, TypeError, ArithmeticError) as e:
+                self._reply(400, {"error": str(e)})
+                return
+            except Exception as e:
+                self._reply(500, {"error": f"{type(e).__name__}: {e}"})
+                return
+            service.latency.observe(self.path, (time.perf_counter() - t0) * 1e3)
+            self._reply(200, result)
+
+        def log_message(self, format, *args):
+            pass  # keep the hot path quiet; latency is in /metrics
+
+    return Handler
+
+
+class ScoringServer(ThreadingHTTPServer):
+    # The default listen backlog of 5 resets connections in a burst of
+    # concurrent clients, exactly the load micro-batching is for
+    request_queue_size = 128
+
+
+def serve(host: str = "127.0.0.1", port: int = 8765, window_ms: float = 5.0):
+    service = ScoringService(window_ms)
+    server = ScoringServer((host, port), make_handler(service))
+    print(f"Cardio-Lens scoring service on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve Cardio-Lens models over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--window-ms", type=float, default=5.0,
+                        help="micro-batching window in milliseconds")
+    args = parser.parse_args()
+    serve(args.host, args.port, args.window_ms)
@@ -0,0 +1,161 @@
+"""
+Tests for DTPS.TranslationClient against a local stub of the translation
+endpoint, which answers {"translated_text": ...} like the real service.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# DTPS.py lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from DTPS import TranslationClient, TranslationError  # noqa: E402
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    Records every request body and answers from `script`: a list of
+    (status, headers, delay_s) replies used in order, after which every
+    request gets a 200 translation. Tracks the peak number of requests
+    being handled at once.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.script = []
+        self.delay = 0.0
+        self.requests = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}/v1/translations"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.requests.append(body)
+            status, headers, delay = (server.script.pop(0) if server.script
+                                      else (200, {}, server.delay))
+            server.in_flight += 1
+            server.peak_in_flight = max(server.peak_in_flight, server.in_flight)
+        try:
+            time.sleep(delay)
+            payload = ({"translated_text": f"[{body['target_lang']}] {body['text']}"}
+                       if status == 200 else {"error": "stub"})
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client timed out and hung up
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = StubServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(stub, **options):
+    options = {"api_key": "test-key", "backoff": 0.01, "timeout": 2.0, **options}
+    return TranslationClient(base_url=stub.url, **options)
+
+
+def test_batch_translates_every_text_into_every_language(stub):
+    texts = ["Age", "Gender", "Age"]
+    with make_client(stub) as client:
+        result = asyncio.run(client.atranslate_many(texts, ["es", "fr"]))
+
+    assert result == {
+        "es": ["[es] Age", "[es] Gender", "[es] Age"],
+        "fr": ["[fr] Age", "[fr] Gender", "[fr] Age"],
+    }
+    # Duplicate (text, language) pairs are requested once
+    assert len(stub.requests) == 4
+    assert {(r["text"], r["target_lang"]) for r in stub.requests} == {
+        ("Age", "es"), ("Gender", "es"), ("Age", "fr"), ("Gender", "fr")}
+
+
+def test_retries_a_503_then_succeeds(stub):
+    stub.script = [(503, {}, 0.0)]
+    with make_client(stub) as client:
+        assert client.translate("Hello", "es") == "[es] Hello"
+    assert len(stub.requests) == 2
+
+
+def test_client_error_fails_without_retrying(stub):
+    stub.script = [(400, {}, 0.0)]
+    with make_client(stub, retries=3) as client:
+        with pytest.raises(TranslationError):
+            client.translate("Hello", "es")
+    assert len(stub.requests) == 1
+
+
+def test_timeout_is_retried_then_reported(stub):
+    stub.script = [(200, {}, 1.0), (200, {}, 1.0)]
+    with make_client(stub, timeout=0.2, retries=1) as client:
+        started = time.perf_counter()
+        with pytest.raises(TranslationError, match="gave up after 2 attempts"):
+            client.translate("Hello", "es")
+        assert time.perf_counter() - started < 1.0
+    assert len(stub.requests) == 2
+
+
+def test_failed_string_comes_back_as_none_in_a_batch(stub):
+    stub.script = [(404, {}, 0.0)]
+    with make_client(stub, max_in_flight=1) as client:
+        result = asyncio.run(client.atranslate_many(["Age", "Gender"], ["es"]))
+    assert result == {"es": [None, "[es] Gender"]}
+
+
+def test_requests_in_flight_are_capped(stub):
+    stub.delay = 0.05
+    texts = [f"string {i}" for i in range(12)]
+    with make_client(stub, max_in_flight=3) as client:
+        result = asyncio.run(client.atranslate_many(texts, ["es"]))
+    assert result["es"] == [f"[es] {t}" for t in texts]
+    assert stub.peak_in_flight == 3
+
+
+def test_retry_after_is_clamped_to_max_backoff(stub):
+    stub.script = [(429, {"Retry-After": "3600"}, 0.0)]
+    with make_client(stub, max_backoff=0.05) as client:
+        started = time.perf_counter()
+        assert client.translate("Hello", "es") == "[es] Hello"
+        assert time.perf_counter() - started < 1.0
+    assert len(stub.requests) == 2
+
+
+def test_missing_api_key_is_rejected(stub, monkeypatch):
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    with pytest.raises(ValueError):
+        TranslationClient(base_url=stub.url)
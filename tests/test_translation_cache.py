@@ -0,0 +1,73 @@
+"""
+Tests for translation_cache.TranslationCache on a throwaway SQLite file.
+"""
+
+import itertools
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# translation_cache.py lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import translation_cache  # noqa: E402
+from translation_cache import TranslationCache  # noqa: E402
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "translations.sqlite")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Strictly increasing time.time() for the cache, so LRU order is exact."""
+    ticks = itertools.count(1_000_000)
+    monkeypatch.setattr(translation_cache, "time", SimpleNamespace(time=lambda: next(ticks)))
+
+
+def test_round_trip_with_misses(path):
+    cache = TranslationCache(path)
+    cache.put_many({"Age": "Edad", "Gender": "Género", "Height": None}, "es")
+
+    assert cache.get_many(["Age", "Gender", "Height", "Weight"], "es") == {
+        "Age": "Edad", "Gender": "Género"}
+    assert cache.get("Age", "fr") is None          # other language, same text
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 3
+    assert len(cache) == 2                          # None translations are not stored
+
+
+def test_memory_front_is_bounded(path):
+    cache = TranslationCache(path, memory_entries=3)
+    cache.put_many({f"text {i}": f"texto {i}" for i in range(10)}, "es")
+    assert cache.stats()["memory_entries"] == 3
+
+    # Entries that fell out of memory still come back from disk
+    assert cache.get("text 0", "es") == "texto 0"
+    assert cache.stats()["memory_entries"] == 3
+
+
+def test_trims_to_max_entries_every_evict_every_rows(path, clock):
+    cache = TranslationCache(path, max_entries=10, evict_every=5)
+    for i in range(24):
+        cache.put(f"text {i}", "es", f"texto {i}")
+    # Last trim at 20 rows; 4 written since, within evict_every of the cap
+    assert len(cache) == 14
+
+    cache.put("text 24", "es", "texto 24")
+    assert len(cache) == 10
+    fresh = TranslationCache(path)                  # empty memory front: disk only
+    kept = fresh.get_many([f"text {i}" for i in range(25)], "es")
+    assert sorted(kept) == sorted(f"text {i}" for i in range(15, 25))
+
+
+def test_instances_on_one_file_share_writes(path):
+    first, second = TranslationCache(path), TranslationCache(path)
+    first.put("Age", "es", "Edad")
+    assert second.get("Age", "es") == "Edad"
+
+    second.put_many({"Gender": "Género"}, "es")
+    assert first.get_many(["Age", "Gender"], "es") == {"Age": "Edad", "Gender": "Género"}
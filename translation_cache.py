@@ -0,0 +1,185 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# Shared by every process on the machine unless overridden.
+DEFAULT_PATH = os.environ.get(
+    "DTPS_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "cardio-lens", "translations.sqlite"),
+)
+
+# Disk recency is refreshed at most this often per entry, so warm lookups
+# served from memory never turn into writes.
+TOUCH_INTERVAL_S = 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    text_hash  TEXT    NOT NULL,
+    lang       TEXT    NOT NULL,
+    translated TEXT    NOT NULL,
+    last_used  REAL    NOT NULL,
+    PRIMARY KEY (text_hash, lang)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS translations_last_used ON translations (last_used);
+"""
+
+
+def text_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class TranslationCache:
+    """On-disk translation cache keyed by (text hash, target language).
+
+    SQLite in WAL mode makes the file safe to share between threads and
+    processes: readers never block each other and writers wait on a busy
+    timeout instead of failing. A bounded in-memory LRU sits in front, so
+    repeat lookups in a warm process do not touch the disk at all.
+
+    Args:
+        path: SQLite file (defaults to DTPS_CACHE_PATH or ~/.cache/cardio-lens/).
+        max_entries: Disk size cap; the least recently used rows are evicted beyond it.
+        memory_entries: Size of the in-process front cache.
+        evict_every: Rows this process writes between trims to max_entries, so
+            a put does not count the table every time; the file may exceed
+            the cap by this many rows per writing process until the next trim.
+    """
+
+    def __init__(self, path=None, max_entries=50_000, memory_entries=4096,
+                 evict_every=256):
+        self.path = path or DEFAULT_PATH
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.evict_every = evict_every
+        self._unevicted = 0               # rows written since the last trim
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()     # (hash, lang) -> (translated, last disk touch)
+        self._lock = threading.Lock()
+        self._local = threading.local()  # sqlite connections are per thread
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # ── memory front ──────────────────────────
+
+    def _remember(self, key, translated, touched):
+        with self._lock:
+            self._memory[key] = (translated, touched)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _recall(self, key):
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+            return entry
+
+    # ── public API ────────────────────────────
+
+    def get_many(self, texts, lang):
+        """Return {text: translation} for the texts that are cached in `lang`."""
+        now = time.time()
+        found, stale, missing = {}, [], {}
+        for text in dict.fromkeys(texts):
+            key = (text_hash(text), lang)
+            entry = self._recall(key)
+            if entry is None:
+                missing[key[0]] = text
+                continue
+            found[text] = entry[0]
+            if now - entry[1] > TOUCH_INTERVAL_S:
+                stale.append(key[0])
+                self._remember(key, entry[0], now)
+
+        conn = self._connect()
+        if missing:
+            hashes = list(missing)
+            for start in range(0, len(hashes), 500):    # SQLite variable limit
+                chunk = hashes[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT text_hash, translated FROM translations "
+                    f"WHERE lang = ? AND text_hash IN ({marks})", [lang, *chunk])
+                for h, translated in rows:
+                    found[missing[h]] = translated
+                    stale.append(h)
+                    self._remember((h, lang), translated, now)
+        if stale:
+            conn.executemany(
+                "UPDATE translations SET last_used = ? WHERE text_hash = ? AND lang = ?",
+                [(now, h, lang) for h in stale])
+
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(set(texts)) - len(found)
+        return found
+
+    def get(self, text, lang):
+        """The cached translation of `text` into `lang`, or None."""
+        return self.get_many([text], lang).get(text)
+
+    def put_many(self, translations, lang):
+        """Store {text: translation} for `lang`; trims to the cap every evict_every rows."""
+        now = time.time()
+        rows = [(text_hash(t), lang, tr, now) for t, tr in translations.items()
+                if tr is not None]
+        if not rows:
+            return
+        self._connect().executemany(
+            "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?)", rows)
+        for h, _, tr, _ in rows:
+            self._remember((h, lang), tr, now)
+        with self._lock:
+            self._unevicted += len(rows)
+            due = self._unevicted >= self.evict_every
+            if due:
+                self._unevicted = 0
+        if due:
+            self.evict()
+
+    def put(self, text, lang, translated):
+        self.put_many({text: translated}, lang)
+
+    def evict(self):
+        """Trim the disk cache to max_entries, dropping the least recently used."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")     # one evicting process at a time
+        try:
+            (count,) = conn.execute("SELECT COUNT(*) FROM translations").fetchone()
+            excess = count - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM translations WHERE (text_hash, lang) IN ("
+                    "SELECT text_hash, lang FROM translations "
+                    "ORDER BY last_used LIMIT ?)", (excess,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return max(0, excess)
+
+    def __len__(self):
+        (count,) = self._connect().execute("SELECT COUNT(*) FROM translations").fetchone()
+        return count
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "memory_entries": len(self._memory)}